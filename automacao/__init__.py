@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Automação eLaw - Cadastro / Atualização com planilha
+VERSÃO: V3.4.0 (pacote importável + CLI; sem efeitos colaterais no import)
+
+• Datas normalizadas antes de digitar (evita 5040/5041, 16/10/2025 aleatório, etc.)
+• Modo humano para datas (digitação lenta + ENTER real)
+• Modais PrimeFaces com IFRAME (Juiz e Parte Contrária) – esperas via MutationObserver
+• Retry por classe de erro + circuit breaker; reinício/reciclagem do navegador
+• STATUS com dtype object (sem FutureWarning)
+• Abre Excel automaticamente se houver linhas com erro (amarelas)
+
+Uso: python -m automacao --excel "PLANILHA CADASTRO NOVA AÇÃO.xlsx"
+     python -m automacao --lote PASTA [--observar]   (várias planilhas, uma sessão)
+     python -m automacao --dry-run                   (só valida, sem navegador)
+
+Importar o pacote não lê a planilha nem abre o Chrome; selenium/openpyxl só são
+carregados quando necessários (automacao.fluxo / automacao.planilha).
+"""
+
+from .config import VERSAO
+
+
+def main(argv=None):
+    from .cli import main as _main
+    return _main(argv)
+
+
+__all__ = ["VERSAO", "main"]
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Artefatos de falha: screenshot, DOM e últimos comandos WebDriver da linha que falhou.
+
+A coleta no navegador é feita na hora (a página muda logo em seguida); compactar,
+gravar e podar a pasta fica numa thread, sem segurar o loop. Cada falha vira um
+.zip em config.ARTEFATOS_DIR; a pasta é limitada por idade e tamanho total
+(os mais antigos saem primeiro).
+"""
+
+import json
+import logging
+import os
+import queue
+import re
+import threading
+import time
+import traceback
+import zipfile
+
+from . import config, medicao, navegador
+
+log = logging.getLogger(__name__)
+
+_fila = queue.Queue()
+_worker = None
+_lock = threading.Lock()
+
+
+def _nome_seguro(txt):
+    return re.sub(r"[^\w.-]+", "_", str(txt))[:60]
+
+
+def capturar(planilha, idx, processo, erro):
+    """Coleta o estado atual do navegador para a linha e agenda a gravação. Devolve o nome do .zip."""
+    if not config.ARTEFATOS_DIR:
+        return None
+    comandos = [
+        {"ts": round(ts, 3), "comando": cmd, "helper": helper, "duracao_s": dur}
+        for ts, cmd, helper, dur in list(medicao.perfil.ultimos)  # antes dos comandos da própria captura
+    ]
+    info = {
+        "planilha": planilha.nome,
+        "linha": idx + 1,
+        "processo": processo,
+        "status": planilha.status(idx),
+        "erro": repr(erro),
+        "traceback": "".join(traceback.format_exception(type(erro), erro, erro.__traceback__)),
+        "quando": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    png = dom = None
+    d = navegador.driver
+    if d is not None and navegador.sessao_viva():
+        try:
+            info["url"] = d.current_url
+            png = d.get_screenshot_as_png()
+            dom = d.page_source
+        except Exception as e:
+            info["captura"] = f"navegador indisponível: {e}"
+    nome = f"{time.strftime('%Y%m%d_%H%M%S')}_{_nome_seguro(planilha.nome)}_L{idx + 1}_{_nome_seguro(processo)}.zip"
+    _iniciar_worker()
+    _fila.put((nome, info, comandos, png, dom))
+    return nome
+
+
+def _iniciar_worker():
+    global _worker
+    with _lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_gravar_continuamente, name="artefatos", daemon=True)
+            _worker.start()
+
+
+def _gravar_continuamente():
+    while True:
+        tarefa = _fila.get()
+        try:
+            _gravar(*tarefa)
+            podar(config.ARTEFATOS_DIR, config.ARTEFATOS_MAX_MB, config.ARTEFATOS_MAX_DIAS)
+        except Exception as e:
+            log.warning("⚠️ Falha ao gravar artefatos de erro: %s", e)
+        finally:
+            _fila.task_done()
+
+
+def _gravar(nome, info, comandos, png, dom):
+    os.makedirs(config.ARTEFATOS_DIR, exist_ok=True)
+    caminho = os.path.join(config.ARTEFATOS_DIR, nome)
+    with zipfile.ZipFile(caminho + ".tmp", "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("info.json", json.dumps(info, ensure_ascii=False, indent=1))
+        z.writestr("comandos.json", json.dumps(comandos, ensure_ascii=False, indent=1))
+        if png:
+            z.writestr("screenshot.png", png, compress_type=zipfile.ZIP_STORED)  # PNG já é comprimido
+        if dom:
+            z.writestr("dom.html", dom)
+    os.replace(caminho + ".tmp", caminho)
+    log.debug("📦 Artefatos de falha gravados: %s", caminho)
+
+
+def podar(pasta, max_mb, max_dias):
+    """Remove .zip mais velhos que max_dias e, se ainda passar de max_mb, os mais antigos."""
+    try:
+        entradas = [e for e in os.scandir(pasta) if e.is_file() and e.name.endswith(".zip")]
+    except OSError:
+        return
+    limite_idade = time.time() - max_dias * 86400
+    restantes = []
+    for e in entradas:
+        st = e.stat()
+        if st.st_mtime < limite_idade:
+            os.remove(e.path)
+        else:
+            restantes.append((st.st_mtime, st.st_size, e.path))
+    total = sum(tam for _, tam, _ in restantes)
+    for _, tam, caminho in sorted(restantes):
+        if total <= max_mb * 1024 * 1024:
+            break
+        os.remove(caminho)
+        total -= tam
+
+
+def aguardar_gravacoes():
+    """Espera a fila de gravação esvaziar (fim da execução)."""
+    if _worker is not None and _worker.is_alive():
+        _fila.join()
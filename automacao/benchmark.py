@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark da automação eLaw contra o mock local (automacao.mock_elaw).
+
+Gera uma planilha sintética (nº de linhas, reclamadas por linha, taxa de processos
+duplicados e formatos de data variados), roda `python -m automacao` apontando para o
+mock e grava um JSON com throughput, percentis de latência por etapa/linha,
+contagem de comandos WebDriver (total, por comando e por helper chamador) e pico
+de memória (Python e Chrome). As pilhas por linha vão num .folded ao lado do JSON
+(abrir em speedscope.app ou flamegraph.pl).
+
+Uso:
+    python -m automacao.benchmark --linhas 30 --reclamadas 3 --taxa-duplicados 0.1 --formatos-data misto
+    python -m automacao.benchmark --comparar bench_resultados/A.json bench_resultados/B.json
+
+Requer Chrome + chromedriver (AUTOMACAO_CHROMEDRIVER ou --chromedriver).
+psutil é opcional: sem ele o pico de memória do Chrome não é medido.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from . import mock_elaw
+
+try:
+    import psutil
+except ImportError:  # opcional
+    psutil = None
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # pasta que contém o pacote
+FORMATOS_DATA = ("datetime", "serial", "br", "iso", "digitos")
+LIMIAR_REGRESSAO = 0.10  # 10% mais lento = regressão
+
+
+# =====================
+# PLANILHA SINTÉTICA
+# =====================
+def _processo_cnj(rng):
+    return (
+        f"{rng.randint(0, 9999999):07d}-{rng.randint(0, 99):02d}."
+        f"{rng.randint(2015, 2025)}.5.{rng.randint(1, 24):02d}.{rng.randint(1, 9999):04d}"
+    )
+
+
+def _formatar_data(dt, formato):
+    if formato == "datetime":
+        return dt
+    if formato == "serial":
+        return float((dt - datetime(1899, 12, 30)).days)
+    if formato == "br":
+        return dt.strftime("%d/%m/%Y")
+    if formato == "iso":
+        return dt.strftime("%Y-%m-%d")
+    return dt.strftime("%d%m%Y")  # digitos
+
+
+def gerar_planilha(caminho, linhas, max_reclamadas=3, taxa_duplicados=0.0, formatos_data="misto",
+                   seed=42, pasta_pdfs=None):
+    """Grava a planilha sintética (e os PDFs ATOrd_<processo>.pdf) e devolve o DataFrame."""
+    rng = random.Random(seed)
+    cat = mock_elaw.CATALOGO
+    formatos = FORMATOS_DATA if formatos_data == "misto" else (formatos_data,)
+    registros = []
+    for _ in range(linhas):
+        if registros and rng.random() < taxa_duplicados:
+            registros.append(dict(rng.choice(registros)))
+            continue
+        distrib = datetime(2024, 1, 1) + timedelta(days=rng.randint(0, 600))
+        citacao = distrib + timedelta(days=rng.randint(5, 60))
+        reg = {
+            "Número do processo": _processo_cnj(rng),
+            "Localização do Processo": rng.choice(cat["comboRito"]),
+            "Estado": rng.choice(cat["comboEstadoVara"])[:2],
+            "Comarca": rng.choice(cat["comboComarcaVara"]),
+            "Foro/Tribunal": rng.choice(cat["comboForoTribunal"]),
+            "Vara": rng.choice(cat["comboVara"]),
+            "Classificação Interna": rng.choice(cat["processoClassificacaoCombo"]),
+            "Instância": rng.choice(cat["instancia"]),
+            "Fase": rng.choice(cat["processoFaseCombo"]),
+            "Juiz": f"Juiz(a) {rng.choice(['Silva', 'Souza', 'Oliveira', 'Santos'])} {rng.randint(1, 99)}",
+            "Empresa e Forma de participação": rng.choice(cat["comboClientProcessoParte"]),
+            "CPF DA PARTE CONTRARIA": f"{rng.randint(0, 99999999999):011d}",
+            "Empregadora": rng.choice(mock_elaw.EMPRESAS),
+            "Tipo Empregado": "Terceirizado",
+            "Advogado da Parte Contrária": f"Dr(a). {rng.choice(['Lima', 'Rocha', 'Alves'])} OAB {rng.randint(1000, 99999)}",
+            "Data de Distribuição": _formatar_data(distrib, rng.choice(formatos)),
+            "Data de Citação": _formatar_data(citacao, rng.choice(formatos)),
+            "Tipo de Ação": rng.choice(cat["comboProcessoTipo"]),
+            "Valor da Causa": f"{rng.randint(1000, 500000)},{rng.randint(0, 99):02d}",
+            "Advogado Responsável": rng.choice(mock_elaw.ADVOGADOS),
+            "Gestor Jurídico": rng.choice(mock_elaw.GESTORES),
+            "Tipo de Documento": "Petição Inicial",
+        }
+        for i, nome in enumerate(rng.sample(mock_elaw.EMPRESAS, rng.randint(0, max_reclamadas)), start=1):
+            reg[f"{i}ª Reclamada"] = nome
+        registros.append(reg)
+    df = pd.DataFrame(registros)
+    for i in range(1, 8):
+        col = f"{i}ª Reclamada"
+        if col not in df.columns:
+            df[col] = ""
+    df.to_excel(caminho, index=False)
+    if pasta_pdfs:
+        for processo in df["Número do processo"].unique():
+            with open(os.path.join(pasta_pdfs, f"ATOrd_{processo}.pdf"), "wb") as f:
+                f.write(b"%PDF-1.4\n% benchmark\n%%EOF\n")
+    return df
+
+
+# =====================
+# ESTATÍSTICAS
+# =====================
+def percentis(valores, ps=(50, 90, 99)):
+    if not valores:
+        return {f"p{p}": None for p in ps}
+    ordenados = sorted(valores)
+    out = {}
+    for p in ps:
+        k = max(0, min(len(ordenados) - 1, math.ceil(p / 100.0 * len(ordenados)) - 1))  # nearest-rank
+        out[f"p{p}"] = round(ordenados[k], 3)
+    return out
+
+
+def montar_relatorio(metricas, duracao_total, memoria, config):
+    linhas = metricas.get("linhas", [])
+    por_etapa = defaultdict(list)
+    falhas_etapa = defaultdict(int)
+    for e in metricas.get("etapas", []):
+        por_etapa[e["etapa"]].append(e["duracao_s"])
+        if not e["ok"]:
+            falhas_etapa[e["etapa"]] += 1
+    ok = sum(1 for l in linhas if str(l.get("status", "")).startswith("OK"))
+    total_comandos = sum(metricas.get("comandos", {}).values())
+    return {
+        "versao": metricas.get("versao"),
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "config": config,
+        "linhas": {"total": len(linhas), "ok": ok, "erro": len(linhas) - ok},
+        "duracao_total_s": round(duracao_total, 2),
+        "linhas_por_hora": round(len(linhas) / duracao_total * 3600, 1) if duracao_total else None,
+        "latencia_linha_s": percentis([l["duracao_s"] for l in linhas]),
+        "latencia_etapa_s": {
+            k: dict(percentis(v), n=len(v), falhas=falhas_etapa.get(k, 0))
+            for k, v in sorted(por_etapa.items())
+        },
+        "comandos_webdriver": {
+            "total": total_comandos,
+            "por_linha": round(total_comandos / len(linhas), 1) if linhas else None,
+            "por_comando": dict(sorted(metricas.get("comandos", {}).items(), key=lambda kv: -kv[1])),
+            "por_helper": dict(sorted(metricas.get("comandos_por_helper", {}).items(), key=lambda kv: -kv[1]["s"])),
+        },
+        "memoria_pico_mb": memoria,
+    }
+
+
+# =====================
+# EXECUÇÃO
+# =====================
+def _amostrar_memoria(proc, pico):
+    if psutil is None:
+        return
+    try:
+        p = psutil.Process(proc.pid)
+        py = p.memory_info().rss
+        chrome = 0
+        for filho in p.children(recursive=True):
+            try:
+                if "chrom" in filho.name().lower():
+                    chrome += filho.memory_info().rss
+            except psutil.Error:
+                pass
+        pico["python"] = max(pico["python"], py / 2**20)
+        pico["chrome"] = max(pico["chrome"], chrome / 2**20)
+    except psutil.Error:
+        pass
+
+
+def executar_benchmark(args):
+    servidor = mock_elaw.iniciar_servidor(
+        args.porta, args.latencia_ms, args.jitter_ms, args.taxa_erro_validacao
+    )
+    try:
+        with tempfile.TemporaryDirectory(prefix="bench_elaw_") as tmp:
+            planilha = os.path.join(tmp, "planilha_benchmark.xlsx")
+            metricas_path = os.path.join(tmp, "metricas.json")
+            perfil_path = os.path.join(tmp, "perfil.folded")
+            gerar_planilha(planilha, args.linhas, args.reclamadas, args.taxa_duplicados,
+                           args.formatos_data, args.seed, pasta_pdfs=tmp)
+            env = dict(os.environ)
+            env["PYTHONPATH"] = os.pathsep.join(filter(None, [RAIZ, env.get("PYTHONPATH")]))
+            env.update({
+                "ELAW_SITE_URL": f"http://127.0.0.1:{args.porta}/",
+                "AUTOMACAO_EXCEL": planilha,
+                "AUTOMACAO_METRICAS": metricas_path,
+                "AUTOMACAO_PERFIL": perfil_path,
+                "AUTOMACAO_HEADLESS": "0" if args.com_janela else "1",
+                "AUTOMACAO_ABRIR_EXCEL": "0",
+                # isolado das automações reais da máquina: governador próprio e sem endpoint na 8770
+                "AUTOMACAO_GOVERNADOR": os.path.join(tmp, "governador"),
+                "AUTOMACAO_PROGRESSO_PORTA": "0",
+            })
+            if args.chromedriver:
+                env["AUTOMACAO_CHROMEDRIVER"] = args.chromedriver
+            print(f"🏁 Benchmark: {args.linhas} linhas, latência {args.latencia_ms:.0f} ms...")
+            pico = {"python": 0.0, "chrome": 0.0}
+            t0 = time.time()
+            saida = open(os.path.join(tmp, "automacao.log"), "w", encoding="utf-8")
+            proc = subprocess.Popen([sys.executable, "-m", "automacao"], cwd=tmp, env=env,
+                                    stdin=subprocess.DEVNULL, stdout=saida, stderr=subprocess.STDOUT)
+            while proc.poll() is None:
+                _amostrar_memoria(proc, pico)
+                time.sleep(0.5)
+            duracao = time.time() - t0
+            saida.close()
+            if not os.path.exists(metricas_path):
+                with open(os.path.join(tmp, "automacao.log"), encoding="utf-8") as f:
+                    print(f.read()[-3000:])
+                raise SystemExit("❌ A automação não gerou métricas (veja o log acima).")
+            with open(metricas_path, encoding="utf-8") as f:
+                metricas = json.load(f)
+            folded = ""
+            if os.path.exists(perfil_path):
+                with open(perfil_path, encoding="utf-8") as f:
+                    folded = f.read()
+    finally:
+        servidor.shutdown()
+
+    memoria = {
+        "python": round(pico["python"], 1) if psutil else metricas.get("python_pico_mb"),
+        "chrome": round(pico["chrome"], 1) if psutil else None,
+    }
+    config = {k: getattr(args, k) for k in (
+        "linhas", "reclamadas", "taxa_duplicados", "formatos_data", "latencia_ms",
+        "jitter_ms", "taxa_erro_validacao", "seed",
+    )}
+    relatorio = montar_relatorio(metricas, duracao, memoria, config)
+    os.makedirs(args.saida, exist_ok=True)
+    nome = f"bench_{relatorio['versao']}_{datetime.now():%Y%m%d_%H%M%S}.json"
+    caminho = os.path.join(args.saida, nome)
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(relatorio, f, ensure_ascii=False, indent=2)
+    if folded:
+        with open(caminho[:-len(".json")] + ".folded", "w", encoding="utf-8") as f:
+            f.write(folded)
+    imprimir_resumo(relatorio)
+    print(f"💾 Resultado salvo em {caminho} (+ .folded para flame graph)")
+    return relatorio
+
+
+def imprimir_resumo(rel):
+    print("=" * 86)
+    print(f"Versão {rel['versao']} | linhas {rel['linhas']} | {rel['linhas_por_hora']} linhas/h")
+    print(f"Latência por linha (s): {rel['latencia_linha_s']}")
+    print(f"Comandos WebDriver: {rel['comandos_webdriver']['total']} "
+          f"({rel['comandos_webdriver']['por_linha']} por linha)")
+    print(f"Memória pico (MB): {rel['memoria_pico_mb']}")
+    print("Etapas mais lentas (p90):")
+    etapas = sorted(rel["latencia_etapa_s"].items(), key=lambda kv: -(kv[1]["p90"] or 0))
+    for nome, st in etapas[:10]:
+        print(f"  {st['p90']:>8.3f}s  {nome} (n={st['n']}, falhas={st['falhas']})")
+
+
+def comparar(caminho_a, caminho_b):
+    """Compara dois resultados (A = referência, B = candidato) e retorna True se houve regressão."""
+    with open(caminho_a, encoding="utf-8") as f:
+        a = json.load(f)
+    with open(caminho_b, encoding="utf-8") as f:
+        b = json.load(f)
+    regressao = False
+    print(f"A: {a['versao']} ({a['data']})  x  B: {b['versao']} ({b['data']})")
+    ta, tb = a.get("linhas_por_hora") or 0, b.get("linhas_por_hora") or 0
+    delta = (tb - ta) / ta if ta else 0.0
+    marca = "⚠️" if delta < -LIMIAR_REGRESSAO else "✅"
+    regressao |= delta < -LIMIAR_REGRESSAO
+    print(f"{marca} Throughput: {ta} -> {tb} linhas/h ({delta:+.1%})")
+    ca, cb = a["comandos_webdriver"]["por_linha"] or 0, b["comandos_webdriver"]["por_linha"] or 0
+    print(f"   Comandos WebDriver/linha: {ca} -> {cb}")
+    for etapa in sorted(set(a["latencia_etapa_s"]) | set(b["latencia_etapa_s"])):
+        pa = (a["latencia_etapa_s"].get(etapa) or {}).get("p50")
+        pb = (b["latencia_etapa_s"].get(etapa) or {}).get("p50")
+        if pa is None or pb is None:
+            print(f"   {etapa}: p50 {pa} -> {pb}")
+            continue
+        d = (pb - pa) / pa if pa else 0.0
+        pior = d > LIMIAR_REGRESSAO
+        regressao |= pior
+        print(f"{'⚠️' if pior else '  '} {etapa}: p50 {pa:.3f}s -> {pb:.3f}s ({d:+.1%})")
+    return regressao
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark da automação eLaw contra o mock local.")
+    ap.add_argument("--linhas", type=int, default=20)
+    ap.add_argument("--reclamadas", type=int, default=3, help="máx. de reclamadas adicionais por linha (0..7)")
+    ap.add_argument("--taxa-duplicados", type=float, default=0.0)
+    ap.add_argument("--formatos-data", default="misto", choices=("misto",) + FORMATOS_DATA)
+    ap.add_argument("--latencia-ms", type=float, default=150.0)
+    ap.add_argument("--jitter-ms", type=float, default=50.0)
+    ap.add_argument("--taxa-erro-validacao", type=float, default=0.0)
+    ap.add_argument("--porta", type=int, default=8765)
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--chromedriver", default="")
+    ap.add_argument("--com-janela", action="store_true", help="não usar Chrome headless")
+    ap.add_argument("--saida", default=os.path.join(RAIZ, "bench_resultados"))
+    ap.add_argument("--comparar", nargs=2, metavar=("A.json", "B.json"))
+    args = ap.parse_args(argv)
+    if args.comparar:
+        sys.exit(1 if comparar(*args.comparar) else 0)
+    executar_benchmark(args)
+
+
+if __name__ == "__main__":
+    main()
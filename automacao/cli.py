@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Linha de comando: `python -m automacao [--excel ...] [--chromedriver ...] [--site-url ...]`
+ou, em lote, `python -m automacao --lote PASTA [--observar]`.
+
+selenium só é importado quando o navegador vai de fato ser aberto (nunca no --dry-run).
+"""
+
+import argparse
+import logging
+
+from . import config, registro
+
+log = logging.getLogger(__name__)
+
+
+def criar_parser():
+    ap = argparse.ArgumentParser(
+        prog="automacao",
+        description=f"Automação eLaw {config.VERSAO} - cadastro/atualização de processos a partir da planilha.",
+    )
+    ap.add_argument("--excel", default=config.EXCEL_PATH, help="planilha de entrada (STATUS é gravado nela)")
+    ap.add_argument("--chromedriver", default=config.CHROMEDRIVER_PATH, help="caminho do chromedriver")
+    ap.add_argument("--site-url", default=config.SITE_URL, help="URL do eLaw (ou do mock_elaw local)")
+    ap.add_argument("--headless", action="store_true", default=config.HEADLESS, help="Chrome sem janela")
+    ap.add_argument("--nao-abrir-excel", action="store_true",
+                    help="não abrir a planilha automaticamente quando houver linhas com erro")
+    ap.add_argument("--lote", metavar="PASTA",
+                    help="processa todas as planilhas .xlsx da pasta numa única sessão (PDFs na mesma pasta)")
+    ap.add_argument("--observar", action="store_true",
+                    help="com --lote: continua rodando e pega planilhas novas que chegarem na pasta")
+    ap.add_argument("--intervalo", type=float, default=30.0,
+                    help="com --observar: segundos entre consultas à pasta (padrão 30)")
+    ap.add_argument("--log", default=config.LOG_PATH,
+                    help="arquivo de log em JSON lines (com rotação); vazio desliga o arquivo")
+    ap.add_argument("--quieto", action="store_true", default=config.LOG_QUIETO,
+                    help="console só com avisos e erros (o arquivo de log continua completo)")
+    ap.add_argument("--artefatos", default=config.ARTEFATOS_DIR,
+                    help="pasta dos .zip de falha (screenshot, DOM, últimos comandos); vazio desliga")
+    ap.add_argument("--governador", default=config.GOVERNADOR_DIR, metavar="PASTA",
+                    help="pasta comum às instâncias em paralelo (limite de op/s e de sessões ativas); vazio desliga")
+    ap.add_argument("--ops-por-s", type=float, default=config.GOV_OPS_POR_S,
+                    help="total de aberturas/salvamentos por segundo no eLaw, somando as instâncias")
+    ap.add_argument("--max-sessoes", type=int, default=config.GOV_MAX_SESSOES,
+                    help="máximo de instâncias processando ao mesmo tempo (reduzido se o eLaw ficar lento)")
+    ap.add_argument("--status-porta", type=int, default=config.PROGRESSO_PORTA,
+                    help="porta local do progresso em JSON (http://127.0.0.1:PORTA/status); 0 desliga")
+    ap.add_argument("--historico", default=config.HISTORICO_PATH,
+                    help="SQLite com o resultado de cada linha/etapa (python -m automacao.historico); vazio desliga")
+    ap.add_argument("--dry-run", action="store_true", default=config.DRY_RUN,
+                    help="só valida datas, valores, PDFs e catálogo; não abre o navegador")
+    ap.add_argument("--catalogo", default=config.CATALOGO_PATH,
+                    help="JSON {coluna: [opções]} usado pelo --dry-run para conferir dropdowns")
+    return ap
+
+
+def aplicar_argumentos(args):
+    config.EXCEL_PATH = args.excel
+    config.CHROMEDRIVER_PATH = args.chromedriver
+    config.SITE_URL = args.site_url
+    config.HEADLESS = args.headless
+    config.DRY_RUN = args.dry_run
+    config.CATALOGO_PATH = args.catalogo
+    config.LOG_PATH = args.log
+    config.LOG_QUIETO = args.quieto
+    config.ARTEFATOS_DIR = args.artefatos
+    if args.lote:
+        config.DESATENDIDO = True  # lote/observar roda sem ninguém no terminal
+    config.GOVERNADOR_DIR = args.governador
+    config.GOV_OPS_POR_S = args.ops_por_s
+    config.GOV_MAX_SESSOES = args.max_sessoes
+    config.PROGRESSO_PORTA = args.status_porta
+    config.HISTORICO_PATH = args.historico
+    if args.nao_abrir_excel:
+        config.ABRIR_EXCEL_COM_ERRO = False
+
+
+def main(argv=None):
+    parser = criar_parser()
+    args = parser.parse_args(argv)
+    if args.observar and not args.lote:
+        parser.error("--observar exige --lote PASTA")
+    aplicar_argumentos(args)
+    registro.configurar_log(config.LOG_PATH, config.LOG_QUIETO, config.LOG_MAX_MB, config.LOG_BACKUPS)
+    try:
+        return _executar(args)
+    finally:
+        registro.encerrar_log()
+
+
+def _executar(args):
+    lote = None
+    if args.lote:
+        from .lote import PastaLote
+        lote = PastaLote(args.lote, observar=args.observar and not config.DRY_RUN, intervalo=args.intervalo)
+        planilhas = lote.novas_planilhas()
+        if not planilhas and not lote.observar:
+            log.info("ℹ️ Nenhuma planilha .xlsx em %s.", lote.pasta)
+            return 0
+    else:
+        from .planilha import Planilha
+        planilhas = [Planilha(config.EXCEL_PATH)]
+
+    if config.DRY_RUN:
+        from .validacao import executar_dry_run
+        executar_dry_run(planilhas, abrir_se_erro=False if lote else None)
+        return 0
+
+    from .fluxo import executar
+    executar(planilhas, lote)
+    return 0
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Configurações da automação eLaw.
+
+Os valores abaixo são os padrões; variáveis de ambiente (AUTOMACAO_*, ELAW_SITE_URL)
+e as opções da CLI (automacao.cli) sobrescrevem em tempo de execução. Por isso os
+demais módulos leem `config.X` na hora do uso em vez de importar o valor.
+"""
+
+import os
+import tempfile
+
+VERSAO = "V3.4.0"
+
+# =====================
+# CONFIGURAÇÕES
+# =====================
+EXCEL_PATH = os.environ.get("AUTOMACAO_EXCEL", "PLANILHA CADASTRO NOVA AÇÃO.xlsx")
+CHROMEDRIVER_PATH = os.environ.get("AUTOMACAO_CHROMEDRIVER", "C:/chromedriver/chromedriver.exe")  # ajuste conforme ambiente
+SITE_URL = os.environ.get("ELAW_SITE_URL", "https://vtal.elaw.com.br/")  # ex.: automacao.mock_elaw local
+YELLOW_HEX = "FFF200"
+WAIT_SHORT = 8
+WAIT_MEDIUM = 20
+WAIT_LONG = 40
+HEADLESS = os.environ.get("AUTOMACAO_HEADLESS") == "1"
+ABRIR_EXCEL_COM_ERRO = os.environ.get("AUTOMACAO_ABRIR_EXCEL", "1") == "1"
+METRICAS_PATH = os.environ.get("AUTOMACAO_METRICAS", "")  # JSON de métricas (usado pelo benchmark)
+PERFIL_PATH = os.environ.get("AUTOMACAO_PERFIL", "")      # .folded (flame graph) + resumo por linha
+DRY_RUN = os.environ.get("AUTOMACAO_DRY_RUN") == "1"     # só valida a planilha, sem navegador
+CATALOGO_PATH = os.environ.get("AUTOMACAO_CATALOGO", "")  # JSON {coluna: [opções]} p/ o dry-run
+LOG_PATH = os.environ.get("AUTOMACAO_LOG", "automacao.log.jsonl")  # JSON lines (rotação por tamanho)
+LOG_QUIETO = os.environ.get("AUTOMACAO_LOG_QUIETO") == "1"           # console só com avisos/erros
+LOG_MAX_MB = 10
+LOG_BACKUPS = 5
+ARTEFATOS_DIR = os.environ.get("AUTOMACAO_ARTEFATOS", "artefatos_falhas")  # .zip por linha com erro ("" desliga)
+ARTEFATOS_MAX_MB = 200
+ARTEFATOS_MAX_DIAS = 7
+
+RECICLAR_A_CADA = 150          # linhas; reinicia o Chrome preventivamente (memória cresce em runs longos)
+MAX_REINICIOS_POR_LINHA = 2    # quantas vezes a mesma linha pode derrubar/reiniciar o navegador
+MAX_REENFILEIRAMENTOS = 2      # falhas transitórias: quantas vezes a linha volta para o fim da fila
+MAX_TENTATIVAS_INICIAR_DRIVER = 3  # reinício do Chrome: tentativas com backoff exponencial
+ESPERA_INICIAR_DRIVER_S = 5
+DESATENDIDO = os.environ.get("AUTOMACAO_DESATENDIDO") == "1"  # nunca pede login manual (lote liga sozinho)
+VERIFICAR_SALVAMENTO = os.environ.get("AUTOMACAO_VERIFICAR", "1") == "1"  # conferir campos após salvar
+
+# governador entre instâncias paralelas (pasta comum; "" desliga)
+GOVERNADOR_DIR = os.environ.get("AUTOMACAO_GOVERNADOR", os.path.join(tempfile.gettempdir(), "automacao_elaw_governador"))
+GOV_OPS_POR_S = float(os.environ.get("AUTOMACAO_OPS_POR_S", "1.0"))  # abrir processo + salvar, somando instâncias
+GOV_RAJADA = 3
+GOV_MAX_SESSOES = int(os.environ.get("AUTOMACAO_MAX_SESSOES", "4"))
+GOV_LATENCIA_ALVO_MS = 1500     # resposta do servidor acima disso = reduzir sessões ativas
+GOV_AJUSTE_S = 30               # intervalo mínimo entre ajustes do número de sessões
+PROGRESSO_PORTA = int(os.environ.get("AUTOMACAO_PROGRESSO_PORTA", "8770"))  # GET /status (JSON); 0 desliga
+HISTORICO_PATH = os.environ.get("AUTOMACAO_HISTORICO", "historico_execucoes.sqlite3")  # SQLite por linha/etapa ("" desliga)
+
+# Colunas (nomes conforme sua planilha)
+COL_NUM_PROCESSO         = "Número do processo"
+COL_RITO                 = "Localização do Processo"
+COL_ESTADO               = "Estado"
+COL_COMARCA              = "Comarca"
+COL_FORO                 = "Foro/Tribunal"
+COL_VARA                 = "Vara"
+COL_CLASSIFICACAO        = "Classificação Interna"
+COL_INSTANCIA            = "Instância"
+COL_FASE                 = "Fase"
+COL_JUIZ                 = "Juiz"
+COL_CLIENTE_EMPRESA      = "Empresa e Forma de participação"
+COL_CPF_PARTE_CONTR      = "CPF DA PARTE CONTRARIA"
+COL_EMPREGADORA          = "Empregadora"
+COL_TIPO_EMPREGADO       = "Tipo Empregado"
+COL_ADV_CONTR            = "Advogado da Parte Contrária"
+COL_DATA_DISTR           = "Data de Distribuição"
+COL_DATA_CITACAO         = "Data de Citação"
+COL_TIPO_ACAO            = "Tipo de Ação"
+COL_VALOR_CAUSA          = "Valor da Causa"
+COL_ADV_RESP             = "Advogado Responsável"
+COL_GESTOR_JURIDICO      = "Gestor Jurídico"
+COL_TIPO_DOC             = "Tipo de Documento"
+
+COLUNAS_RECLAMADAS = [
+    "1ª Reclamada", "2ª Reclamada", "3ª Reclamada",
+    "4ª Reclamada", "5ª Reclamada", "6ª Reclamada", "7ª Reclamada"
+]
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Normalização dos valores da planilha (datas, valores, textos).
+
+Sem dependência de selenium/openpyxl: pode ser importado e medido isoladamente.
+"""
+
+import math
+import re
+import unicodedata
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+# =====================
+# NORMALIZAÇÃO DE DATAS (robusta)
+# =====================
+EXCEL_EPOCH = datetime(1899, 12, 30)  # Regra do Excel (considerando bug do 29/02/1900)
+
+def as_ddmmyyyy(raw):
+    """
+    Converte qualquer 'raw' (string, número serial do Excel, datetime, etc.) em 'DD/MM/YYYY'.
+    Retorna "" se não for possível.
+    """
+    if raw is None:
+        return ""
+    # Se vier do pandas como NaT/NaN
+    try:
+        if pd.isna(raw):
+            return ""
+    except Exception:
+        pass
+
+    # Caso já seja datetime
+    if isinstance(raw, (datetime, pd.Timestamp)):
+        return raw.strftime("%d/%m/%Y")
+
+    # Caso seja número -> tentar como serial do Excel
+    if isinstance(raw, (int, float)) and not isinstance(raw, bool):
+        if math.isfinite(raw):
+            # número pequeno provavelmente não é serial válido; ainda assim tentamos coerção segura
+            try:
+                dt = EXCEL_EPOCH + timedelta(days=float(raw))
+                # sanity check: ano entre 1900 e 2100
+                if 1900 <= dt.year <= 2100:
+                    return dt.strftime("%d/%m/%Y")
+            except Exception:
+                pass
+
+    # Trata como string
+    s = str(raw).strip()
+    if not s:
+        return ""
+
+    # Tenta parsing com dayfirst e com monthfirst
+    for dayfirst in (True, False):
+        try:
+            dt = pd.to_datetime(s, dayfirst=dayfirst, errors="raise")
+            # sanity check:
+            if 1900 <= dt.year <= 2100:
+                return dt.strftime("%d/%m/%Y")
+        except Exception:
+            pass
+
+    # Tenta formatos explícitos
+    for fmt in ("%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d", "%m/%d/%Y"):
+        try:
+            dt = datetime.strptime(s, fmt)
+            if 1900 <= dt.year <= 2100:
+                return dt.strftime("%d/%m/%Y")
+        except Exception:
+            continue
+
+    # Última tentativa: apenas números tipo DDMMYYYY ou YYYYMMDD
+    digits = re.sub(r"\D", "", s)
+    if len(digits) == 8:
+        # Tentativa DDMMYYYY
+        try:
+            dt = datetime.strptime(digits, "%d%m%Y")
+            return dt.strftime("%d/%m/%Y")
+        except Exception:
+            pass
+        # Tentativa YYYYMMDD
+        try:
+            dt = datetime.strptime(digits, "%Y%m%d")
+            return dt.strftime("%d/%m/%Y")
+        except Exception:
+            pass
+
+    return ""
+
+# =====================
+# HELPERS
+# =====================
+def safe_text(val):
+    try:
+        if pd.isna(val):
+            return ""
+    except Exception:
+        pass
+    return str(val).strip()
+
+def normalizar_texto(txt):
+    """Minúsculas e sem acento: mesmo critério do filtro do selectOneMenu."""
+    txt = unicodedata.normalize("NFD", str(txt))
+    return "".join(c for c in txt if not unicodedata.combining(c)).lower().strip()
+
+def to_amount_str(val):
+    if val is None or (isinstance(val, float) and math.isnan(val)) or (isinstance(val, str) and not val.strip()):
+        return ""
+    try:
+        # normaliza "1.234,56" -> "1234.56"
+        return str(float(str(val).replace(".", "").replace(",", ".")))
+    except Exception:
+        return str(val).replace(",", ".")
+
+# =====================
+# ESTADO (sigla -> "SP -", prefixo das opções do dropdown)
+# =====================
+_SIGLA_ESTADO_RE = re.compile(r"^[A-Z]{2}$")
+
+def ajusta_valor_para_estado(label_id: str, valor: str) -> str:
+    if not valor:
+        return valor
+    id_lower = label_id.lower()
+    pode_ser_estado = ("comboestadovara" in id_lower) or ("estado" in id_lower)
+    if pode_ser_estado and _SIGLA_ESTADO_RE.match(valor.strip().upper()):
+        return valor.strip().upper() + " -"
+    return valor
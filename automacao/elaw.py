@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+Helpers de página do eLaw (PrimeFaces): cliques, inputs, datas em modo humano,
+autocompletes e selectOneMenu.
+"""
+
+import logging
+import os
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from . import navegador, seletores
+from .config import WAIT_LONG, WAIT_MEDIUM, WAIT_SHORT
+from .dados import ajusta_valor_para_estado
+from .retry import tentar_etapa
+
+log = logging.getLogger(__name__)
+
+def tentar_selecionar_primeiro_item_autocomplete(painel_id: str):
+    """Tenta clicar diretamente no primeiro item do autocomplete informado.
+
+    Retorna o label do item selecionado quando bem-sucedido, caso contrário False.
+    """
+    if not painel_id:
+        return False
+
+    try:
+        painel_wait = WebDriverWait(navegador.driver, WAIT_SHORT)
+        painel_wait.until(EC.visibility_of_element_located((By.ID, painel_id)))
+        xpath_primeiro_item = (
+            f"//*[@id={_xpath_literal(painel_id)}]//li[contains(@class,'ui-autocomplete-item')]"
+        )
+        primeiro_item = painel_wait.until(
+            EC.element_to_be_clickable((By.XPATH, xpath_primeiro_item))
+        )
+        navegador.driver.execute_script("arguments[0].scrollIntoView({block:'nearest'});", primeiro_item)
+        label = (primeiro_item.get_attribute("data-item-label") or primeiro_item.text or "").strip()
+        try:
+            primeiro_item.click()
+        except Exception:
+            navegador.driver.execute_script("arguments[0].click();", primeiro_item)
+
+        try:
+            painel_wait.until(EC.invisibility_of_element_located((By.ID, painel_id)))
+        except Exception:
+            pass
+
+        time.sleep(0.2)
+        return label or True
+    except Exception as e:
+        log.debug("ℹ️ Não foi possível clicar no primeiro item do autocomplete %s: %s", painel_id, e)
+        return False
+
+
+def _xpath_literal(texto: str) -> str:
+    """Escapa corretamente strings para uso em XPaths (lida com aspas simples/duplas)."""
+    if "'" not in texto:
+        return f"'{texto}'"
+    if '"' not in texto:
+        return f'"{texto}"'
+    partes = texto.split("'")
+    pedacos = []
+    for idx, parte in enumerate(partes):
+        if parte:
+            pedacos.append(f"'{parte}'")
+        if idx != len(partes) - 1:
+            pedacos.append("\"'\"")
+    return "concat(" + ",".join(pedacos) + ")"
+
+def clicar_id(elem_id):
+    """Clica no elemento pelo id ou pelo nome lógico do registro de seletores."""
+    log.debug("➡️ Clicar ID: %s", elem_id)
+    elem = seletores.esperar(elem_id, EC.element_to_be_clickable)
+    navegador.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", elem)
+    try:
+        elem.click()
+    except Exception:
+        navegador.driver.execute_script("arguments[0].click();", elem)
+    time.sleep(0.5)
+
+def preencher_input(input_id, valor, clear_first=True, press_enter=False):
+    """
+    Preenchimento padrão (não datas): limpa com CTRL+A+Backspace e cola EXATO.
+    """
+    if valor == "" and valor != 0:
+        return
+    elem = seletores.esperar(input_id)
+    navegador.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", elem)
+    elem.click()
+    time.sleep(0.2)
+    elem.send_keys(Keys.CONTROL, "a")
+    elem.send_keys(Keys.BACKSPACE)
+    time.sleep(0.2)
+    elem.send_keys(str(valor))
+    if press_enter:
+        time.sleep(0.2)
+        elem.send_keys(Keys.ENTER)
+    time.sleep(0.4)
+
+# ✅ MODO HUMANO PARA DATAS — digita devagar e confirma com ENTER de teclado
+def digitar_data_humano(input_id, data_valor):
+    try:
+        if not data_valor:
+            return True
+        campo = seletores.esperar(input_id, EC.element_to_be_clickable)
+        navegador.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", campo)
+        campo.click()
+        time.sleep(0.25)
+        campo.send_keys(Keys.CONTROL, "a")
+        campo.send_keys(Keys.BACKSPACE)
+        time.sleep(0.15)
+        for ch in data_valor:
+            campo.send_keys(ch)
+            time.sleep(0.06)  # ritmo humano
+        time.sleep(0.1)
+        campo.send_keys(Keys.ENTER)  # confirmar
+        log.debug("✅ Data '%s' digitada (modo humano) em %s", data_valor, input_id)
+        time.sleep(0.35)
+        return True
+    except Exception as e:
+        log.warning("❌ Erro ao digitar data manual em %s: %s", input_id, e)
+        return False
+
+def existe_xpath(xpath):
+    try:
+        navegador.driver.find_element(By.XPATH, xpath)
+        return True
+    except:
+        return False
+
+def anexar_arquivo_por_input(file_path):
+    upload_input = navegador.wait.until(EC.presence_of_element_located((By.XPATH, "//input[@type='file']")))
+    upload_input.send_keys(os.path.abspath(file_path))
+    time.sleep(0.8)
+
+def esperar_texto_em_tabela_outras_partes(texto: str, timeout=WAIT_MEDIUM) -> bool:
+    if not texto:
+        return False
+    literal = _xpath_literal(texto.strip())
+    xpath = (
+        "//table[contains(@id,'outrasParte') and contains(@class,'ui-datatable')]"
+        f"//span[contains(normalize-space(.), {literal})]"
+    )
+    try:
+        WebDriverWait(navegador.driver, timeout).until(
+            EC.presence_of_element_located((By.XPATH, xpath))
+        )
+        return True
+    except Exception as e:
+        log.warning("⚠️ Não encontrei '%s' na lista de Outras Partes: %s", texto, e)
+        return False
+
+
+def preencher_autocomplete_por_rotulo(
+    rotulo: str,
+    valor: str,
+    tempo_dropdown: float = 0.9,
+) -> bool:
+    if not valor:
+        return True
+    literal = _xpath_literal(rotulo)
+    input_xpath = (
+        f"//label[contains(normalize-space(.), {literal})]"
+        "//following::input[contains(@id,'autocomplete')][1]"
+    )
+
+    def _preencher():
+        campo = navegador.wait.until(EC.presence_of_element_located((By.XPATH, input_xpath)))
+        navegador.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", campo)
+        campo.clear()
+        time.sleep(0.15)
+        campo.send_keys(valor)
+        time.sleep(tempo_dropdown)
+        campo_id = campo.get_attribute("id") or ""
+        painel_id = ""
+        if campo_id.endswith("_input"):
+            painel_id = f"{campo_id[:-len('_input')]}_panel"
+        if painel_id:
+            selecionado = tentar_selecionar_primeiro_item_autocomplete(painel_id)
+            if selecionado:
+                esperado = str(selecionado).strip()
+                if esperado:
+                    try:
+                        WebDriverWait(navegador.driver, WAIT_SHORT).until(
+                            lambda d: esperado.lower()
+                            in (campo.get_attribute("value") or "").lower()
+                        )
+                    except Exception:
+                        pass
+                try:
+                    campo.send_keys(Keys.ENTER)
+                except Exception:
+                    pass
+                time.sleep(0.4)
+                return
+        campo.send_keys(Keys.DOWN)
+        time.sleep(0.25)
+        try:
+            campo.send_keys(Keys.ENTER)
+        except Exception:
+            pass
+        time.sleep(0.4)
+
+    if tentar_etapa(
+        f"Preencher '{rotulo}' com {valor}",
+        _preencher,
+        chave=f"Preencher autocomplete '{rotulo}'",
+    ):
+        return True
+    return False
+
+
+def preencher_autocomplete_por_id(
+    input_id: str,
+    valor: str,
+    tempo_dropdown: float = 0.9,
+) -> bool:
+    if not valor:
+        return True
+
+    def _preencher():
+        campo = seletores.esperar(input_id)
+        navegador.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", campo)
+        campo.clear()
+        time.sleep(0.15)
+        campo.send_keys(valor)
+        time.sleep(tempo_dropdown)
+        campo_id = campo.get_attribute("id") or ""  # id resolvido (o painel segue o mesmo prefixo)
+        painel_id = ""
+        if campo_id.endswith("_input"):
+            painel_id = f"{campo_id[:-len('_input')]}_panel"
+        if painel_id:
+            selecionado = tentar_selecionar_primeiro_item_autocomplete(painel_id)
+            if selecionado:
+                esperado = str(selecionado).strip()
+                if esperado:
+                    try:
+                        WebDriverWait(navegador.driver, WAIT_SHORT).until(
+                            lambda d: esperado.lower()
+                            in (campo.get_attribute("value") or "").lower()
+                        )
+                    except Exception:
+                        pass
+                try:
+                    campo.send_keys(Keys.ENTER)
+                except Exception:
+                    pass
+                time.sleep(0.4)
+                return
+        campo.send_keys(Keys.DOWN)
+        time.sleep(0.25)
+        try:
+            campo.send_keys(Keys.ENTER)
+        except Exception:
+            pass
+        time.sleep(0.4)
+
+    if tentar_etapa(
+        f"Preencher autocomplete {input_id} com {valor}",
+        _preencher,
+        chave=f"Preencher autocomplete {input_id}",
+    ):
+        return True
+    return False
+
+# ================
+# PRIMEFACES SELECT
+# ================
+def _rotulo_selecionado(label_id):
+    """Texto que o selectOneMenu passou a exibir (o item que o filtro "contém" de fato escolheu)."""
+    try:
+        return (seletores.esperar(label_id, timeout=WAIT_SHORT).text or "").strip() or True
+    except Exception:
+        return True
+
+
+def selecionar_primefaces(label_id, valor, timeout=WAIT_LONG):
+    """Escolhe no selectOneMenu pelo filtro; retorna o label selecionado (ou True se não der para ler)."""
+    valor = ajusta_valor_para_estado(label_id, (valor or "").strip())
+    label = seletores.esperar(label_id, EC.element_to_be_clickable)
+    navegador.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", label)
+    navegador.driver.execute_script("arguments[0].click();", label)
+    time.sleep(0.25)
+    panel = WebDriverWait(navegador.driver, timeout).until(
+        EC.visibility_of_element_located((
+            By.XPATH,
+            "//div[contains(@class,'ui-selectonemenu-panel') and contains(@style,'display: block')]"
+        ))
+    )
+    try:
+        filtro = panel.find_element(By.XPATH, ".//input[contains(@id,'_filter')]")
+        filtro.clear()
+        if valor:
+            filtro.send_keys(valor)
+        time.sleep(0.6)
+        filtro.send_keys(Keys.ENTER)
+        time.sleep(0.35)
+        return _rotulo_selecionado(label_id)
+    except Exception:
+        js = ("var p=document.querySelector(\"div.ui-selectonemenu-panel[style*='display: block'] li:not(.ui-state-disabled)\");"
+              "if(p){p.click(); return true;} return false;")
+        ok = navegador.driver.execute_script(js)
+        if ok:
+            time.sleep(0.25)
+            return _rotulo_selecionado(label_id)
+        raise Exception(f"Não foi possível selecionar no dropdown {label_id}")
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Fila de trabalho priorizada por prazo.
+
+Ordem: rodada (linhas reenfileiradas por falha transitória vão para o fim),
+Data de Citação mais antiga primeiro (prazo mais próximo; sem data vai depois),
+processo mais antigo (Data de Distribuição ou ano do número CNJ) e, por último,
+a ordem da planilha.
+"""
+
+import heapq
+import itertools
+import re
+from datetime import datetime
+
+from .config import COL_DATA_CITACAO, COL_DATA_DISTR, COL_NUM_PROCESSO
+from .dados import as_ddmmyyyy, safe_text
+
+_ANO_CNJ_RE = re.compile(r"^\d{7}-?\d{2}\.?(\d{4})")  # NNNNNNN-DD.AAAA.J.TR.OOOO
+_SEM_DATA = datetime.max
+
+
+def _data(raw):
+    txt = as_ddmmyyyy(raw)
+    return datetime.strptime(txt, "%d/%m/%Y") if txt else None
+
+
+def _idade(processo, distribuicao):
+    """Data usada como 'idade' do processo: distribuição, senão 1º/jan do ano CNJ."""
+    if distribuicao:
+        return distribuicao
+    m = _ANO_CNJ_RE.match(processo)
+    if m and 1900 <= int(m.group(1)) <= 2100:
+        return datetime(int(m.group(1)), 1, 1)
+    return _SEM_DATA
+
+
+class ItemFila:
+    """Uma linha a processar: planilha de origem, índice, dados e nº de reenfileiramentos."""
+
+    def __init__(self, planilha, idx, row, processo):
+        self.planilha = planilha
+        self.idx = idx
+        self.row = row
+        self.processo = processo
+        self.tentativas = 0
+        self.citacao = _data(row.get(COL_DATA_CITACAO, ""))
+        self.idade = _idade(processo, _data(row.get(COL_DATA_DISTR, "")))
+
+    def prioridade(self):
+        return (self.tentativas, self.citacao is None, self.citacao or _SEM_DATA, self.idade)
+
+
+class FilaLinhas:
+    """Heap de ItemFila; a ordem de inserção desempata (estável)."""
+
+    def __init__(self):
+        self._heap = []
+        self._seq = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def adicionar(self, item):
+        heapq.heappush(self._heap, (item.prioridade(), next(self._seq), item))
+
+    def proximo(self):
+        return heapq.heappop(self._heap)[2]
+
+    def reenfileirar(self, item):
+        """Falha transitória: volta para o fim da fila (próxima rodada)."""
+        item.tentativas += 1
+        self.adicionar(item)
+
+    def adicionar_planilha(self, planilha, pular_ok=False):
+        """Enfileira as linhas com processo; com pular_ok, as que já têm STATUS OK ficam de fora."""
+        for idx, row in planilha.df.iterrows():
+            processo = safe_text(row.get(COL_NUM_PROCESSO, ""))
+            if processo and not (pular_ok and planilha.status(idx).strip() == "OK"):
+                self.adicionar(ItemFila(planilha, idx, row, processo))
+        return self
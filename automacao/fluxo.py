@@ -0,0 +1,506 @@
+# -*- coding: utf-8 -*-
+"""
+Fluxo principal: processamento de uma linha da planilha no eLaw e o loop que
+percorre a planilha com supervisão do navegador (reinício/reciclagem).
+"""
+
+import logging
+import os
+import time
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from . import (
+    artefatos, config, governador, historico, medicao, navegador, progresso, registro, seletores,
+)
+from .config import (
+    COL_ADV_CONTR, COL_ADV_RESP, COL_CLASSIFICACAO, COL_CLIENTE_EMPRESA,
+    COL_COMARCA, COL_CPF_PARTE_CONTR, COL_DATA_CITACAO, COL_DATA_DISTR,
+    COL_EMPREGADORA, COL_ESTADO, COL_FASE, COL_FORO, COL_GESTOR_JURIDICO,
+    COL_INSTANCIA, COL_JUIZ, COL_RITO, COL_TIPO_ACAO,
+    COL_TIPO_DOC, COL_TIPO_EMPREGADO, COL_VALOR_CAUSA, COL_VARA,
+    COLUNAS_RECLAMADAS, WAIT_LONG, WAIT_MEDIUM, WAIT_SHORT,
+)
+from .dados import as_ddmmyyyy, safe_text, to_amount_str
+from .elaw import (
+    anexar_arquivo_por_input, clicar_id, digitar_data_humano,
+    esperar_texto_em_tabela_outras_partes, preencher_autocomplete_por_id,
+    preencher_input, selecionar_primefaces, _xpath_literal,
+)
+from .fila import FilaLinhas
+from .modais import criar_juiz_modal_js, incluir_parte_contraria_modal_js
+from .retry import (
+    CLASSES_TRANSITORIAS, ERRO_DESCONHECIDO, ERRO_VALIDACAO, FalhaEtapa, FalhaTransitoria,
+    classificar_erro, tentar_etapa,
+)
+from .verificacao import (
+    TIPO_DATA, TIPO_LISTA, TIPO_SELECT, TIPO_VALOR, Conferencia, FalhaVerificacao,
+    verificar_salvamento,
+)
+
+log = logging.getLogger(__name__)
+
+
+def registrar_falha(planilha, idx, processo, etapa, erro):
+    """marcar_erro + artefatos (screenshot, DOM, últimos comandos) referenciados no STATUS."""
+    planilha.marcar_erro(idx, etapa, erro)
+    nome = artefatos.capturar(planilha, idx, processo, erro)
+    if nome:
+        planilha.set_status(idx, f"{planilha.status(idx)} [artefatos: {nome}]")
+
+
+def processar_linha(planilha, idx, row, processo, pode_reenfileirar=False):
+    log.info("🔎 Linha %d | Processo: %s", idx + 1, processo)
+    planilha.set_status(idx, "EM ANDAMENTO...")
+
+    # extrair campos
+    rito            = safe_text(row.get(COL_RITO, ""))
+    estado_vara     = safe_text(row.get(COL_ESTADO, ""))
+    comarca_vara    = safe_text(row.get(COL_COMARCA, ""))
+    foro_tribunal   = safe_text(row.get(COL_FORO, ""))
+    vara_especifica = safe_text(row.get(COL_VARA, ""))
+    classificacao   = safe_text(row.get(COL_CLASSIFICACAO, ""))
+    instancia       = safe_text(row.get(COL_INSTANCIA, ""))
+    fase_processo   = safe_text(row.get(COL_FASE, ""))
+    juiz_nome       = safe_text(row.get(COL_JUIZ, ""))
+    cliente_empresa = safe_text(row.get(COL_CLIENTE_EMPRESA, ""))
+    cpf_cnpj_contr  = safe_text(row.get(COL_CPF_PARTE_CONTR, ""))
+    empresa_nivel1  = safe_text(row.get(COL_EMPREGADORA, ""))
+    tipo_parte      = safe_text(row.get(COL_TIPO_EMPREGADO, ""))
+    advogado_contr  = safe_text(row.get(COL_ADV_CONTR, ""))
+    tipo_processo   = safe_text(row.get(COL_TIPO_ACAO, ""))
+    valor_causa     = to_amount_str(row.get(COL_VALOR_CAUSA, ""))
+    adv_resp        = safe_text(row.get(COL_ADV_RESP, ""))
+    gestor_juridico = safe_text(row.get(COL_GESTOR_JURIDICO, ""))
+
+    # DATAS normalizadas (robustas)
+    data_distrib    = as_ddmmyyyy(row.get(COL_DATA_DISTR, ""))
+    data_receb      = as_ddmmyyyy(row.get(COL_DATA_CITACAO, ""))
+
+    tipo_doc_val    = safe_text(row.get(COL_TIPO_DOC, "")) or "Petição Inicial"
+
+    pdf_path = planilha.caminho_pdf(processo)
+
+    try:
+        # abrir processo via autocomplete global
+        def _abrir_processo():
+            search_input = seletores.esperar("busca_processo", timeout=WAIT_LONG)
+            search_input.clear()
+            time.sleep(0.25)
+            search_input.send_keys(processo)
+            WebDriverWait(navegador.driver, WAIT_MEDIUM).until(
+                EC.visibility_of_element_located((By.XPATH, f"//span[contains(text(),'{processo}')]"))
+            )
+            time.sleep(0.4)
+            search_input.send_keys(Keys.DOWN)
+            time.sleep(0.25)
+            search_input.send_keys(Keys.ENTER)
+            time.sleep(0.8)
+        governador.aguardar_token()
+        if not tentar_etapa("Abrir processo pelo autocomplete", _abrir_processo):
+            raise FalhaEtapa("Não foi possível abrir o processo.")
+
+        # entrar no modo editar
+        if not tentar_etapa("Entrar no modo Editar", clicar_id, "btnEditar"):
+            raise FalhaEtapa("Botão Editar indisponível.")
+
+        # DROPDOWNS (guarda o label clicado de cada um para a conferência pós-salvar)
+        escolhidos = {}
+        if rito:
+            escolhidos["rito"] = tentar_etapa("Selecionar Rito", selecionar_primefaces, "rito", rito)
+        if estado_vara:
+            escolhidos["estado"] = tentar_etapa("Selecionar Estado", selecionar_primefaces, "estado", estado_vara)
+        if comarca_vara:
+            escolhidos["comarca"] = tentar_etapa("Selecionar Comarca", selecionar_primefaces, "comarca", comarca_vara)
+        if foro_tribunal:
+            escolhidos["foro"] = tentar_etapa("Selecionar Foro/Tribunal", selecionar_primefaces, "foro", foro_tribunal)
+        if vara_especifica:
+            escolhidos["vara"] = tentar_etapa("Selecionar Vara", selecionar_primefaces, "vara", vara_especifica)
+        if classificacao:
+            tentar_etapa("Selecionar Classificação", selecionar_primefaces, "classificacao", classificacao)
+        if instancia:
+            tentar_etapa("Selecionar Instância", selecionar_primefaces, "instancia", instancia)
+        if fase_processo:
+            escolhidos["fase"] = tentar_etapa("Selecionar Fase", selecionar_primefaces, "fase", fase_processo)
+        if cliente_empresa:
+            tentar_etapa("Selecionar Empresa (Cliente)", selecionar_primefaces, "empresa", cliente_empresa)
+
+        # Papel = Réu
+        tentar_etapa("Selecionar Papel = Réu", selecionar_primefaces,
+                     "papel", "Réu")
+
+        # Tipo de documento
+        if tipo_doc_val:
+            tentar_etapa("Selecionar Tipo de Documento", selecionar_primefaces, "tipo_documento", tipo_doc_val)
+
+        # Parte do documento = Autor
+        tentar_etapa("Selecionar Parte do Documento = Autor", selecionar_primefaces,
+                     "parte_documento", "Autor")
+
+        # JUIZ modal (iframe)
+        if juiz_nome:
+            if not tentar_etapa("Criar Juiz (Modal c/ iframe)", criar_juiz_modal_js, juiz_nome):
+                raise FalhaEtapa("Juiz não pôde ser criado via modal.")
+
+        # PARTE CONTRÁRIA modal (iframe)
+        if cpf_cnpj_contr:
+            if not tentar_etapa("Incluir Parte Contrária (Modal c/ iframe)", incluir_parte_contraria_modal_js, cpf_cnpj_contr):
+                raise FalhaEtapa("Falha ao incluir parte contrária via modal.")
+
+        # Advogado parte contrária (autocomplete)
+        if advogado_contr:
+            def _adv_contra():
+                inp = seletores.esperar("adv_contrario")
+                inp.clear()
+                time.sleep(0.15)
+                inp.send_keys(advogado_contr)
+                time.sleep(0.9)
+                inp.send_keys(Keys.DOWN)
+                time.sleep(0.2)
+                inp.send_keys(Keys.ENTER)
+                time.sleep(0.4)
+            tentar_etapa("Selecionar Advogado da Parte Contrária", _adv_contra)
+
+        # ✅ DATAS com normalização + digitação humana
+        if data_distrib:
+            tentar_etapa("DIGITAR Data Distribuição (humano)", digitar_data_humano, "data_distribuicao", data_distrib)
+
+        if data_receb:
+            tentar_etapa("DIGITAR Data Citação (humano)", digitar_data_humano, "data_citacao", data_receb)
+
+        # Tipo de ação
+        if tipo_processo:
+            escolhidos["tipo_acao"] = tentar_etapa("Selecionar Tipo de Ação", selecionar_primefaces,
+                                                   "tipo_acao", tipo_processo)
+
+        # Valor da causa
+        if valor_causa:
+            tentar_etapa("Preencher Valor da Causa", preencher_input, "valor_causa", valor_causa)
+
+        # Advogado responsável (autocomplete + selectOneMenu)
+        if adv_resp:
+            if not preencher_autocomplete_por_id("adv_responsavel", adv_resp):
+                log.warning("⚠️ Autocomplete de Advogado Responsável não retornou resultados válidos.")
+            else:
+                tentar_etapa(
+                    "Selecionar Advogado Responsável",
+                    selecionar_primefaces,
+                    "adv_responsavel_combo",
+                    adv_resp,
+                )
+
+        # Gestor Jurídico (autocomplete específico)
+        if gestor_juridico:
+            if not preencher_autocomplete_por_id("gestor", gestor_juridico):
+                log.warning("⚠️ Campo 'Gestor Jurídico' não foi atualizado automaticamente.")
+
+        # =========================
+        # ✅ INCLUSÃO DE OUTRAS RECLAMADAS (1ª → 7ª RECLAMADA)
+        # =========================
+        reclamadas_nomes = [safe_text(row.get(col, "")) for col in COLUNAS_RECLAMADAS]
+
+        for parte_nome in reclamadas_nomes:
+            if not parte_nome or parte_nome.strip() == "":
+                continue  # Se célula vazia, apenas passa pra próxima
+
+            log.debug("➕ Adicionando reclamada adicional: %s", parte_nome)
+
+            try:
+                # 1. AUTOCOMPLETE - DIGITAR NOME E SELECIONAR NO DROPDOWN
+                def _preencher_autocomplete_parte():
+                    inp = seletores.esperar("outra_parte", EC.element_to_be_clickable)
+                    navegador.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", inp)
+                    inp.click()
+                    time.sleep(0.15)
+                    inp.send_keys(Keys.CONTROL, "a")
+                    inp.send_keys(Keys.BACKSPACE)
+                    time.sleep(0.1)
+                    inp.send_keys(parte_nome)
+
+                    painel_id = inp.get_attribute("aria-controls") or ""
+                    if not painel_id:
+                        raise Exception("Autocomplete sem aria-controls (painel não identificado).")
+
+                    panel = WebDriverWait(navegador.driver, WAIT_MEDIUM).until(
+                        EC.visibility_of_element_located((By.ID, painel_id))
+                    )
+
+                    primeiro_item = WebDriverWait(navegador.driver, WAIT_MEDIUM).until(
+                        EC.element_to_be_clickable((
+                            By.XPATH,
+                            f"//*[@id={_xpath_literal(painel_id)}]"
+                            "//li[contains(@class,'ui-autocomplete-item') and not(contains(@class,'ui-state-disabled'))]",
+                        ))
+                    )
+
+                    label_item = (primeiro_item.get_attribute("data-item-label") or primeiro_item.text or "").strip()
+                    if not label_item:
+                        raise Exception("Nenhum item disponível no autocomplete para a parte informada.")
+
+                    navegador.driver.execute_script("arguments[0].scrollIntoView({block:'nearest'});", primeiro_item)
+                    time.sleep(0.15)
+
+                    # Segue o fluxo humano: seta para baixo + ENTER
+                    inp.send_keys(Keys.DOWN)
+                    time.sleep(0.25)
+                    inp.send_keys(Keys.ENTER)
+
+                    try:
+                        WebDriverWait(navegador.driver, WAIT_SHORT).until(
+                            EC.invisibility_of_element_located((By.ID, painel_id))
+                        )
+                    except Exception:
+                        pass
+
+                    selecionado = (inp.get_attribute("value") or "").strip()
+                    if not selecionado:
+                        raise Exception("Autocomplete não preencheu o campo da parte.")
+
+                    label_lower = label_item.lower()
+                    selecionado_lower = selecionado.lower()
+                    parte_lower = parte_nome.lower()
+                    if (
+                        parte_lower not in label_lower
+                        and parte_lower not in selecionado_lower
+                        and selecionado_lower not in label_lower
+                    ):
+                        log.info(
+                            "ℹ️ Alerta: item selecionado '%s' difere da busca '%s'.", selecionado, parte_nome
+                        )
+
+                if not tentar_etapa(
+                    f"Selecionar parte {parte_nome} via autocomplete",
+                    _preencher_autocomplete_parte,
+                    chave="Reclamada: autocomplete",
+                ):
+                    raise Exception("Autocomplete não retornou resultados válidos.")
+
+                # 2. Selecionar papel = RÉU
+                def _selecionar_papel_reu():
+                    selecionar_primefaces("outra_parte_papel", "Réu")
+
+                if not tentar_etapa(
+                    f"Selecionar papel = Réu para {parte_nome}",
+                    _selecionar_papel_reu,
+                    chave="Reclamada: papel = Réu",
+                ):
+                    raise Exception("Não foi possível definir papel = Réu.")
+
+                # 3. Clicar em ADICIONAR
+                def _clicar_botao_adicionar():
+                    botao = seletores.esperar("outra_parte_adicionar", EC.element_to_be_clickable)
+                    navegador.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", botao)
+                    try:
+                        botao.click()
+                    except Exception:
+                        navegador.driver.execute_script("arguments[0].click();", botao)
+                    time.sleep(0.4)
+
+                if not tentar_etapa(
+                    f"Confirmar inclusão de {parte_nome}",
+                    _clicar_botao_adicionar,
+                    chave="Reclamada: adicionar",
+                ):
+                    raise Exception("Botão de adicionar não respondeu.")
+
+                if not esperar_texto_em_tabela_outras_partes(parte_nome):
+                    raise Exception("Nome não apareceu na lista após adicionar.")
+
+                log.debug("✅ Reclamada '%s' adicionada com sucesso!", parte_nome)
+
+            except Exception as e_parte:
+                log.warning("⚠️ Falha ao adicionar %s: %s", parte_nome, e_parte)
+                continue  # Não para o fluxo, apenas segue para a próxima
+
+        # UPLOAD PDF
+        if not os.path.exists(pdf_path):
+            log.warning("⚠️ PDF não encontrado: %s. Tentando anexar mesmo assim (verifique).", pdf_path)
+        tentar_etapa("Anexar PDF ATOrd_<processo>", anexar_arquivo_por_input, pdf_path)
+
+        # SALVAR
+        governador.aguardar_token()
+        if not tentar_etapa("Salvar alterações", clicar_id, "btnSalvarOpen"):
+            raise FalhaEtapa("Falha ao salvar (btnSalvarOpen).")
+
+        # CONFERIR o que o eLaw gravou (mensagens de erro + campos principais, numa chamada JS)
+        if config.VERIFICAR_SALVAMENTO:
+            conferencia = Conferencia()
+            for rotulo, campo, valor in (
+                ("Rito", "rito", rito),
+                ("Estado", "estado", estado_vara),
+                ("Comarca", "comarca", comarca_vara),
+                ("Foro/Tribunal", "foro", foro_tribunal),
+                ("Vara", "vara", vara_especifica),
+                ("Fase", "fase", fase_processo),
+                ("Tipo de Ação", "tipo_acao", tipo_processo),
+            ):
+                # sem label lido (etapa falhou), confere contra a planilha: a divergência aparece no STATUS
+                escolhido = escolhidos.get(campo)
+                conferencia.adicionar(rotulo, campo, escolhido if isinstance(escolhido, str) else valor, TIPO_SELECT)
+            conferencia.adicionar("Data de Distribuição", "data_distribuicao", data_distrib, TIPO_DATA)
+            conferencia.adicionar("Data de Citação", "data_citacao", data_receb, TIPO_DATA)
+            conferencia.adicionar("Valor da Causa", "valor_causa", valor_causa, TIPO_VALOR)
+            conferencia.adicionar("Reclamadas", "table[id*='outrasParte'].ui-datatable",
+                                  [n for n in reclamadas_nomes if n], TIPO_LISTA)
+            verificar_salvamento(conferencia)
+
+        planilha.set_status(idx, "OK")
+        log.info("✅ Finalizado com sucesso: %s", processo)
+
+    except Exception as e_row:
+        if not navegador.sessao_viva():
+            raise navegador.SessaoMorta(f"Navegador indisponível: {e_row}") from e_row
+        if isinstance(e_row, WebDriverException):
+            classe = classificar_erro(e_row)
+        elif isinstance(e_row, FalhaVerificacao):
+            classe = ERRO_VALIDACAO
+        elif isinstance(e_row, FalhaEtapa):
+            classe = e_row.classe
+        else:
+            classe = ERRO_DESCONHECIDO
+        if pode_reenfileirar and classe in CLASSES_TRANSITORIAS:
+            planilha.set_status(idx, f"REENFILEIRADO ({classe}): {e_row}")
+            raise FalhaTransitoria(classe, str(e_row)) from e_row
+        etapa = "SALVO PARCIAL" if isinstance(e_row, FalhaVerificacao) else "PROCESSAMENTO LINHA"
+        registrar_falha(planilha, idx, processo, etapa, e_row)
+        log.debug("Traceback da linha %d", idx + 1, exc_info=True)
+
+
+def executar(planilhas, lote=None):
+    """
+    Abre o navegador, aguarda o login e processa as linhas de todas as planilhas
+    numa fila única (prioridade por prazo). Cada planilha é gravada assim que suas
+    linhas terminam. Com `lote` observando uma pasta, planilhas novas entram na
+    fila sem reiniciar a sessão (Ctrl+C encerra).
+    """
+    abrir_se_erro = False if lote else None  # lote roda sem ninguém olhando: não abre Excel
+    fila = FilaLinhas()
+    pendentes = {}  # planilha -> linhas ainda na fila
+
+    def _salvar(planilha, abrir):
+        # planilha aberta no Excel (PermissionError) não pode derrubar o lote nem pular o encerramento
+        try:
+            planilha.salvar(abrir)
+        except Exception as e:
+            log.error("❌ STATUS não gravado em %s (planilha aberta no Excel?): %s", planilha.nome, e)
+
+    def _enfileirar(novas):
+        for planilha in novas:
+            antes = len(fila)
+            # lote reiniciado: linhas já OK não voltam a editar o processo no eLaw
+            fila.adicionar_planilha(planilha, pular_ok=lote is not None)
+            pendentes[planilha] = len(fila) - antes
+            progresso.contadores.adicionar(pendentes[planilha])
+            if not pendentes[planilha]:
+                del pendentes[planilha]
+                _salvar(planilha, abrir_se_erro)
+
+    try:
+        navegador.iniciar_driver()
+        navegador.aguardar_login()
+        governador.iniciar()
+        progresso.iniciar()  # depois do login: o tempo até logar não entra no ritmo/ETA
+        historico.iniciar()
+
+        _enfileirar(planilhas)
+        log.info("📋 %d linhas na fila (prioridade: Data de Citação, idade do processo).", len(fila))
+
+        linhas_desde_reciclagem = 0
+        while fila or (lote and lote.observar):
+            if lote and lote.hora_de_consultar():
+                _enfileirar(lote.novas_planilhas())
+            if not fila:
+                time.sleep(1)
+                continue
+
+            item = fila.proximo()
+            planilha, idx, row, processo = item.planilha, item.idx, item.row, item.processo
+
+            if linhas_desde_reciclagem >= config.RECICLAR_A_CADA:
+                linhas_desde_reciclagem = 0
+                try:
+                    navegador.reiniciar_driver(f"reciclagem preventiva a cada {config.RECICLAR_A_CADA} linhas")
+                    seletores.limpar()
+                except navegador.SessaoMorta as e_recicla:
+                    # a linha abaixo encontra a sessão morta e tenta de novo (ou falha sozinha)
+                    log.error("❌ Reciclagem do navegador falhou: %s", e_recicla)
+
+            governador.aguardar_vaga()  # outras instâncias + eLaw lento: pode segurar esta sessão
+            with registro.contexto(planilha=planilha.nome, linha=idx + 1, processo=processo):
+                medicao.iniciar_linha(idx)
+                inicio_linha = time.time()
+                comandos_antes = sum(medicao.metricas["comandos"].values())
+                reenfileirada = False
+                for reinicio in range(config.MAX_REINICIOS_POR_LINHA + 1):
+                    try:
+                        processar_linha(planilha, idx, row, processo,
+                                        pode_reenfileirar=item.tentativas < config.MAX_REENFILEIRAMENTOS)
+                        break
+                    except FalhaTransitoria as e_trans:
+                        log.warning("🔁 Linha %d reenfileirada (%s); volta no fim da fila.", idx + 1, e_trans.classe)
+                        fila.reenfileirar(item)
+                        reenfileirada = True
+                        break
+                    except navegador.SessaoMorta as e_sessao:
+                        if reinicio == config.MAX_REINICIOS_POR_LINHA:
+                            registrar_falha(planilha, idx, processo, "SESSÃO NAVEGADOR", e_sessao)
+                            break
+                        try:
+                            navegador.reiniciar_driver(str(e_sessao))
+                            seletores.limpar()
+                        except navegador.SessaoMorta as e_reinicio:
+                            registrar_falha(planilha, idx, processo, "SESSÃO NAVEGADOR", e_reinicio)
+                            break
+                        linhas_desde_reciclagem = 0
+                linhas_desde_reciclagem += 1
+                governador.medir_latencia()
+                duracao = time.time() - inicio_linha
+                comandos = sum(medicao.metricas["comandos"].values()) - comandos_antes
+                erro = idx in planilha.rows_to_color_yellow
+                medicao.registrar_linha({
+                    "planilha": planilha.nome,
+                    "linha": idx,
+                    "processo": processo,
+                    "status": planilha.status(idx),
+                    "duracao_s": round(duracao, 3),
+                    "comandos": comandos,
+                })
+                medicao.perfil.fechar_linha(idx)
+                historico.registrar_linha(planilha, idx, row, processo, ok=not (erro or reenfileirada),
+                                          duracao_s=duracao, comandos=comandos,
+                                          etapas=medicao.etapas_linha, final=not reenfileirada)
+                if reenfileirada:
+                    progresso.contadores.reenfileirar()
+                else:
+                    progresso.contadores.concluir(duracao, erro=erro)
+                    progresso.desenhar()
+
+            # salvar status no excel (+ linhas amarelas / abrir planilha se houver erro)
+            if not reenfileirada:
+                pendentes[planilha] -= 1
+                if not pendentes[planilha]:
+                    del pendentes[planilha]
+                    _salvar(planilha, abrir_se_erro)
+
+            time.sleep(0.6)
+
+    except KeyboardInterrupt:
+        log.warning("⏹️ Interrompido pelo usuário.")
+    except Exception as e_main:
+        log.exception("❌ ERRO GERAL: %s", e_main)
+    finally:
+        # planilhas com linhas ainda na fila (interrupção/erro geral): grava o progresso parcial
+        for planilha in list(pendentes):
+            del pendentes[planilha]
+            _salvar(planilha, False)
+        governador.encerrar()
+        navegador.encerrar_driver()
+        log.info("🧹 Navegador encerrado.")
+        artefatos.aguardar_gravacoes()
+        medicao.salvar_metricas()
+        historico.encerrar()
+        progresso.encerrar()
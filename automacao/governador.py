@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+Governador entre instâncias: várias automações rodando em paralelo (cada uma com
+o seu Chrome) dividem um estado JSON numa pasta comum.
+
+- Token bucket: limita o total de operações pesadas no eLaw (abrir processo e
+  salvar) por segundo, somando todas as instâncias.
+- Sessões ativas (AIMD): cada instância informa a latência que o servidor está
+  respondendo (Navigation/Resource Timing do Chrome). Acima do alvo, o número de
+  sessões ativas cai pela metade; abaixo, sobe uma por ajuste. As instâncias
+  excedentes (as que entraram por último) esperam antes da próxima linha.
+
+A trava é um arquivo criado com O_CREAT|O_EXCL (funciona igual no Windows e em
+rede); trava esquecida por um processo morto expira em TRAVA_ORFA_S. A quebra da
+trava órfã passa por uma segunda trava O_EXCL e confere a idade de novo: dois
+processos que viram a mesma trava velha não apagam a trava nova um do outro.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import socket
+import time
+
+from . import config, navegador
+
+log = logging.getLogger(__name__)
+
+TRAVA_ORFA_S = 10        # trava mais velha que isso = processo morreu segurando
+SESSAO_ORFA_S = 300      # instância sem sinal de vida há X s sai da conta
+ESPERA_VAGA_S = 5
+PESO_EWMA = 0.3          # latência: média móvel exponencial por instância
+
+# args: nenhum; devolve ms (requestStart -> responseStart) da navegação e dos XHR/fetch desde a última leitura
+_JS_LATENCIAS = """
+var t = [], nav = performance.getEntriesByType('navigation')[0];
+if (nav && nav.responseStart > 0 && !window.__latenciaLida) {
+    t.push(nav.responseStart - nav.requestStart);
+    window.__latenciaLida = true;
+}
+var rs = performance.getEntriesByType('resource');
+for (var i = 0; i < rs.length; i++) {
+    var r = rs[i];
+    if ((r.initiatorType === 'xmlhttprequest' || r.initiatorType === 'fetch') && r.responseStart > 0) {
+        t.push(r.responseStart - r.requestStart);
+    }
+}
+performance.clearResourceTimings();
+return t;
+"""
+
+
+class Governador:
+    """Estado compartilhado em `pasta`/estado.json, sempre lido e gravado sob a trava."""
+
+    def __init__(self, pasta, ops_por_s, rajada, max_sessoes, latencia_alvo_ms, ajuste_s):
+        self.pasta = pasta
+        self.ops_por_s = ops_por_s
+        self.rajada = rajada
+        self.max_sessoes = max_sessoes
+        self.latencia_alvo_ms = latencia_alvo_ms
+        self.ajuste_s = ajuste_s
+        # PID sozinho repete entre máquinas que dividem a pasta em rede
+        self.sessao = f"{socket.gethostname()}-{os.getpid()}"
+        self.latencia_ms = None
+        self.latencia_ts = 0.0
+        self.em_espera = False
+        os.makedirs(pasta, exist_ok=True)
+        self._arquivo = os.path.join(pasta, "estado.json")
+        self._trava = os.path.join(pasta, "estado.lock")
+
+    # ---------- trava + estado ----------
+    @contextlib.contextmanager
+    def _travado(self):
+        while True:
+            try:
+                os.close(os.open(self._trava, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                try:
+                    orfa = time.time() - os.path.getmtime(self._trava) > TRAVA_ORFA_S
+                except OSError:
+                    continue  # outro processo acabou de soltar/remover
+                if orfa and self._quebrar_trava_orfa():
+                    log.warning("🔓 Trava órfã do governador removida.")
+                    continue
+                time.sleep(0.02)
+        try:
+            yield
+        finally:
+            with contextlib.suppress(OSError):
+                os.remove(self._trava)
+
+    def _quebrar_trava_orfa(self):
+        """Remove a trava velha só sob a trava de quebra e só se ela ainda for a velha (não a de quem quebrou antes)."""
+        quebra = self._trava + ".quebra"
+        try:
+            os.close(os.open(quebra, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            with contextlib.suppress(OSError):
+                if time.time() - os.path.getmtime(quebra) > TRAVA_ORFA_S:
+                    os.remove(quebra)  # quem quebrava morreu entre o stat e o remove
+            return False
+        try:
+            if time.time() - os.path.getmtime(self._trava) > TRAVA_ORFA_S:
+                os.remove(self._trava)
+                return True
+            return False
+        except OSError:
+            return False
+        finally:
+            with contextlib.suppress(OSError):
+                os.remove(quebra)
+
+    @contextlib.contextmanager
+    def _estado(self):
+        with self._travado():
+            try:
+                with open(self._arquivo, encoding="utf-8") as f:
+                    estado = json.load(f)
+            except (OSError, ValueError):
+                estado = {}
+            agora = time.time()
+            estado.setdefault("tokens", float(self.rajada))
+            estado.setdefault("ts", agora)
+            estado.setdefault("limite", self.max_sessoes)
+            estado.setdefault("ultimo_ajuste", agora)
+            sessoes = estado.setdefault("sessoes", {})
+            for chave in [c for c, s in sessoes.items() if agora - s["visto"] > SESSAO_ORFA_S]:
+                del sessoes[chave]
+            eu = sessoes.setdefault(self.sessao, {"inicio": agora, "latencia_ms": None})
+            eu["visto"] = agora
+            if self.latencia_ms is not None:
+                eu["latencia_ms"] = round(self.latencia_ms, 1)
+                eu["latencia_ts"] = self.latencia_ts
+            yield estado
+            tmp = self._arquivo + f".{self.sessao}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(estado, f)
+            os.replace(tmp, self._arquivo)
+
+    # ---------- token bucket ----------
+    def aguardar_token(self):
+        """Bloqueia até haver um token no balde comum (uma operação pesada no eLaw)."""
+        inicio = time.time()
+        while True:
+            with self._estado() as estado:
+                agora = time.time()
+                estado["tokens"] = min(self.rajada, estado["tokens"] + (agora - estado["ts"]) * self.ops_por_s)
+                estado["ts"] = agora
+                if estado["tokens"] >= 1:
+                    estado["tokens"] -= 1
+                    espera = 0
+                else:
+                    espera = (1 - estado["tokens"]) / self.ops_por_s
+            if not espera:
+                break
+            time.sleep(espera)
+        if time.time() - inicio > 1:
+            log.debug("🚦 Limite de %.2f op/s: esperou %.1fs pelo token.", self.ops_por_s, time.time() - inicio)
+
+    # ---------- sessões ativas (AIMD) ----------
+    def _ajustar_limite(self, estado):
+        agora = time.time()
+        # só medições recentes: a instância em espera não mede e não pode travar o limite com um valor velho
+        latencias = [s["latencia_ms"] for s in estado["sessoes"].values()
+                     if s.get("latencia_ms") is not None and agora - s.get("latencia_ts", 0) <= 2 * self.ajuste_s]
+        if not latencias or agora - estado["ultimo_ajuste"] < self.ajuste_s:
+            return
+        pior = max(latencias)
+        antes = estado["limite"]
+        if pior > self.latencia_alvo_ms:
+            estado["limite"] = max(1, antes // 2)
+        else:
+            estado["limite"] = min(self.max_sessoes, antes + 1)
+        estado["ultimo_ajuste"] = agora
+        if estado["limite"] != antes:
+            log.info("🎚️ Sessões ativas: %d -> %d (latência do eLaw %.0f ms, alvo %.0f ms).",
+                     antes, estado["limite"], pior, self.latencia_alvo_ms)
+
+    def _tenho_vaga(self):
+        with self._estado() as estado:
+            self._ajustar_limite(estado)
+            ordem = sorted(estado["sessoes"], key=lambda c: (estado["sessoes"][c]["inicio"], c))
+            return ordem.index(self.sessao) < estado["limite"], estado["limite"], len(ordem)
+
+    def aguardar_vaga(self):
+        """Antes de cada linha: espera enquanto esta instância estiver acima do limite de sessões."""
+        while True:
+            ok, limite, total = self._tenho_vaga()
+            if ok:
+                if self.em_espera:
+                    log.info("▶️ Sessão liberada pelo governador (%d de %d ativas).", limite, total)
+                    self.em_espera = False
+                return
+            if not self.em_espera:
+                log.warning("⏸️ eLaw lento: governador mantém %d de %d sessões ativas; esta aguarda.", limite, total)
+                self.em_espera = True
+            time.sleep(ESPERA_VAGA_S)
+
+    def registrar_latencias(self, amostras_ms):
+        if not amostras_ms:
+            return
+        media = sum(amostras_ms) / len(amostras_ms)
+        if self.latencia_ms is None:
+            self.latencia_ms = media
+        else:
+            self.latencia_ms += PESO_EWMA * (media - self.latencia_ms)
+        self.latencia_ts = time.time()
+
+    def sair(self):
+        with self._estado() as estado:
+            estado["sessoes"].pop(self.sessao, None)
+
+
+# =====================
+# INSTÂNCIA DO PROCESSO (no-op se config.GOVERNADOR_DIR vazio)
+# =====================
+gov = None
+
+
+def iniciar():
+    global gov
+    if config.GOVERNADOR_DIR and gov is None:
+        gov = Governador(config.GOVERNADOR_DIR, config.GOV_OPS_POR_S, config.GOV_RAJADA,
+                         config.GOV_MAX_SESSOES, config.GOV_LATENCIA_ALVO_MS, config.GOV_AJUSTE_S)
+        log.debug("🚦 Governador em %s (%.2f op/s, até %d sessões).", gov.pasta, gov.ops_por_s, gov.max_sessoes)
+    return gov
+
+
+def aguardar_token():
+    if gov is not None:
+        gov.aguardar_token()
+
+
+def aguardar_vaga():
+    if gov is not None:
+        gov.aguardar_vaga()
+
+
+def medir_latencia():
+    """Lê do Chrome os tempos de resposta do servidor desde a última leitura (um comando por linha)."""
+    if gov is None or navegador.driver is None:
+        return
+    try:
+        gov.registrar_latencias(navegador.driver.execute_script(_JS_LATENCIAS) or [])
+    except Exception as e:
+        log.debug("Latência do eLaw não lida: %s", e)
+
+
+def encerrar():
+    global gov
+    if gov is not None:
+        with contextlib.suppress(OSError):
+            gov.sair()
+        gov = None
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Histórico das execuções em SQLite (um arquivo local, só biblioteca padrão).
+
+Cada linha processada (e cada etapa dela) é anexada ao fim da linha, com o id
+da execução, o processo, a Vara/Estado e a versão. A planilha é sobrescrita a
+cada run; o histórico fica. Relatórios:
+
+    python -m automacao.historico lentas            # etapas mais lentas (últimos 7 dias)
+    python -m automacao.historico falhas --por vara # taxa de falha por Vara (ou estado)
+    python -m automacao.historico versoes           # vazão por versão
+"""
+
+import argparse
+import logging
+import os
+import socket
+import sqlite3
+import time
+
+from . import config
+from .config import COL_ESTADO, COL_VARA
+from .dados import safe_text
+
+log = logging.getLogger(__name__)
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS execucoes (
+    id TEXT PRIMARY KEY,
+    versao TEXT NOT NULL,
+    host TEXT,
+    inicio REAL NOT NULL,
+    fim REAL,
+    linhas INTEGER DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS linhas (
+    id INTEGER PRIMARY KEY,
+    execucao_id TEXT NOT NULL REFERENCES execucoes(id),
+    processo TEXT NOT NULL,
+    planilha TEXT,
+    linha INTEGER,
+    vara TEXT,
+    estado TEXT,
+    status TEXT,
+    ok INTEGER NOT NULL,
+    final INTEGER NOT NULL,          -- 0 = tentativa reenfileirada (a linha volta depois)
+    duracao_s REAL,
+    comandos INTEGER,
+    ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS linhas_processo ON linhas (processo, execucao_id);
+CREATE INDEX IF NOT EXISTS linhas_ts ON linhas (ts);
+CREATE TABLE IF NOT EXISTS etapas (
+    linha_id INTEGER NOT NULL REFERENCES linhas(id),
+    etapa TEXT NOT NULL,
+    duracao_s REAL,
+    ok INTEGER,
+    tentativas INTEGER
+);
+CREATE INDEX IF NOT EXISTS etapas_linha ON etapas (linha_id);
+"""
+
+_conexao = None
+execucao_id = None
+
+
+def abrir(caminho):
+    conexao = sqlite3.connect(caminho)
+    conexao.execute("PRAGMA journal_mode=WAL")  # várias instâncias gravando no mesmo arquivo
+    conexao.execute("PRAGMA busy_timeout=5000")
+    conexao.executescript(_ESQUEMA)
+    return conexao
+
+
+def iniciar():
+    """Abre o banco (config.HISTORICO_PATH) e registra a execução atual. "" desliga."""
+    global _conexao, execucao_id
+    if not config.HISTORICO_PATH or _conexao is not None:
+        return
+    try:
+        _conexao = abrir(config.HISTORICO_PATH)
+        execucao_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        with _conexao:
+            _conexao.execute(
+                "INSERT INTO execucoes (id, versao, host, inicio) VALUES (?, ?, ?, ?)",
+                (execucao_id, config.VERSAO, socket.gethostname(), time.time()),
+            )
+    except sqlite3.Error as e:
+        log.warning("⚠️ Histórico desligado (%s): %s", config.HISTORICO_PATH, e)
+        _conexao = None
+
+
+def registrar_linha(planilha, idx, row, processo, ok, duracao_s, comandos, etapas, final=True):
+    """Anexa o resultado da linha e das suas etapas (medicao.etapas_linha)."""
+    global _conexao
+    if _conexao is None:
+        return
+    try:
+        with _conexao:
+            cur = _conexao.execute(
+                "INSERT INTO linhas (execucao_id, processo, planilha, linha, vara, estado, status, ok, final,"
+                " duracao_s, comandos, ts) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (execucao_id, processo, planilha.nome, idx + 1, safe_text(row.get(COL_VARA, "")),
+                 safe_text(row.get(COL_ESTADO, "")), planilha.status(idx), int(ok), int(final),
+                 round(duracao_s, 3), comandos, time.time()),
+            )
+            _conexao.executemany(
+                "INSERT INTO etapas (linha_id, etapa, duracao_s, ok, tentativas) VALUES (?, ?, ?, ?, ?)",
+                [(cur.lastrowid, e["etapa"], e["duracao_s"], int(e["ok"]), e["tentativas"]) for e in etapas],
+            )
+    except sqlite3.Error as e:
+        log.warning("⚠️ Falha ao gravar no histórico; desligado nesta execução: %s", e)
+        _conexao = None
+
+
+def encerrar():
+    global _conexao
+    if _conexao is None:
+        return
+    try:
+        with _conexao:
+            _conexao.execute(
+                "UPDATE execucoes SET fim = ?, linhas = (SELECT COUNT(*) FROM linhas"
+                " WHERE execucao_id = ? AND final = 1) WHERE id = ?",
+                (time.time(), execucao_id, execucao_id),
+            )
+        _conexao.close()
+    except sqlite3.Error as e:
+        log.warning("⚠️ Falha ao fechar o histórico: %s", e)
+    _conexao = None
+
+
+# =====================
+# CONSULTAS
+# =====================
+def etapas_mais_lentas(conexao, dias=7, limite=15):
+    return conexao.execute(
+        "SELECT etapa, COUNT(*) AS n, ROUND(AVG(e.duracao_s), 2) AS media_s, ROUND(MAX(e.duracao_s), 2) AS max_s,"
+        " ROUND(SUM(e.duracao_s), 1) AS total_s, SUM(1 - e.ok) AS falhas"
+        " FROM etapas e JOIN linhas l ON l.id = e.linha_id WHERE l.ts >= ?"
+        " GROUP BY etapa ORDER BY media_s DESC LIMIT ?",
+        (time.time() - dias * 86400, limite),
+    ).fetchall()
+
+
+def taxa_falha_por(conexao, coluna="vara", dias=30, minimo=1, limite=20):
+    if coluna not in ("vara", "estado"):
+        raise ValueError(f"coluna inválida: {coluna}")
+    return conexao.execute(
+        f"SELECT COALESCE(NULLIF({coluna}, ''), '(vazio)') AS grupo, COUNT(*) AS n, SUM(1 - ok) AS falhas,"
+        " ROUND(100.0 * SUM(1 - ok) / COUNT(*), 1) AS falha_pct"
+        " FROM linhas WHERE final = 1 AND ts >= ? GROUP BY grupo HAVING n >= ?"
+        " ORDER BY falha_pct DESC, n DESC LIMIT ?",
+        (time.time() - dias * 86400, minimo, limite),
+    ).fetchall()
+
+
+def vazao_por_versao(conexao):
+    # execução interrompida não tem `fim`: usa a última linha gravada
+    return conexao.execute(
+        "WITH por_execucao AS ("
+        "  SELECT x.versao, COUNT(*) AS n, SUM(l.ok) AS ok, SUM(l.duracao_s) AS soma_s,"
+        "         MAX(COALESCE(x.fim, 0), MAX(l.ts)) - x.inicio AS duracao"
+        "  FROM execucoes x JOIN linhas l ON l.execucao_id = x.id AND l.final = 1 GROUP BY x.id)"
+        " SELECT versao, COUNT(*) AS execucoes, SUM(n) AS linhas,"
+        " ROUND(SUM(n) * 3600.0 / SUM(duracao), 1) AS linhas_por_hora,"
+        " ROUND(SUM(soma_s) / SUM(n), 2) AS media_s, ROUND(100.0 * (SUM(n) - SUM(ok)) / SUM(n), 1) AS falha_pct"
+        " FROM por_execucao GROUP BY versao ORDER BY versao",
+    ).fetchall()
+
+
+def _imprimir(cabecalho, linhas):
+    larguras = [max(len(str(c)) for c in col) for col in zip(cabecalho, *linhas)]
+    for valores in [cabecalho, *linhas]:
+        print("  ".join(str(v).ljust(w) for v, w in zip(valores, larguras)))
+    if not linhas:
+        print("(sem dados no período)")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="automacao.historico", description="Relatórios do histórico de execuções.")
+    ap.add_argument("--banco", default=config.HISTORICO_PATH, help="arquivo SQLite do histórico")
+    sub = ap.add_subparsers(dest="relatorio", required=True)
+    lentas = sub.add_parser("lentas", help="etapas mais lentas (média)")
+    lentas.add_argument("--dias", type=int, default=7)
+    lentas.add_argument("--limite", type=int, default=15)
+    falhas = sub.add_parser("falhas", help="taxa de falha por Vara ou Estado")
+    falhas.add_argument("--por", choices=["vara", "estado"], default="vara")
+    falhas.add_argument("--dias", type=int, default=30)
+    falhas.add_argument("--minimo", type=int, default=3, help="mínimo de linhas por grupo")
+    falhas.add_argument("--limite", type=int, default=20)
+    sub.add_parser("versoes", help="vazão e falhas por versão")
+    args = ap.parse_args(argv)
+
+    if not os.path.exists(args.banco):
+        ap.error(f"histórico não encontrado: {args.banco}")
+    conexao = abrir(args.banco)
+    if args.relatorio == "lentas":
+        _imprimir(("etapa", "n", "média s", "máx s", "total s", "falhas"),
+                  etapas_mais_lentas(conexao, args.dias, args.limite))
+    elif args.relatorio == "falhas":
+        _imprimir((args.por, "linhas", "falhas", "% falha"),
+                  taxa_falha_por(conexao, args.por, args.dias, args.minimo, args.limite))
+    else:
+        _imprimir(("versão", "execuções", "linhas", "linhas/h", "média s", "% falha"), vazao_por_versao(conexao))
+    conexao.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Modo lote: várias planilhas de uma pasta numa única fila/sessão do navegador.
+
+Cada linha da fila carrega a planilha de origem, então o STATUS volta para o
+arquivo certo. Com `observar`, a pasta é consultada de tempos em tempos e as
+planilhas que chegarem entram na fila sem reabrir o Chrome nem refazer login.
+As planilhas vistas só ficam em memória: ao reiniciar o lote, as linhas que já
+têm STATUS OK não entram na fila de novo (o fluxo pula).
+Os PDFs ATOrd_<processo>.pdf ficam na mesma pasta das planilhas.
+"""
+
+import glob
+import logging
+import os
+import time
+
+from .planilha import Planilha
+
+log = logging.getLogger(__name__)
+
+ESTABILIDADE_S = 5  # arquivo sem alteração há X s = cópia terminou
+
+
+class PastaLote:
+    """Descobre planilhas novas em `pasta` (cada arquivo é carregado uma vez por execução)."""
+
+    def __init__(self, pasta, observar=False, intervalo=30.0):
+        self.pasta = os.path.abspath(pasta)
+        self.observar = observar
+        self.intervalo = intervalo
+        self.vistas = set()
+        self.ultima_consulta = 0.0
+
+    def _candidatas(self):
+        for caminho in sorted(glob.glob(os.path.join(self.pasta, "*.xlsx"))):
+            nome = os.path.basename(caminho)
+            if nome.startswith("~$") or caminho in self.vistas:  # ~$ = lock do Excel aberto
+                continue
+            if nome.endswith(".dry-run.xlsx"):  # relatório do --dry-run, não é planilha de entrada
+                continue
+            try:
+                if self.observar and time.time() - os.path.getmtime(caminho) < ESTABILIDADE_S:
+                    continue  # ainda sendo copiada; pega na próxima consulta
+            except OSError:
+                continue
+            yield caminho
+
+    def novas_planilhas(self):
+        self.ultima_consulta = time.time()
+        novas = []
+        for caminho in self._candidatas():
+            try:
+                planilha = Planilha(caminho, pasta_pdfs=self.pasta)
+            except Exception as e:
+                log.warning("⚠️ Não foi possível ler %s (nova tentativa depois): %s", os.path.basename(caminho), e)
+                continue
+            self.vistas.add(caminho)
+            log.info("📥 Planilha no lote: %s (%d linhas)", os.path.basename(caminho), len(planilha.df))
+            novas.append(planilha)
+        return novas
+
+    def hora_de_consultar(self):
+        return self.observar and time.time() - self.ultima_consulta >= self.intervalo
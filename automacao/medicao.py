@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Métricas de execução (etapas/linhas) e profiler de comandos WebDriver.
+
+Usado pelo benchmark (AUTOMACAO_METRICAS) e para achar onde vão os roundtrips
+(AUTOMACAO_PERFIL).
+"""
+
+import json
+import logging
+import sys
+import time
+from collections import Counter, defaultdict, deque
+
+from . import config
+
+log = logging.getLogger(__name__)
+
+# =====================
+# MÉTRICAS (benchmark)
+# =====================
+# Etapas/linhas do run inteiro só são acumuladas com config.METRICAS_PATH (um --lote
+# --observar não termina nunca); da linha atual fica só `etapas_linha` (histórico).
+# "comandos" é um Counter por tipo de comando: tamanho fixo.
+metricas = {"etapas": [], "linhas": [], "comandos": Counter()}
+linha_atual = None  # idx da linha em processamento (definido pelo fluxo)
+etapas_linha = []
+
+
+def iniciar_linha(idx):
+    global linha_atual
+    linha_atual = idx
+    etapas_linha.clear()
+
+
+def registrar_etapa(chave, inicio, ok, tentativas):
+    etapa = {
+        "linha": linha_atual,
+        "etapa": chave,
+        "duracao_s": round(time.time() - inicio, 4),
+        "ok": bool(ok),
+        "tentativas": tentativas,
+    }
+    etapas_linha.append(etapa)
+    if config.METRICAS_PATH:
+        metricas["etapas"].append(etapa)
+
+
+def registrar_linha(linha):
+    if config.METRICAS_PATH:
+        metricas["linhas"].append(linha)
+
+
+# =====================
+# PROFILER DE COMANDOS WEBDRIVER
+# =====================
+_PREFIXO_PACOTE = __name__.rsplit(".", 1)[0] + "."
+_FRAMES_IGNORADOS = {"execute", "tentar_etapa", "<module>"}
+
+
+class PerfilWebDriver:
+    """
+    Conta e cronometra cada comando WebDriver agrupando pela pilha de helpers do
+    pacote que o originou (ex.: processar_linha;selecionar_primefaces;findElement).
+    Ao fim de cada linha imprime os helpers mais caros e, se config.PERFIL_PATH, anexa as
+    pilhas no formato "folded" (flamegraph.pl / speedscope), com peso em ms.
+    """
+
+    def __init__(self, max_ultimos=50):
+        self.linha = defaultdict(lambda: [0, 0.0])      # pilha;comando -> [n, s] (linha atual)
+        self.por_helper = defaultdict(lambda: [0, 0.0])  # helper -> [n, s] (run inteiro)
+        self.ultimos = deque(maxlen=max_ultimos)         # últimos comandos (diagnóstico de falhas)
+
+    @staticmethod
+    def pilha_chamadora():
+        nomes = []
+        f = sys._getframe(2)
+        while f is not None:
+            if (f.f_globals.get("__name__", "").startswith(_PREFIXO_PACOTE)
+                    and f.f_code.co_name not in _FRAMES_IGNORADOS):
+                nomes.append(f.f_code.co_name)
+            f = f.f_back
+        return ";".join(reversed(nomes)) or "<main>"
+
+    def registrar(self, comando, duracao, pilha):
+        helper = pilha.rsplit(";", 1)[-1]
+        for acc in (self.linha[f"{pilha};{comando}"], self.por_helper[helper]):
+            acc[0] += 1
+            acc[1] += duracao
+        self.ultimos.append((time.time(), comando, helper, round(duracao, 4)))
+
+    def fechar_linha(self, idx):
+        if not self.linha:
+            return
+        if config.PERFIL_PATH:
+            helpers = defaultdict(lambda: [0, 0.0])
+            for chave, (n, seg) in self.linha.items():
+                h = chave.rsplit(";", 2)[-2]
+                helpers[h][0] += n
+                helpers[h][1] += seg
+            total_n = sum(v[0] for v in helpers.values())
+            total_s = sum(v[1] for v in helpers.values())
+            top = sorted(helpers.items(), key=lambda kv: -kv[1][1])[:6]
+            log.info("📈 Linha %d: %d comandos WebDriver em %.1fs | %s", idx + 1, total_n, total_s,
+                     " | ".join(f"{h} {n}x {seg:.1f}s" for h, (n, seg) in top))
+            try:
+                with open(config.PERFIL_PATH, "a", encoding="utf-8") as f:
+                    for chave, (n, seg) in self.linha.items():
+                        f.write(f"linha_{idx+1};{chave} {max(1, int(seg * 1000))}\n")
+            except Exception as e:
+                log.warning("⚠️ Falha ao gravar perfil WebDriver: %s", e)
+        self.linha.clear()
+
+
+perfil = PerfilWebDriver()
+
+
+def instrumentar_driver(d):
+    """Conta e cronometra cada comando WebDriver (um roundtrip HTTP ao chromedriver)."""
+    original = d.execute
+
+    def execute(driver_command, params=None):
+        t0 = time.perf_counter()
+        try:
+            return original(driver_command, params)
+        finally:
+            metricas["comandos"][driver_command] += 1
+            perfil.registrar(driver_command, time.perf_counter() - t0, perfil.pilha_chamadora())
+
+    d.execute = execute
+
+
+def _memoria_pico_mb():
+    """Pico de memória do Python: psutil no Windows (peak_wset), resource no Linux/macOS."""
+    try:
+        import psutil
+        pico = getattr(psutil.Process().memory_info(), "peak_wset", None)
+        if pico is not None:
+            return round(pico / (1024.0 * 1024.0), 1)
+    except Exception:
+        pass
+    try:
+        import resource
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return round(pico / (1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0), 1)  # macOS: bytes; Linux: KiB
+    except Exception:
+        return None
+
+
+def salvar_metricas():
+    if not config.METRICAS_PATH:
+        return
+    try:
+        with open(config.METRICAS_PATH, "w", encoding="utf-8") as f:
+            json.dump({
+                "versao": config.VERSAO,
+                "etapas": metricas["etapas"],
+                "linhas": metricas["linhas"],
+                "comandos": dict(metricas["comandos"]),
+                "comandos_por_helper": {
+                    h: {"n": n, "s": round(seg, 3)} for h, (n, seg) in perfil.por_helper.items()
+                },
+                "python_pico_mb": _memoria_pico_mb(),
+            }, f, ensure_ascii=False, indent=1)
+        log.info("📊 Métricas gravadas em %s", config.METRICAS_PATH)
+    except Exception as e:
+        log.warning("⚠️ Falha ao gravar métricas: %s", e)
@@ -0,0 +1,701 @@
+# -*- coding: utf-8 -*-
+"""
+Mock local do eLaw para benchmarks / testes offline da automação.
+
+Reproduz as páginas e os ids que a automação usa (busca global
+`globaSearchAutocomplete_input`, `btnEditar`, selectOneMenu PrimeFaces com painel
++ filtro, autocompletes, dialogs com IFRAME de Juiz e Parte Contrária, datatable
+`outrasParte`, upload e `btnSalvarOpen`) com latência configurável.
+
+Uso:
+    python -m automacao.mock_elaw --porta 8765 --latencia-ms 150 --jitter-ms 50
+    set ELAW_SITE_URL=http://127.0.0.1:8765/   (e rodar python -m automacao normalmente)
+
+Endpoints auxiliares (JSON): /api/estado (processos salvos), /api/metricas
+(contagem de requisições por rota), /api/reset.
+
+`--regenerar-jid-a-cada N` troca o prefixo j_id_4c dos ids da tela do processo a
+cada N carregamentos, como o eLaw faz após um deploy (testa o registro de seletores).
+"""
+
+import argparse
+import html
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# =====================
+# CATÁLOGO (valores aceitos pelos dropdowns/autocompletes do mock)
+# =====================
+ADVOGADOS = [
+    "Ana Paula Ribeiro", "Bruno Carvalho Lima", "Carla Mendes Souza",
+    "Diego Fernandes Rocha", "Eduarda Martins Alves",
+]
+GESTORES = ["Fernanda Costa", "Gustavo Henrique Silva", "Helena Duarte"]
+EMPRESAS = [
+    "Oi S.A.", "Telemar Norte Leste S.A.", "Serede - Serviços de Rede S.A.",
+    "Telemont Engenharia de Telecomunicações S.A.", "Tel Telecomunicações Ltda.",
+    "Nova Rede Serviços Ltda.", "Conecta Instalações Ltda.",
+]
+
+CATALOGO = {
+    "comboRito": ["Ordinário", "Sumaríssimo", "Sumário"],
+    "comboEstadoVara": [
+        "SP - São Paulo", "RJ - Rio de Janeiro", "MG - Minas Gerais", "BA - Bahia",
+        "RS - Rio Grande do Sul", "PR - Paraná", "PE - Pernambuco",
+    ],
+    "comboComarcaVara": [
+        "São Paulo", "Rio de Janeiro", "Belo Horizonte", "Salvador",
+        "Porto Alegre", "Curitiba", "Recife", "Campinas",
+    ],
+    "comboForoTribunal": [
+        "TRT 1ª Região", "TRT 2ª Região", "TRT 3ª Região", "TRT 4ª Região",
+        "TRT 5ª Região", "TRT 6ª Região", "TRT 9ª Região", "TRT 15ª Região",
+    ],
+    "comboVara": [f"{n}ª Vara do Trabalho" for n in range(1, 31)],
+    "processoClassificacaoCombo": ["Trabalhista", "Cível", "Consumidor"],
+    "instancia": ["1ª Instância", "2ª Instância", "TST"],
+    "processoFaseCombo": ["Conhecimento", "Recursal", "Execução"],
+    "comboClientProcessoParte": ["V.tal - Rede Neutra de Telecomunicações S.A.", "Oi S.A."],
+    "papel": ["Autor", "Réu", "Terceiro Interessado"],
+    "eFileTipoCombo": ["Petição Inicial", "Procuração", "Documento Diverso"],
+    "parteDocumento": ["Autor", "Réu"],
+    "comboProcessoTipo": ["Reclamação Trabalhista", "Ação de Cobrança", "Ação Indenizatória"],
+    "comboAdvogadoResponsavelProcesso": ADVOGADOS,
+}
+
+# fonte -> lista; fontes "abertas" devolvem o próprio termo quando nada casa
+FONTES_AUTOCOMPLETE = {
+    "processos": [],
+    "advogados": ADVOGADOS,
+    "gestores": GESTORES,
+    "empresas": EMPRESAS,
+    "advogadosContrarios": [],
+}
+FONTES_ABERTAS = {"processos", "advogadosContrarios"}
+
+# (id base do selectOneMenu, chave do CATALOGO, rótulo)
+SELECTS = [
+    ("j_id_4c_1:j_id_4c_5_2_2_1_9_t_1:comboRito", "comboRito", "Rito"),
+    ("j_id_4c_1:j_id_4c_5_2_2_1_9_t_1:comboEstadoVara", "comboEstadoVara", "Estado"),
+    ("j_id_4c_1:j_id_4c_5_2_2_1_9_t_1:comboComarcaVara", "comboComarcaVara", "Comarca"),
+    ("j_id_4c_1:j_id_4c_5_2_2_1_9_t_1:comboForoTribunal", "comboForoTribunal", "Foro/Tribunal"),
+    ("j_id_4c_1:j_id_4c_5_2_2_1_9_t_1:comboVara", "comboVara", "Vara"),
+    ("j_id_4c_1:j_id_4c_5_2_2_2_9_15_1:processoClassificacaoCombo", "processoClassificacaoCombo", "Classificação Interna"),
+    ("j_id_4c_1:j_id_4c_5_2_2_3_9_19_1", "instancia", "Instância"),
+    ("j_id_4c_1:processoFaseCombo", "processoFaseCombo", "Fase"),
+    ("j_id_4c_1:comboClientProcessoParte", "comboClientProcessoParte", "Empresa"),
+    ("j_id_4c_1:j_id_4c_5_2_2_9_9_2_6", "papel", "Papel"),
+    ("j_id_4c_1:j_id_4c_5_2_2_r_9_24_1:eFileTipoCombo", "eFileTipoCombo", "Tipo de Documento"),
+    ("j_id_4c_1:j_id_4c_5_2_2_b_9_8_1:j_id_4c_5_2_2_b_9_8_5_2_n", "parteDocumento", "Parte do Documento"),
+    ("j_id_4c_1:comboProcessoTipo", "comboProcessoTipo", "Tipo de Ação"),
+]
+
+# (id base do autocomplete, fonte, rótulo)
+AUTOCOMPLETES = [
+    ("j_id_4c_1:j_id_4c_5_2_2_f_9_2v_1:autocompleteAdvogadoParteContrariaNome", "advogadosContrarios",
+     "Advogado da Parte Contrária"),
+    ("j_id_4c_1:autoCompleteLawyer", "advogados", "Advogado Responsável"),
+    ("j_id_4c_1:j_id_4c_5_2_2_l_9_45_2:j_id_4c_5_2_2_l_9_45_3_1_2_2_1_1:j_id_4c_5_2_2_l_9_45_3_1_2_2_1_2g",
+     "gestores", "Gestor Jurídico"),
+]
+
+INPUTS = [
+    ("j_id_4c_1:dataDistribuicao_input", "Data de Distribuição"),
+    ("j_id_4c_1:dataRecebimento_input", "Data de Citação"),
+    ("j_id_4c_1:amountCase_input", "Valor da Causa"),
+]
+
+PREFIXO_JID = "j_id_4c"  # prefixo gerado pelo JSF na tela do processo
+OUTRAS_PARTES = "j_id_4c_1:j_id_4c_5_2_2_c_9_3_1"
+BTN_JUIZ = "j_id_4c_1:juizBtnNovo"
+BTN_PARTE_CONTRARIA = "j_id_4c_1:j_id_4c_5_2_2_b_9_8_1:parteContrariaMainGridBtnNovo"
+
+
+# =====================
+# ESTADO DO SERVIDOR
+# =====================
+class EstadoMock:
+    def __init__(self, latencia_ms=0, jitter_ms=0, taxa_erro_validacao=0.0):
+        self.latencia_ms = latencia_ms
+        self.jitter_ms = jitter_ms
+        self.taxa_erro_validacao = taxa_erro_validacao
+        self.regenerar_jid_a_cada = 0
+        self.cargas_processo = 0
+        self.prefixo_jid = PREFIXO_JID
+        self.lock = threading.Lock()
+        self.processos = {}
+        self.requisicoes = Counter()
+
+    def dormir(self):
+        ms = self.latencia_ms + random.uniform(-self.jitter_ms, self.jitter_ms)
+        if ms > 0:
+            time.sleep(ms / 1000.0)
+
+    def reset(self):
+        with self.lock:
+            self.processos.clear()
+            self.requisicoes.clear()
+            self.cargas_processo = 0
+            self.prefixo_jid = PREFIXO_JID
+
+    def carregar_processo(self):
+        """Conta a carga da tela do processo; a cada N, sorteia um prefixo j_id novo."""
+        with self.lock:
+            self.cargas_processo += 1
+            if self.regenerar_jid_a_cada and self.cargas_processo % self.regenerar_jid_a_cada == 0:
+                self.prefixo_jid = "j_id_" + "".join(random.choices("0123456789abcdefghijklmnopqrstuvwxyz", k=2))
+            return self.prefixo_jid
+
+
+estado = EstadoMock()
+
+
+# =====================
+# HTML
+# =====================
+_CSS = """
+body { font-family: sans-serif; margin: 0; }
+.topo { background: #24476b; padding: 8px; position: relative; }
+.campo { margin: 6px 12px; position: relative; }
+.campo > .rotulo { display: inline-block; width: 220px; }
+.ui-selectonemenu-label { display: inline-block; min-width: 260px; border: 1px solid #999; padding: 2px 6px; cursor: pointer; background: #fff; }
+.ui-selectonemenu-panel, .ui-autocomplete-panel { position: absolute; z-index: 1000; background: #fff; border: 1px solid #666; min-width: 260px; max-height: 240px; overflow: auto; }
+.ui-selectonemenu-panel ul, .ui-autocomplete-panel ul { list-style: none; margin: 0; padding: 0; }
+li.ui-state-highlight { background: #cde; }
+.ui-dialog { position: fixed; top: 80px; left: 25%; width: 50%; background: #fff; border: 2px solid #24476b; z-index: 2000; }
+.ui-dialog iframe { width: 100%; height: 220px; border: 0; }
+.ui-growl { position: fixed; top: 8px; right: 8px; z-index: 3000; }
+.ui-growl-message { background: #dfd; padding: 6px; margin: 4px; }
+.ui-growl-message-error { background: #fdd; padding: 6px; margin: 4px; }
+.modo-visualizacao .so-edicao { display: none; }
+"""
+
+_JS = r"""
+function ajax(url, corpo) {
+    return fetch(url, corpo === undefined ? {} : {method: 'POST', body: JSON.stringify(corpo)})
+        .then(function (r) { return r.json(); });
+}
+function fecharPaineis(exceto) {
+    document.querySelectorAll('.ui-selectonemenu-panel, .ui-autocomplete-panel').forEach(function (p) {
+        if (p !== exceto) p.style.display = 'none';
+    });
+}
+function posicionar(painel, ancora) {
+    painel.style.left = ancora.offsetLeft + 'px';
+    painel.style.top = (ancora.offsetTop + ancora.offsetHeight) + 'px';
+}
+/* ---------- selectOneMenu ---------- */
+function abrirSelect(label) {
+    var base = label.id.replace(/_label$/, '');
+    var painel = document.getElementById(base + '_panel');
+    fecharPaineis(painel);
+    posicionar(painel, label);
+    painel.style.display = 'block';
+    var filtro = document.getElementById(base + '_filter');
+    filtro.value = '';
+    filtrarSelect(filtro);
+    filtro.focus();
+}
+function normalizar(s) { return (s || '').toLowerCase().trim(); }
+function filtrarSelect(filtro) {
+    var termo = normalizar(filtro.value);
+    filtro.parentNode.querySelectorAll('li').forEach(function (li) {
+        li.style.display = normalizar(li.dataset.label).indexOf(termo) >= 0 ? '' : 'none';
+    });
+}
+function teclaFiltro(ev, filtro) {
+    if (ev.key !== 'Enter') return;
+    ev.preventDefault();
+    var itens = filtro.parentNode.querySelectorAll('li');
+    for (var i = 0; i < itens.length; i++) {
+        if (itens[i].style.display !== 'none') { escolherSelect(itens[i]); return; }
+    }
+}
+function escolherSelect(li) {
+    var painel = li.closest('.ui-selectonemenu-panel');
+    var base = painel.id.replace(/_panel$/, '');
+    var label = document.getElementById(base + '_label');
+    label.textContent = li.dataset.label;
+    label.dataset.valor = li.dataset.label;
+    painel.style.display = 'none';
+    ajax('/api/ajax?c=select');
+}
+/* ---------- autocomplete ---------- */
+var timersAC = {};
+function digitarAC(inp) {
+    clearTimeout(timersAC[inp.id]);
+    timersAC[inp.id] = setTimeout(function () { buscarAC(inp); }, 150);
+}
+function buscarAC(inp) {
+    var termo = inp.value;
+    var painel = document.getElementById(inp.getAttribute('aria-controls'));
+    if (termo.trim().length < 2) { painel.style.display = 'none'; return; }
+    ajax('/api/autocomplete?fonte=' + encodeURIComponent(inp.dataset.fonte) + '&q=' + encodeURIComponent(termo))
+        .then(function (itens) {
+            if (inp.value !== termo) return;
+            var ul = painel.querySelector('ul');
+            ul.innerHTML = '';
+            itens.forEach(function (t) {
+                var li = document.createElement('li');
+                li.className = 'ui-autocomplete-item';
+                li.dataset.itemLabel = t;
+                li.setAttribute('data-item-label', t);
+                var sp = document.createElement('span');
+                sp.textContent = t;
+                li.appendChild(sp);
+                li.onclick = function () { escolherAC(inp, li); };
+                ul.appendChild(li);
+            });
+            fecharPaineis(painel);
+            posicionar(painel, inp);
+            painel.style.display = itens.length ? 'block' : 'none';
+        });
+}
+function teclaAC(ev, inp) {
+    var painel = document.getElementById(inp.getAttribute('aria-controls'));
+    var itens = painel.querySelectorAll('li');
+    var atual = painel.querySelector('li.ui-state-highlight');
+    if (ev.key === 'ArrowDown') {
+        ev.preventDefault();
+        if (!itens.length) return;
+        var idx = Array.prototype.indexOf.call(itens, atual);
+        if (atual) atual.classList.remove('ui-state-highlight');
+        itens[Math.min(idx + 1, itens.length - 1)].classList.add('ui-state-highlight');
+    } else if (ev.key === 'Enter') {
+        ev.preventDefault();
+        if (atual && painel.style.display !== 'none') escolherAC(inp, atual);
+    }
+}
+function escolherAC(inp, li) {
+    var painel = document.getElementById(inp.getAttribute('aria-controls'));
+    inp.value = li.getAttribute('data-item-label');
+    painel.style.display = 'none';
+    if (inp.dataset.fonte === 'processos') {
+        window.location.href = '/processo.elaw?numero=' + encodeURIComponent(inp.value);
+        return;
+    }
+    ajax('/api/ajax?c=autocomplete');
+}
+/* ---------- dialogs com iframe ---------- */
+function abrirDialog(dlgId, src) {
+    ajax('/api/ajax?c=dialog').then(function () {
+        var dlg = document.getElementById(dlgId);
+        dlg.querySelector('iframe').src = src;
+        dlg.style.display = 'block';
+        dlg.classList.add('ui-overlay-visible');
+    });
+}
+function dialogConcluido(tipo, valor) {
+    var dlgId = tipo === 'juiz' ? '__BTN_JUIZ___dlg' : '__BTN_PARTE___dlg';
+    if (tipo === 'juiz') {
+        document.getElementById('j_id_4c_1:juiz_input').value = valor;
+    } else {
+        adicionarLinha('j_id_4c_1:parteContrariaTable', valor);
+    }
+    var dlg = document.getElementById(dlgId);
+    dlg.style.display = 'none';
+    dlg.classList.remove('ui-overlay-visible');
+    dlg.querySelector('iframe').src = 'about:blank';
+}
+/* ---------- outras partes ---------- */
+function adicionarLinha(tabelaId, texto) {
+    var tb = document.getElementById(tabelaId).querySelector('tbody');
+    var tr = document.createElement('tr');
+    var td = document.createElement('td');
+    var sp = document.createElement('span');
+    sp.textContent = texto;
+    td.appendChild(sp);
+    tr.appendChild(td);
+    tb.appendChild(tr);
+}
+function adicionarOutraParte(base) {
+    var inp = document.getElementById(base + ':autocompleteOutraParte_input');
+    var papel = document.getElementById(base + ':processoParteSelect_label').dataset.valor || '';
+    var nome = inp.value.trim();
+    ajax('/api/ajax?c=outraParte').then(function () {
+        if (!nome || !papel) { growl('Informe a parte e o papel.', true); return; }
+        adicionarLinha(base + ':outrasParteTable', nome);
+        inp.value = '';
+    });
+}
+/* ---------- salvar ---------- */
+function growl(msg, erro) {
+    var g = document.getElementById('growl');
+    var d = document.createElement('div');
+    d.className = erro ? 'ui-growl-message ui-growl-message-error' : 'ui-growl-message';
+    d.textContent = msg;
+    g.appendChild(d);
+    setTimeout(function () { if (d.parentNode) d.parentNode.removeChild(d); }, 6000);
+}
+function textosTabela(id) {
+    return Array.prototype.map.call(document.querySelectorAll('[id="' + id + '"] tbody span'),
+        function (s) { return s.textContent; });
+}
+function salvarProcesso(numero) {
+    var campos = {};
+    document.querySelectorAll('#form .ui-selectonemenu-label').forEach(function (l) {
+        if (l.dataset.valor) campos[l.id.replace(/_label$/, '')] = l.dataset.valor;
+    });
+    document.querySelectorAll('#form input.campo-form').forEach(function (i) {
+        if (i.value) campos[i.id] = i.value;
+    });
+    var arquivo = document.getElementById('j_id_4c_1:eFileUpload_input');
+    var dados = {
+        campos: campos,
+        outrasPartes: textosTabela('__OUTRAS__:outrasParteTable'),
+        partesContrarias: textosTabela('j_id_4c_1:parteContrariaTable'),
+        arquivo: arquivo.files && arquivo.files.length ? arquivo.files[0].name : ''
+    };
+    ajax('/api/salvar?numero=' + encodeURIComponent(numero), dados).then(function (r) {
+        if (!r.ok) { growl(r.erro, true); return; }
+        growl('Processo salvo com sucesso.', false);
+        setTimeout(function () {
+            window.location.href = '/processo.elaw?numero=' + encodeURIComponent(numero);
+        }, 300);
+    });
+}
+document.addEventListener('click', function (ev) {
+    if (!ev.target.closest('.ui-selectonemenu-panel, .ui-autocomplete-panel, .ui-selectonemenu-label')) {
+        fecharPaineis(null);
+    }
+});
+"""
+
+
+def _esc(s):
+    return html.escape(str(s), quote=True)
+
+
+def _select(base, chave, rotulo, valor=""):
+    itens = "".join(
+        f'<li class="ui-selectonemenu-item" data-label="{_esc(o)}" onclick="escolherSelect(this)">{_esc(o)}</li>'
+        for o in CATALOGO[chave]
+    )
+    return (
+        f'<div class="campo"><span class="rotulo">{_esc(rotulo)}</span>'
+        f'<div class="ui-selectonemenu" id="{_esc(base)}" style="display:inline-block">'
+        f'<span class="ui-selectonemenu-label" id="{_esc(base)}_label" data-valor="{_esc(valor)}" '
+        f'onclick="abrirSelect(this)">{_esc(valor or "Selecione")}</span></div>'
+        f'<div class="ui-selectonemenu-panel" id="{_esc(base)}_panel" style="display: none">'
+        f'<input type="text" id="{_esc(base)}_filter" class="ui-selectonemenu-filter" '
+        f'oninput="filtrarSelect(this)" onkeydown="teclaFiltro(event, this)"><ul>{itens}</ul></div></div>'
+    )
+
+
+def _autocomplete(base, fonte, rotulo, valor="", classe="campo-form"):
+    return (
+        f'<div class="campo"><span class="rotulo">{_esc(rotulo)}</span>'
+        f'<span class="ui-autocomplete" id="{_esc(base)}">'
+        f'<input type="text" id="{_esc(base)}_input" class="ui-autocomplete-input {classe}" autocomplete="off" '
+        f'aria-controls="{_esc(base)}_panel" data-fonte="{_esc(fonte)}" value="{_esc(valor)}" '
+        f'oninput="digitarAC(this)" onkeydown="teclaAC(event, this)"></span>'
+        f'<div class="ui-autocomplete-panel" id="{_esc(base)}_panel" style="display: none"><ul></ul></div></div>'
+    )
+
+
+def _tabela(tabela_id, textos):
+    linhas = "".join(f"<tr><td><span>{_esc(t)}</span></td></tr>" for t in textos)
+    return (
+        f'<table id="{_esc(tabela_id)}" class="ui-datatable"><thead><tr><th>Nome</th></tr></thead>'
+        f"<tbody>{linhas}</tbody></table>"
+    )
+
+
+def _dialog(btn_id):
+    return (
+        f'<div class="ui-dialog" id="{_esc(btn_id)}_dlg" style="display: none">'
+        '<div class="ui-dialog-content"><iframe src="about:blank"></iframe></div></div>'
+    )
+
+
+def _pagina(titulo, corpo):
+    js = (
+        _JS.replace("__BTN_JUIZ__", BTN_JUIZ)
+        .replace("__BTN_PARTE__", BTN_PARTE_CONTRARIA)
+        .replace("__OUTRAS__", OUTRAS_PARTES)
+    )
+    topo = (
+        '<div class="topo">'
+        + _autocomplete("j_id_2g:globaSearchAutocomplete", "processos", "Buscar processo", classe="")
+        + "</div>"
+    )
+    return (
+        f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{_esc(titulo)}</title>'
+        f"<style>{_CSS}</style><script>{js}</script></head><body>"
+        f'{topo}<div id="growl" class="ui-growl"></div>{corpo}</body></html>'
+    )
+
+
+def pagina_home():
+    return _pagina("eLaw (mock) - Home", "<h2>Home (mock eLaw)</h2>")
+
+
+def pagina_processo(numero, editar):
+    with estado.lock:
+        reg = dict(estado.processos.get(numero, {}))
+    campos = reg.get("campos", {})
+    partes = []
+    for base, chave, rotulo in SELECTS:
+        partes.append(_select(base, chave, rotulo, campos.get(base, "")))
+    partes.append(
+        f'<div class="campo"><span class="rotulo">Juiz</span>'
+        f'<input type="text" id="j_id_4c_1:juiz_input" class="campo-form" readonly '
+        f'value="{_esc(campos.get("j_id_4c_1:juiz_input", ""))}">'
+        f'<button type="button" class="so-edicao" id="{_esc(BTN_JUIZ)}" '
+        f'onclick="abrirDialog(\'{_esc(BTN_JUIZ)}_dlg\', \'/dialog/juiz\')">Novo</button></div>'
+    )
+    partes.append(
+        '<div class="campo"><span class="rotulo">Parte Contrária</span>'
+        f'<button type="button" class="so-edicao" id="{_esc(BTN_PARTE_CONTRARIA)}" '
+        f'onclick="abrirDialog(\'{_esc(BTN_PARTE_CONTRARIA)}_dlg\', \'/dialog/parteContraria\')">Novo</button>'
+        + _tabela("j_id_4c_1:parteContrariaTable", reg.get("partesContrarias", []))
+        + "</div>"
+    )
+    for base, fonte, rotulo in AUTOCOMPLETES:
+        partes.append(_autocomplete(base, fonte, rotulo, campos.get(base + "_input", "")))
+    for input_id, rotulo in INPUTS:
+        partes.append(
+            f'<div class="campo"><span class="rotulo">{_esc(rotulo)}</span>'
+            f'<input type="text" id="{_esc(input_id)}" class="campo-form" '
+            f'value="{_esc(campos.get(input_id, ""))}"></div>'
+        )
+    partes.append(
+        '<fieldset class="campo"><legend>Outras Partes</legend>'
+        + _autocomplete(OUTRAS_PARTES + ":autocompleteOutraParte", "empresas", "Parte", classe="")
+        + _select(OUTRAS_PARTES + ":processoParteSelect", "papel", "Papel")
+        + f'<button type="button" class="so-edicao" id="{_esc(OUTRAS_PARTES)}:outrasParteAddButtom" '
+        f'onclick="adicionarOutraParte(\'{_esc(OUTRAS_PARTES)}\')">Adicionar</button>'
+        + _tabela(OUTRAS_PARTES + ":outrasParteTable", reg.get("outrasPartes", []))
+        + "</fieldset>"
+    )
+    partes.append(
+        '<div class="campo so-edicao"><span class="rotulo">Anexo</span>'
+        '<input type="file" id="j_id_4c_1:eFileUpload_input"></div>'
+    )
+    if editar:
+        botoes = f'<button type="button" id="btnSalvarOpen" onclick="salvarProcesso(\'{_esc(numero)}\')">Salvar</button>'
+    else:
+        botoes = (
+            f'<button type="button" id="btnEditar" '
+            f'onclick="window.location.href=\'/processo.elaw?editar=1&numero=\' + encodeURIComponent(\'{_esc(numero)}\')">'
+            "Editar</button>"
+        )
+    classe = "" if editar else "modo-visualizacao"
+    corpo = (
+        f"<h2>Processo {_esc(numero)}</h2>{botoes}"
+        f'<form id="form" class="{classe}" onsubmit="return false">{"".join(partes)}</form>'
+        + _dialog(BTN_JUIZ)
+        + _dialog(BTN_PARTE_CONTRARIA)
+    )
+    return _pagina(f"Processo {numero}", corpo)
+
+
+def pagina_dialog_juiz():
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>'
+        '<label>Nome do Juiz</label> <input type="text" id="j_id_w">'
+        '<button type="button" id="btnSalvarjuiz" onclick="salvar()">Salvar</button>'
+        "<script>function salvar(){var n=document.getElementById('j_id_w').value;"
+        "fetch('/api/juiz',{method:'POST',body:JSON.stringify({nome:n})})"
+        ".then(function(){parent.dialogConcluido('juiz', n);});}</script></body></html>"
+    )
+
+
+def pagina_dialog_parte_contraria():
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>'
+        '<label>CPF/CNPJ</label> <input type="text" id="j_id_1e">'
+        '<button type="button" id="j_id_1i" onclick="continuar()">Continuar</button>'
+        '<button type="button" id="parteContrariaButtom" style="display:none" onclick="salvar()">Salvar</button>'
+        "<script>function continuar(){fetch('/api/ajax?c=parteContraria').then(function(){"
+        "document.getElementById('parteContrariaButtom').style.display='inline-block';});}"
+        "function salvar(){var v=document.getElementById('j_id_1e').value;"
+        "fetch('/api/ajax?c=parteContrariaSalvar').then(function(){parent.dialogConcluido('parteContraria', v);});}"
+        "</script></body></html>"
+    )
+
+
+# =====================
+# API
+# =====================
+def buscar_autocomplete(fonte, termo):
+    termo_n = (termo or "").strip().lower()
+    base = FONTES_AUTOCOMPLETE.get(fonte, [])
+    itens = [o for o in base if termo_n in o.lower()][:10]
+    if not itens and fonte in FONTES_ABERTAS and termo_n:
+        itens = [termo.strip()]
+    return itens
+
+
+def validar_salvamento(dados):
+    valor = (dados.get("campos") or {}).get("j_id_4c_1:amountCase_input", "")
+    if valor:
+        try:
+            float(valor)
+        except ValueError:
+            return "Valor da Causa: valor inválido."
+    if estado.taxa_erro_validacao and random.random() < estado.taxa_erro_validacao:
+        return "Erro de validação simulado pelo mock."
+    return ""
+
+
+class HandlerMock(BaseHTTPRequestHandler):
+    server_version = "MockElaw/1.0"
+
+    def log_message(self, format, *args):  # silencioso
+        pass
+
+    def _responder(self, corpo, tipo="text/html; charset=utf-8", status=200, headers=None):
+        dados = corpo.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", tipo)
+        self.send_header("Content-Length", str(len(dados)))
+        self.send_header("Cache-Control", "no-store")
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(dados)
+
+    def _json(self, obj, status=200):
+        self._responder(json.dumps(obj, ensure_ascii=False), "application/json; charset=utf-8", status)
+
+    def _registrar(self, rota):
+        with estado.lock:
+            estado.requisicoes[rota] += 1
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        qs = {k: v[0] for k, v in parse_qs(url.query).items()}
+        rota = url.path
+        self._registrar(rota)
+        if rota in ("/api/estado", "/api/metricas"):
+            with estado.lock:
+                obj = dict(estado.processos) if rota == "/api/estado" else dict(estado.requisicoes)
+            return self._json(obj)
+        if rota == "/api/reset":
+            estado.reset()
+            return self._json({"ok": True})
+
+        estado.dormir()
+        if rota in ("/", "/login.elaw"):
+            self.send_response(302)
+            self.send_header("Location", "/homePage.elaw")
+            self.send_header("Set-Cookie", "JSESSIONID=mock; Path=/")
+            self.end_headers()
+        elif rota == "/homePage.elaw":
+            self._responder(pagina_home())
+        elif rota == "/processo.elaw":
+            prefixo = estado.carregar_processo()
+            self._responder(pagina_processo(qs.get("numero", ""), qs.get("editar") == "1").replace(PREFIXO_JID, prefixo))
+        elif rota == "/dialog/juiz":
+            self._responder(pagina_dialog_juiz())
+        elif rota == "/dialog/parteContraria":
+            self._responder(pagina_dialog_parte_contraria())
+        elif rota == "/api/autocomplete":
+            self._json(buscar_autocomplete(qs.get("fonte", ""), qs.get("q", "")))
+        elif rota == "/api/ajax":
+            self._json({"ok": True})
+        else:
+            self._responder("não encontrado", "text/plain; charset=utf-8", 404)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        qs = {k: v[0] for k, v in parse_qs(url.query).items()}
+        self._registrar(url.path)
+        tamanho = int(self.headers.get("Content-Length") or 0)
+        try:
+            dados = json.loads(self.rfile.read(tamanho) or b"{}")
+        except ValueError:
+            dados = {}
+        estado.dormir()
+        if url.path == "/api/salvar":
+            prefixo = estado.prefixo_jid  # grava com os ids canônicos, qualquer que seja o prefixo da tela
+            dados["campos"] = {k.replace(prefixo, PREFIXO_JID): v for k, v in (dados.get("campos") or {}).items()}
+            erro = validar_salvamento(dados)
+            if erro:
+                return self._json({"ok": False, "erro": erro})
+            numero = qs.get("numero", "")
+            with estado.lock:
+                estado.processos[numero] = {
+                    "campos": dados.get("campos") or {},
+                    "outrasPartes": dados.get("outrasPartes") or [],
+                    "partesContrarias": dados.get("partesContrarias") or [],
+                    "arquivo": dados.get("arquivo") or "",
+                    "salvo_em": time.time(),
+                }
+            return self._json({"ok": True})
+        if url.path == "/api/juiz":
+            return self._json({"ok": True})
+        self._json({"ok": False, "erro": "rota desconhecida"}, 404)
+
+
+def catalogo_por_coluna():
+    """Catálogo do mock no formato do --dry-run: {coluna da planilha: [opções]}."""
+    from . import config
+    return {
+        config.COL_RITO: CATALOGO["comboRito"],
+        config.COL_ESTADO: CATALOGO["comboEstadoVara"],
+        config.COL_COMARCA: CATALOGO["comboComarcaVara"],
+        config.COL_FORO: CATALOGO["comboForoTribunal"],
+        config.COL_VARA: CATALOGO["comboVara"],
+        config.COL_CLASSIFICACAO: CATALOGO["processoClassificacaoCombo"],
+        config.COL_INSTANCIA: CATALOGO["instancia"],
+        config.COL_FASE: CATALOGO["processoFaseCombo"],
+        config.COL_CLIENTE_EMPRESA: CATALOGO["comboClientProcessoParte"],
+        config.COL_TIPO_DOC: CATALOGO["eFileTipoCombo"],
+        config.COL_TIPO_ACAO: CATALOGO["comboProcessoTipo"],
+        config.COL_ADV_RESP: ADVOGADOS,
+        "Reclamadas": EMPRESAS,
+    }
+
+
+def iniciar_servidor(porta=8765, latencia_ms=0, jitter_ms=0, taxa_erro_validacao=0.0, host="127.0.0.1",
+                     regenerar_jid_a_cada=0):
+    """Sobe o mock numa thread daemon e devolve o servidor (use .shutdown() para parar)."""
+    estado.latencia_ms = latencia_ms
+    estado.jitter_ms = jitter_ms
+    estado.taxa_erro_validacao = taxa_erro_validacao
+    estado.regenerar_jid_a_cada = regenerar_jid_a_cada
+    servidor = ThreadingHTTPServer((host, porta), HandlerMock)
+    servidor.daemon_threads = True
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Mock local do eLaw para benchmarks offline.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--porta", type=int, default=8765)
+    ap.add_argument("--latencia-ms", type=float, default=150.0, help="latência base por requisição")
+    ap.add_argument("--jitter-ms", type=float, default=50.0, help="variação aleatória (+/-) da latência")
+    ap.add_argument("--taxa-erro-validacao", type=float, default=0.0,
+                    help="fração de salvamentos rejeitados com growl de erro (0..1)")
+    ap.add_argument("--regenerar-jid-a-cada", type=int, default=0, metavar="N",
+                    help="troca o prefixo j_id_4c da tela do processo a cada N carregamentos (0 = nunca)")
+    ap.add_argument("--exportar-catalogo", metavar="JSON",
+                    help="grava o catálogo do mock (formato do --dry-run) e sai")
+    args = ap.parse_args(argv)
+    if args.exportar_catalogo:
+        with open(args.exportar_catalogo, "w", encoding="utf-8") as f:
+            json.dump(catalogo_por_coluna(), f, ensure_ascii=False, indent=2)
+        print(f"📁 Catálogo gravado em {args.exportar_catalogo}")
+        return
+    servidor = iniciar_servidor(args.porta, args.latencia_ms, args.jitter_ms, args.taxa_erro_validacao, args.host,
+                                args.regenerar_jid_a_cada)
+    print(f"🧪 Mock eLaw em http://{args.host}:{args.porta}/ (latência {args.latencia_ms:.0f}±{args.jitter_ms:.0f} ms)")
+    print(f"👉 Rode a automação com ELAW_SITE_URL=http://{args.host}:{args.porta}/")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        servidor.shutdown()
+        print("🧹 Mock encerrado.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Modais PrimeFaces com IFRAME (Juiz + Parte Contrária).
+
+Esperas orientadas a evento: um MutationObserver (execute_async_script) resolve
+assim que o dialog/iframe está pronto ou fechado, sem polling nem sleeps fixos.
+"""
+
+import logging
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from . import navegador
+from .config import WAIT_LONG
+from .elaw import clicar_id
+
+log = logging.getLogger(__name__)
+
+# Ids reais dos dialogs aprendidos na 1ª linha (hint -> id). Nas linhas seguintes o
+# observer confere direto esse id em vez de varrer todos os dialogs da página.
+_DIALOG_IDS_APRENDIDOS = {}
+
+# Template de espera via MutationObserver (execute_async_script): o "probe" é
+# reavaliado a cada mutação do DOM / load de iframe e a promise resolve assim que
+# ele retornar algo verdadeiro (ou null no timeout). arguments[0] = timeout em ms.
+_JS_OBSERVAR_TEMPLATE = """
+var args = arguments, done = args[args.length - 1];
+var probe = function () { %s };
+var fim = false, obs = null, timer = null;
+function visivel(el) {
+    if (!el) return false;
+    var st = window.getComputedStyle(el);
+    return st.display !== 'none' && st.visibility !== 'hidden' && el.offsetWidth > 0;
+}
+function terminar(r) {
+    if (fim) return;
+    fim = true;
+    if (obs) obs.disconnect();
+    if (timer) clearTimeout(timer);
+    document.removeEventListener('load', checar, true);
+    done(r === undefined ? null : r);
+}
+function checar() {
+    try { var r = probe(); if (r) terminar(r); } catch (e) {}
+}
+checar();
+if (!fim) {
+    obs = new MutationObserver(checar);
+    obs.observe(document.documentElement, {
+        childList: true, subtree: true, attributes: true,
+        attributeFilter: ['style', 'class', 'aria-hidden']
+    });
+    document.addEventListener('load', checar, true);
+    timer = setTimeout(function () { terminar(null); }, args[0]);
+}
+"""
+
+_PROBE_DIALOG_PRONTO = """
+var hint = args[1], conhecido = args[2];
+function pronto(d) {
+    var ifr = d.querySelector('iframe');
+    if (!ifr) return null;
+    try {
+        var doc = ifr.contentDocument;
+        if (!doc || doc.readyState !== 'complete' || !doc.body || !doc.body.children.length) return null;
+        if (ifr.contentWindow.location.href === 'about:blank') return null;
+    } catch (e) {}
+    return [d, ifr, d.id || ''];
+}
+if (conhecido) {
+    var d0 = document.getElementById(conhecido);
+    if (visivel(d0)) return pronto(d0);
+}
+var ds = document.querySelectorAll('div.ui-dialog'), qualquer = null;
+for (var i = 0; i < ds.length; i++) {
+    if (!visivel(ds[i])) continue;
+    var r = pronto(ds[i]);
+    if (!r) continue;
+    if (hint && (ds[i].id || '').indexOf(hint) >= 0) return r;
+    if (!qualquer) qualquer = r;
+}
+return qualquer;
+"""
+
+_PROBE_DIALOG_FECHADO = """
+var d = document.getElementById(args[1]);
+return !d || !visivel(d);
+"""
+
+# Preenche o input (valor + eventos input/change) e clica no botão numa única
+# chamada, assim que ambos existirem no documento do iframe.
+_PROBE_PREENCHER_E_CLICAR = """
+var inp = document.getElementById(args[1]);
+var btn = document.getElementById(args[3]) || (args[4] ? document.querySelector(args[4]) : null);
+if (!inp || !btn) return null;
+inp.focus();
+inp.value = args[2];
+inp.dispatchEvent(new Event('input', {bubbles: true}));
+inp.dispatchEvent(new Event('change', {bubbles: true}));
+btn.click();
+return true;
+"""
+
+
+def _observar_js(probe_js: str, timeout, *args):
+    """Executa o probe via MutationObserver e devolve seu resultado (None no timeout)."""
+    script = _JS_OBSERVAR_TEMPLATE % probe_js
+    return navegador.driver.execute_async_script(script, int(timeout * 1000), *args)
+
+
+def _switch_into_dialog_iframe_by_hint(id_hint_contains: str, timeout=WAIT_LONG):
+    """
+    Aguarda (MutationObserver) o dialog visível cujo id contém 'id_hint_contains' ter o
+    iframe carregado e entra nele. Se não achar por hint, usa qualquer dialog visível
+    com iframe pronto. Retorna o id do dialog usado (para aguardar o fechamento depois).
+    """
+    conhecido = _DIALOG_IDS_APRENDIDOS.get(id_hint_contains, "")
+    r = _observar_js(_PROBE_DIALOG_PRONTO, timeout, id_hint_contains, conhecido)
+    if not r:
+        raise Exception("Timeout ao localizar iframe dentro de um dialog visível.")
+    _dialog, ifr, dlg_id = r
+    if dlg_id and id_hint_contains and id_hint_contains in dlg_id:
+        _DIALOG_IDS_APRENDIDOS[id_hint_contains] = dlg_id
+    log.debug("🔎 Dialog pronto (id='%s'), entrando no iframe...", dlg_id)
+    navegador.driver.switch_to.frame(ifr)
+    return dlg_id
+
+def _leave_iframe():
+    try:
+        navegador.driver.switch_to.default_content()
+    except Exception:
+        pass
+
+def _wait_dialog_invisible(dialog_id, timeout=WAIT_LONG):
+    if not dialog_id:
+        return False
+    try:
+        return bool(_observar_js(_PROBE_DIALOG_FECHADO, timeout, dialog_id))
+    except Exception:
+        return False
+
+def criar_juiz_modal_js(juiz_nome: str):
+    """
+    Abre modal de Juiz, entra no iframe, preenche j_id_w, clica salvar (btnSalvarjuiz) e aguarda fechar.
+    """
+    log.debug("➡️ Abrindo modal Juiz (Novo)...")
+    clicar_id("juiz_novo")
+
+    log.debug("⏳ Aguardando dialog + iframe do Juiz...")
+    dialog_id = _switch_into_dialog_iframe_by_hint("juizBtnNovo_dlg", timeout=WAIT_LONG)
+
+    try:
+        log.debug("✍️ Preenchendo nome do Juiz (input#j_id_w) e salvando...")
+        ok = _observar_js(
+            _PROBE_PREENCHER_E_CLICAR, WAIT_LONG,
+            "j_id_w", juiz_nome, "btnSalvarjuiz", "button[id*='Salvar']",
+        )
+        if not ok:
+            raise Exception("input#j_id_w / botão salvar não apareceram no iframe.")
+    except Exception as e:
+        raise Exception(f"Erro ao preencher/salvar Juiz dentro do iframe: {e}")
+    finally:
+        log.debug("↩️ Retornando para o contexto principal...")
+        _leave_iframe()
+
+    if _wait_dialog_invisible(dialog_id, timeout=WAIT_LONG):
+        log.debug("✅ Modal Juiz fechado.")
+    else:
+        log.warning("⚠️ Modal Juiz ainda visível, prosseguindo (pode ser renderização tardia).")
+
+def incluir_parte_contraria_modal_js(cpf_cnpj: str):
+    """
+    Abre modal de Parte Contrária, entra no iframe, preenche CPF/CNPJ (input#j_id_1e),
+    clica Continuar (button#j_id_1i), depois Salvar (button#parteContrariaButtom), aguarda fechar.
+    """
+    log.debug("➡️ Abrindo modal Parte Contrária (Novo)...")
+    clicar_id("parte_contraria_novo")
+
+    log.debug("⏳ Aguardando dialog + iframe da Parte Contrária...")
+    dialog_id = _switch_into_dialog_iframe_by_hint("parteContrariaMainGridBtnNovo_dlg", timeout=WAIT_LONG)
+
+    try:
+        log.debug("✍️ Preenchendo CPF/CNPJ (input#j_id_1e) e clicando 'Continuar' (button#j_id_1i)...")
+        ok = _observar_js(
+            _PROBE_PREENCHER_E_CLICAR, WAIT_LONG,
+            "j_id_1e", cpf_cnpj, "j_id_1i", "button[id*='1i'], button[id*='Continuar']",
+        )
+        if not ok:
+            raise Exception("Campo CPF/CNPJ ou botão Continuar não localizado.")
+
+        log.debug("💾 Aguardando e clicando 'Salvar' da Parte Contrária (button#parteContrariaButtom)...")
+        # "Continuar" pode navegar o iframe: um script assíncrono iniciado agora morreria no
+        # unload e só voltaria no script timeout. A espera comum atravessa a troca de documento.
+        try:
+            save_btn = WebDriverWait(navegador.driver, WAIT_LONG).until(
+                EC.element_to_be_clickable((By.ID, "parteContrariaButtom"))
+            )
+        except TimeoutException:
+            try:
+                save_btn = navegador.driver.find_element(By.CSS_SELECTOR, "button[id*='parteContraria'], button[id*='Salvar']")
+            except Exception as e3:
+                raise Exception(f"Botão Salvar da Parte Contrária não apareceu: {e3}")
+        navegador.driver.execute_script("arguments[0].click();", save_btn)
+    except Exception as e:
+        raise Exception(f"Erro ao incluir Parte Contrária dentro do iframe: {e}")
+    finally:
+        log.debug("↩️ Retornando para o contexto principal...")
+        _leave_iframe()
+
+    if _wait_dialog_invisible(dialog_id, timeout=WAIT_LONG):
+        log.debug("✅ Modal Parte Contrária fechado.")
+    else:
+        log.warning("⚠️ Modal Parte Contrária ainda visível, prosseguindo (pode ser renderização tardia).")
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Ciclo de vida do navegador: criação do driver, login, detecção de sessão morta,
+reinício com restauração de cookies.
+
+`driver` e `wait` são trocados a cada reinício; os outros módulos acessam sempre
+`navegador.driver` / `navegador.wait` (nunca uma cópia importada).
+"""
+
+import logging
+import sys
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from . import config, medicao
+
+log = logging.getLogger(__name__)
+
+driver = None
+wait = None
+_cookies_sessao = []  # cookies pós-login, reaplicados quando o driver é reiniciado
+
+
+class SessaoMorta(Exception):
+    """O Chrome/chromedriver caiu ou parou de responder no meio da linha."""
+
+
+def desatendido() -> bool:
+    """Lote/benchmark/agendador: ninguém para fazer login manual (stdin não é um terminal)."""
+    return config.DESATENDIDO or sys.stdin is None or not sys.stdin.isatty()
+
+
+def iniciar_driver():
+    global driver, wait
+    options = webdriver.ChromeOptions()
+    options.add_argument("--start-maximized")
+    if config.HEADLESS:
+        options.add_argument("--headless=new")
+    service = Service(config.CHROMEDRIVER_PATH)
+    driver = webdriver.Chrome(service=service, options=options)
+    medicao.instrumentar_driver(driver)
+    # margem sobre WAIT_LONG para os observers (execute_async_script) resolverem sozinhos
+    driver.set_script_timeout(config.WAIT_LONG + 5)
+    wait = WebDriverWait(driver, config.WAIT_LONG)
+    return driver
+
+
+def encerrar_driver():
+    try:
+        if driver is not None:
+            driver.quit()
+    except Exception:
+        pass
+
+
+def sessao_viva() -> bool:
+    """Um roundtrip barato: falha se o Chrome caiu, a sessão expirou ou a página travou."""
+    if driver is None:
+        return False
+    try:
+        driver.execute_script("return document.readyState;")
+        return True
+    except Exception:
+        return False
+
+
+def aguardar_login():
+    global _cookies_sessao
+    driver.get(config.SITE_URL)
+    log.info("👀 Aguardando login... (até 180s)")
+    try:
+        WebDriverWait(driver, 180).until(EC.url_contains("/homePage.elaw"))
+        log.info("✅ Login detectado, iniciando automação...")
+    except Exception:
+        if desatendido():
+            raise SessaoMorta("login não detectado em 180s e execução desatendida (sem ENTER manual)")
+        log.warning("⚠️ Login não detectado automaticamente. Faça login e pressione ENTER aqui.")
+        input("👉 Pressione ENTER após logar...")
+    try:
+        _cookies_sessao = driver.get_cookies()
+    except Exception:
+        _cookies_sessao = []
+
+
+def _restaurar_sessao() -> bool:
+    """Reaplica os cookies do login original no navegador novo (evita novo login manual)."""
+    if not _cookies_sessao:
+        return False
+    try:
+        driver.get(config.SITE_URL)
+        driver.delete_all_cookies()
+        for c in _cookies_sessao:
+            c = {k: v for k, v in c.items() if k in ("name", "value", "path", "domain", "secure", "httpOnly", "expiry")}
+            try:
+                driver.add_cookie(c)
+            except Exception:
+                pass
+        driver.get(config.SITE_URL.rstrip("/") + "/homePage.elaw")
+        WebDriverWait(driver, config.WAIT_MEDIUM).until(EC.url_contains("/homePage.elaw"))
+        return True
+    except Exception as e:
+        log.info("ℹ️ Não foi possível restaurar a sessão pelos cookies: %s", e)
+        return False
+
+
+def _iniciar_com_backoff():
+    for tentativa in range(1, config.MAX_TENTATIVAS_INICIAR_DRIVER + 1):
+        try:
+            return iniciar_driver()
+        except Exception as e:
+            if tentativa == config.MAX_TENTATIVAS_INICIAR_DRIVER:
+                raise SessaoMorta(f"Chrome não iniciou após {tentativa} tentativas: {e}") from e
+            espera = config.ESPERA_INICIAR_DRIVER_S * 2 ** (tentativa - 1)
+            log.warning("⚠️ Chrome não iniciou (%s); nova tentativa em %.0fs.", e, espera)
+            time.sleep(espera)
+
+
+def reiniciar_driver(motivo: str):
+    """
+    Fecha e reabre o Chrome (com backoff) e restaura a sessão pelos cookies. Se não
+    der, levanta SessaoMorta: o fluxo marca a linha como falha e segue, em vez de
+    derrubar a execução. Login manual só quando há alguém no terminal.
+    """
+    log.warning("♻️ Reiniciando navegador (%s)...", motivo)
+    encerrar_driver()
+    _iniciar_com_backoff()
+    if _restaurar_sessao():
+        log.info("✅ Sessão restaurada, retomando automação.")
+    elif desatendido():
+        raise SessaoMorta("sessão não restaurada pelos cookies e execução desatendida (sem login manual)")
+    else:
+        aguardar_login()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Leitura da planilha, coluna STATUS e devolução do resultado (Excel + linhas amarelas).
+
+openpyxl só é importado na hora de gravar; python-calamine, se instalado, acelera a leitura.
+"""
+
+import importlib.util
+import logging
+import os
+
+import pandas as pd
+
+from . import config
+
+log = logging.getLogger(__name__)
+
+
+# python-calamine é opcional: lê o xlsx ~10x mais rápido que o openpyxl
+_ENGINE_LEITURA = "calamine" if importlib.util.find_spec("python_calamine") else None
+
+
+def colorir_linhas_amarelo(ws, linhas_idx, header_rows=1):
+    """Pinta as linhas (índices do DataFrame) numa worksheet openpyxl já aberta."""
+    from openpyxl.styles import PatternFill
+
+    fill = PatternFill(start_color=config.YELLOW_HEX, end_color=config.YELLOW_HEX, fill_type="solid")
+    for idx in linhas_idx:
+        excel_row = idx + 1 + header_rows
+        for col in range(1, ws.max_column + 1):
+            ws.cell(row=excel_row, column=col).fill = fill
+    log.info("🎨 Linhas coloridas de amarelo: %s", [i+1 for i in sorted(linhas_idx)])
+
+
+class Planilha:
+    """DataFrame da planilha + STATUS por linha + linhas a pintar de amarelo."""
+
+    def __init__(self, caminho, pasta_pdfs=None):
+        self.caminho = caminho
+        self.nome = os.path.basename(caminho)
+        self.pasta_pdfs = pasta_pdfs or os.getcwd()  # onde estão os ATOrd_<processo>.pdf
+        # Lemos sem forçar dtype para que datas em número (serial Excel) sejam detectáveis;
+        # a normalização cuida de todos os formatos.
+        self.df = pd.read_excel(caminho, engine=_ENGINE_LEITURA)
+        if "STATUS" not in self.df.columns:
+            self.df["STATUS"] = ""
+        # Garante dtype texto p/ evitar FutureWarning ao atribuir strings
+        self.df["STATUS"] = self.df["STATUS"].astype("object")
+        self.rows_to_color_yellow = set()
+
+    def caminho_pdf(self, processo):
+        return os.path.join(self.pasta_pdfs, f"ATOrd_{processo}.pdf")
+
+    def set_status(self, idx, text):
+        try:
+            self.df.at[idx, "STATUS"] = str(text)
+        except Exception:
+            self.df.loc[idx, "STATUS"] = str(text)
+
+    def status(self, idx):
+        return str(self.df.at[idx, "STATUS"])
+
+    def marcar_erro(self, idx, etapa, err):
+        msg = f"ERRO {etapa}: {err}"
+        log.error("❌ %s", msg, extra={"linha": idx + 1})
+        self.set_status(idx, f"⚠️ {msg}")
+        self.rows_to_color_yellow.add(idx)
+
+    def salvar(self, abrir_se_erro=None):
+        """Grava o STATUS, pinta as linhas com erro e (opcional) abre a planilha."""
+        if abrir_se_erro is None:
+            abrir_se_erro = config.ABRIR_EXCEL_COM_ERRO
+        # STATUS + linhas amarelas numa única gravação (reabrir o xlsx p/ pintar dobrava o tempo)
+        with pd.ExcelWriter(self.caminho, engine="openpyxl") as writer:
+            self.df.to_excel(writer, index=False)
+            if self.rows_to_color_yellow:
+                try:
+                    ws = next(iter(writer.sheets.values()))
+                    colorir_linhas_amarelo(ws, self.rows_to_color_yellow, header_rows=1)
+                except Exception as e:
+                    log.warning("⚠️ Falha ao colorir linhas no Excel: %s", e)
+        log.info("📁 Excel atualizado com STATUS: %s", self.nome)
+
+        # abrir planilha automaticamente se houver erro
+        if self.rows_to_color_yellow and abrir_se_erro:
+            try:
+                log.warning("⚠️ Erros encontrados. Abrindo planilha para revisão...")
+                os.startfile(self.caminho)  # Windows
+            except Exception as e:
+                log.info("ℹ️ Não foi possível abrir a planilha automaticamente: %s", e)
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+Progresso da execução: barra redesenhada no lugar (stderr, só em terminal) a
+cada linha e um endpoint HTTP local (JSON) com linhas feitas/com erro/restantes,
+linhas por hora, latência média móvel por linha e ETA.
+
+A barra fica fora do logger: não vira uma linha de log por processo nem some no
+--quieto. O console do log (ConsoleComBarra) apaga a barra, escreve a mensagem e
+a redesenha embaixo.
+
+    curl http://127.0.0.1:8770/status
+
+Porta 0 desliga o endpoint; se a porta já estiver em uso (outra instância), a
+execução segue só com a barra.
+"""
+
+import json
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from . import config
+
+log = logging.getLogger(__name__)
+
+JANELA_LATENCIA = 20  # linhas na média móvel
+LARGURA_BARRA = 20
+
+
+def _hms(segundos):
+    if segundos is None:
+        return "--:--:--"
+    s = int(segundos)
+    return f"{s // 3600:02d}:{s % 3600 // 60:02d}:{s % 60:02d}"
+
+
+class Progresso:
+    """Contadores da execução; lidos pela thread do endpoint, por isso sob lock."""
+
+    def __init__(self, janela=JANELA_LATENCIA):
+        self.lock = threading.Lock()
+        self.inicio = time.time()
+        self.total = 0
+        self.feitas = 0
+        self.com_erro = 0
+        self.reenfileiradas = 0
+        self.duracoes = deque(maxlen=janela)
+
+    def adicionar(self, n):
+        with self.lock:
+            self.total += n
+
+    def reenfileirar(self):
+        with self.lock:
+            self.reenfileiradas += 1
+
+    def concluir(self, duracao_s, erro=False):
+        with self.lock:
+            self.feitas += 1
+            self.com_erro += bool(erro)
+            self.duracoes.append(duracao_s)
+
+    def resumo(self):
+        with self.lock:
+            decorrido = time.time() - self.inicio
+            restantes = max(self.total - self.feitas, 0)
+            media = sum(self.duracoes) / len(self.duracoes) if self.duracoes else None
+            por_hora = self.feitas * 3600 / decorrido if self.feitas and decorrido > 0 else None
+            # ritmo real (inclui esperas, reenfileiramentos, reinícios); antes da 1ª linha, nada a estimar
+            eta = restantes * 3600 / por_hora if por_hora else None
+            return {
+                "versao": config.VERSAO,
+                "total": self.total,
+                "feitas": self.feitas,
+                "ok": self.feitas - self.com_erro,
+                "com_erro": self.com_erro,
+                "restantes": restantes,
+                "reenfileiradas": self.reenfileiradas,
+                "linhas_por_hora": round(por_hora, 1) if por_hora else None,
+                "latencia_media_s": round(media, 2) if media is not None else None,
+                "decorrido_s": round(decorrido, 1),
+                "eta_s": round(eta) if eta is not None else None,
+                "previsao_fim": time.strftime("%H:%M:%S", time.localtime(time.time() + eta)) if eta is not None else None,
+            }
+
+    def barra(self):
+        r = self.resumo()
+        frac = r["feitas"] / r["total"] if r["total"] else 0
+        cheio = int(frac * LARGURA_BARRA)
+        por_hora = f"{r['linhas_por_hora']:.0f}" if r["linhas_por_hora"] else "-"
+        media = f"{r['latencia_media_s']:.1f}s" if r["latencia_media_s"] is not None else "-"
+        return (f"📊 [{'█' * cheio}{'░' * (LARGURA_BARRA - cheio)}] {r['feitas']}/{r['total']} ({frac:.0%})"
+                f" | ❌ {r['com_erro']} | {por_hora} linhas/h | média {media} | ETA {_hms(r['eta_s'])}")
+
+
+# =====================
+# BARRA NO TERMINAL
+# =====================
+_tela = threading.Lock()  # barra (thread principal) x console do log (thread do QueueListener)
+_barra_na_tela = ""
+
+
+def _terminal():
+    return sys.stderr is not None and sys.stderr.isatty()
+
+
+def _apagar():
+    # sem ANSI: o console do Windows nem sempre interpreta \x1b[K
+    sys.stderr.write("\r" + " " * (len(_barra_na_tela) + 2) + "\r")
+
+
+def desenhar():
+    """Redesenha a barra na mesma linha do stderr; fora de terminal, só vai para o arquivo de log (DEBUG)."""
+    global _barra_na_tela
+    barra = contadores.barra()
+    log.debug(barra)
+    if not _terminal():
+        return
+    with _tela:
+        if _barra_na_tela:
+            _apagar()
+        _barra_na_tela = barra
+        sys.stderr.write(barra)
+        sys.stderr.flush()
+
+
+class ConsoleComBarra(logging.StreamHandler):
+    """StreamHandler do console que mantém a barra como última linha do terminal."""
+
+    def emit(self, record):
+        with _tela:
+            if not _barra_na_tela:
+                super().emit(record)
+                return
+            _apagar()
+            sys.stderr.flush()
+            super().emit(record)
+            sys.stderr.write(_barra_na_tela)
+            sys.stderr.flush()
+
+
+# =====================
+# ENDPOINT HTTP (JSON)
+# =====================
+class _HandlerStatus(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/status"):
+            self.send_response(404)
+            self.end_headers()
+            return
+        corpo = json.dumps(contadores.resumo(), ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+
+contadores = Progresso()
+_servidor = None
+
+
+def iniciar(porta=None):
+    """Zera os contadores e sobe o endpoint em 127.0.0.1:porta (thread daemon)."""
+    global contadores, _servidor
+    contadores = Progresso()
+    porta = config.PROGRESSO_PORTA if porta is None else porta
+    if not porta or _servidor is not None:
+        return contadores
+    try:
+        _servidor = ThreadingHTTPServer(("127.0.0.1", porta), _HandlerStatus)
+    except OSError as e:
+        log.warning("⚠️ Endpoint de progresso indisponível na porta %d: %s", porta, e)
+        return contadores
+    _servidor.daemon_threads = True
+    threading.Thread(target=_servidor.serve_forever, name="progresso", daemon=True).start()
+    log.info("📡 Progresso em http://127.0.0.1:%d/status", porta)
+    return contadores
+
+
+def encerrar():
+    global _servidor, _barra_na_tela
+    with _tela:
+        if _barra_na_tela:
+            sys.stderr.write("\n")  # a última barra fica na tela
+            sys.stderr.flush()
+            _barra_na_tela = ""
+    if _servidor is not None:
+        _servidor.shutdown()
+        _servidor.server_close()
+        _servidor = None
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Log estruturado da automação.
+
+Cada módulo usa `logging.getLogger(__name__)`; aqui o logger "automacao" ganha um
+QueueHandler (o loop só enfileira o registro) e uma thread QueueListener que
+escreve JSON lines num arquivo com rotação (em buffer, descarregado a cada lote
+ou em ERROR) e a mensagem curta no console. Contexto de linha/etapa/processo é
+anexado a todo registro via `contexto(...)`.
+
+Console: INFO por padrão (linhas, avisos, erros); detalhe por campo/tentativa
+fica em DEBUG, só no arquivo. Modo quieto: console só com WARNING+.
+"""
+
+import atexit
+import contextlib
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import time
+
+from .progresso import ConsoleComBarra
+
+LOGGER_RAIZ = "automacao"
+_contexto = contextvars.ContextVar("contexto_log", default={})
+_ATRIBUTOS_PADRAO = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "ctx"}
+_listener = None
+
+
+@contextlib.contextmanager
+def contexto(**campos):
+    """Anexa campos (linha, processo, etapa...) aos registros emitidos dentro do bloco."""
+    token = _contexto.set({**_contexto.get(), **campos})
+    try:
+        yield
+    finally:
+        _contexto.reset(token)
+
+
+class _FiltroContexto(logging.Filter):
+    def filter(self, record):
+        record.ctx = _contexto.get()
+        return True
+
+
+class _QueueHandlerEstruturado(logging.handlers.QueueHandler):
+    """Como o QueueHandler, mas mantém a exceção em exc_text em vez de colá-la na mensagem."""
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg, record.args, record.exc_info = record.message, None, None
+        return record
+
+
+class FormatterJSON(logging.Formatter):
+    def format(self, record):
+        evento = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)) + f".{int(record.msecs):03d}",
+            "nivel": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        evento.update(getattr(record, "ctx", {}))
+        for chave, valor in vars(record).items():
+            if chave not in _ATRIBUTOS_PADRAO:
+                evento[chave] = valor
+        if record.exc_text:
+            evento["exc"] = record.exc_text
+        return json.dumps(evento, ensure_ascii=False, default=str)
+
+
+def configurar_log(caminho, quieto=False, max_mb=10, backups=5):
+    """Liga o log assíncrono (arquivo JSON com rotação + console). Idempotente."""
+    global _listener
+    if _listener is not None:
+        return
+    console = ConsoleComBarra(sys.stdout)  # apaga/redesenha a barra de progresso em volta de cada mensagem
+    console.setLevel(logging.WARNING if quieto else logging.INFO)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    handlers = [console]
+    if caminho:
+        arquivo = logging.handlers.RotatingFileHandler(
+            caminho, maxBytes=int(max_mb * 1024 * 1024), backupCount=backups, encoding="utf-8", delay=True
+        )
+        arquivo.setFormatter(FormatterJSON())
+        handlers.append(logging.handlers.MemoryHandler(capacity=200, flushLevel=logging.ERROR, target=arquivo))
+
+    fila = queue.SimpleQueue()
+    handler = _QueueHandlerEstruturado(fila)
+    handler.addFilter(_FiltroContexto())
+
+    logger = logging.getLogger(LOGGER_RAIZ)
+    logger.setLevel(logging.DEBUG if caminho else console.level)
+    logger.addHandler(handler)
+    logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(fila, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(encerrar_log)
+
+
+def encerrar_log():
+    """Esvazia a fila e o buffer (chamado no fim da execução e no atexit)."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for h in _listener.handlers:
+        alvo = getattr(h, "target", None)
+        h.close()  # MemoryHandler.close descarrega o buffer no alvo (e o esquece)
+        if alvo is not None:
+            alvo.close()
+    _listener = None
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+Política de retry das etapas: classificação do erro, backoff exponencial com
+jitter, orçamento de tempo por etapa e circuit breaker quando o eLaw está lento.
+"""
+
+import logging
+import random
+import time
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    InvalidSessionIdException,
+    NoSuchElementException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+
+from . import config, medicao, navegador, registro
+
+log = logging.getLogger(__name__)
+
+ERRO_STALE = "stale"                # elemento recriado pelo AJAX -> refazer logo
+ERRO_INTERCEPTADO = "interceptado"  # overlay/blockUI por cima -> esperar um pouco
+ERRO_TIMEOUT = "timeout"            # servidor lento -> backoff maior + circuit breaker
+ERRO_VALIDACAO = "validacao"        # growl/mensagem de erro do eLaw -> não adianta repetir
+ERRO_NAO_ENCONTRADO = "nao_encontrado"  # elemento inexistente -> não adianta repetir
+ERRO_SESSAO = "sessao"              # Chrome/chromedriver caiu -> supervisor reinicia
+ERRO_DESCONHECIDO = "desconhecido"
+
+# falhas que costumam passar sozinhas: a linha volta para o fim da fila em vez de virar erro
+CLASSES_TRANSITORIAS = {ERRO_STALE, ERRO_INTERCEPTADO, ERRO_TIMEOUT}
+
+# classe -> (máx. tentativas, espera base em s). Espera real = base * 2^(n-1) * jitter.
+POLITICA_RETRY = {
+    ERRO_STALE:          (3, 0.2),
+    ERRO_INTERCEPTADO:   (3, 0.4),
+    ERRO_TIMEOUT:        (2, 1.5),
+    ERRO_VALIDACAO:      (1, 0.0),
+    ERRO_NAO_ENCONTRADO: (1, 0.0),
+    ERRO_SESSAO:         (1, 0.0),
+    ERRO_DESCONHECIDO:   (2, 1.2),
+}
+BACKOFF_MAX = 8.0
+ORCAMENTO_ETAPA_PADRAO = 90  # segundos somando todas as tentativas de uma etapa
+
+_JS_MENSAGEM_VALIDACAO = (
+    "var ms = document.querySelectorAll('.ui-messages-error, .ui-message-error, .ui-growl-message-error');"
+    "for (var i = 0; i < ms.length; i++) { if (ms[i].offsetWidth > 0) return (ms[i].innerText || '').trim() || 'erro'; }"
+    "return '';"
+)
+
+# timeout de WebDriverWait quase sempre é elemento ausente/não clicável; só conta para o circuito se o
+# eLaw estiver de fato lento: página ainda carregando, AJAX do PrimeFaces pendente ou XHR recente acima do alvo
+_JS_SERVIDOR_LENTO = """
+var pendente = document.readyState !== 'complete';
+try { pendente = pendente || !PrimeFaces.ajax.Queue.isEmpty(); } catch (e) {}
+var pior = 0, rs = performance.getEntriesByType('resource');
+for (var i = Math.max(0, rs.length - 20); i < rs.length; i++) {
+    var r = rs[i];
+    if ((r.initiatorType === 'xmlhttprequest' || r.initiatorType === 'fetch') && r.responseStart > 0) {
+        pior = Math.max(pior, r.responseStart - r.requestStart);
+    }
+}
+return pendente || pior > arguments[0];
+"""
+
+
+def servidor_lento() -> bool:
+    """Sinal de resposta do servidor para o circuit breaker (um comando, só quando uma tentativa estoura o tempo)."""
+    try:
+        return bool(navegador.driver.execute_script(_JS_SERVIDOR_LENTO, config.GOV_LATENCIA_ALVO_MS))
+    except Exception:
+        return False
+
+
+def classificar_erro(exc) -> str:
+    """Mapeia a exceção de uma tentativa para uma das classes de POLITICA_RETRY."""
+    if isinstance(exc, (InvalidSessionIdException, NoSuchWindowException)):
+        return ERRO_SESSAO
+    if isinstance(exc, StaleElementReferenceException):
+        return ERRO_STALE
+    if isinstance(exc, (ElementClickInterceptedException, ElementNotInteractableException)):
+        return ERRO_INTERCEPTADO
+    if isinstance(exc, NoSuchElementException):
+        return ERRO_NAO_ENCONTRADO
+    if isinstance(exc, TimeoutException):
+        return ERRO_TIMEOUT
+    if isinstance(exc, WebDriverException) and not navegador.sessao_viva():
+        return ERRO_SESSAO
+    try:
+        if navegador.driver.execute_script(_JS_MENSAGEM_VALIDACAO):
+            return ERRO_VALIDACAO
+    except Exception:
+        pass
+    return ERRO_DESCONHECIDO
+
+
+class CircuitBreaker:
+    """
+    Abre quando o eLaw acumula timeouts seguidos (servidor lento) e pausa o
+    processamento antes da próxima tentativa, em vez de queimar retries inúteis.
+    Cada reabertura dobra a pausa (até pausa_max); um sucesso fecha o circuito.
+    """
+
+    def __init__(self, limite_timeouts=3, pausa=30.0, pausa_max=300.0):
+        self.limite_timeouts = limite_timeouts
+        self.pausa_base = pausa
+        self.pausa_max = pausa_max
+        self.pausa = pausa
+        self.timeouts_seguidos = 0
+        self.aberto_ate = 0.0
+
+    def antes(self):
+        restante = self.aberto_ate - time.time()
+        if restante > 0:
+            log.warning("🛑 Circuito aberto (eLaw lento). Pausando %.0fs...", restante)
+            time.sleep(restante)
+
+    def registrar_sucesso(self):
+        self.timeouts_seguidos = 0
+        self.pausa = self.pausa_base
+
+    def registrar_falha(self, classe, lento=True):
+        """Só timeouts com o servidor lento abrem o circuito (não elemento ausente num processo diferente)."""
+        if classe != ERRO_TIMEOUT or not lento:
+            return
+        self.timeouts_seguidos += 1
+        if self.timeouts_seguidos >= self.limite_timeouts:
+            self.aberto_ate = time.time() + self.pausa
+            log.warning("🛑 %d timeouts seguidos: abrindo circuito por %.0fs.", self.timeouts_seguidos, self.pausa)
+            self.pausa = min(self.pausa * 2, self.pausa_max)
+            self.timeouts_seguidos = 0
+
+
+circuito_elaw = CircuitBreaker()
+ultima_falha = None  # classe do erro que esgotou a última etapa (None se ela passou)
+
+
+class FalhaTransitoria(Exception):
+    """A linha falhou por um erro transitório e deve ser reenfileirada."""
+
+    def __init__(self, classe, msg):
+        super().__init__(msg)
+        self.classe = classe
+
+
+class FalhaEtapa(Exception):
+    """Etapa obrigatória esgotou as tentativas; leva a classe do erro que a derrubou."""
+
+    def __init__(self, msg, classe=None):
+        super().__init__(msg)
+        self.classe = classe or ultima_falha or ERRO_DESCONHECIDO
+
+
+def tentar_etapa(action_desc, func, *args, orcamento=ORCAMENTO_ETAPA_PADRAO, chave=None, **kwargs):
+    """
+    Executa func com retry conforme a classe do erro (POLITICA_RETRY), backoff
+    exponencial com jitter e orçamento de tempo por etapa. Retorna o resultado
+    (True se None) ou False se esgotar tentativas/orçamento.
+
+    'chave' agrupa a etapa nas métricas quando action_desc contém valores da linha.
+    """
+    global ultima_falha
+    ultima_falha = None  # falha de uma etapa anterior tolerada não vale para esta
+    chave = chave or action_desc
+    with registro.contexto(etapa=chave):
+        t0 = time.time()
+        tent = 0
+        while True:
+            tent += 1
+            circuito_elaw.antes()
+            try:
+                r = func(*args, **kwargs)
+                circuito_elaw.registrar_sucesso()
+                log.debug("✅ %s (tentativa %d)", action_desc, tent, extra={"tentativa": tent})
+                medicao.registrar_etapa(chave, t0, True, tent)
+                return True if r is None else r
+            except Exception as e:
+                classe = classificar_erro(e)
+                circuito_elaw.registrar_falha(classe, lento=classe == ERRO_TIMEOUT and servidor_lento())
+                log.info("⚠️ Falha em '%s' (tentativa %d, %s): %s", action_desc, tent, classe, e,
+                         extra={"tentativa": tent, "classe": classe})
+                max_tent, base = POLITICA_RETRY[classe]
+                if tent >= max_tent:
+                    medicao.registrar_etapa(chave, t0, False, tent)
+                    ultima_falha = classe
+                    return False
+                espera = min(base * (2 ** (tent - 1)), BACKOFF_MAX) * random.uniform(0.5, 1.5)
+                if time.time() - t0 + espera > orcamento:
+                    log.warning("⏱️ Orçamento de %ss esgotado em '%s'.", orcamento, action_desc)
+                    medicao.registrar_etapa(chave, t0, False, tent)
+                    ultima_falha = classe
+                    return False
+                time.sleep(espera)
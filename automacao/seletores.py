@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+Registro de seletores do eLaw: cada campo lógico ("rito", "gestor"...) tem o id
+conhecido, um sufixo estável do id e o rótulo visível na tela.
+
+Os ids são resolvidos numa única chamada JS (todos os campos ainda sem id de uma
+vez, na primeira espera que não acha o campo no cache) e ficam em cache na
+sessão do Chrome; nas linhas seguintes a busca é só o By.ID. Se o eLaw
+regenerar os prefixos j_id_* e o id em cache sumir, o cache é esquecido, o
+campo é resolvido de novo (sufixo, depois rótulo) e a etapa segue com o id novo.
+"""
+
+import logging
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from . import navegador
+from .config import WAIT_LONG, WAIT_SHORT
+
+log = logging.getLogger(__name__)
+
+# nome lógico -> (id conhecido, sufixo estável do id, rótulo na tela)
+REGISTRO = {
+    "busca_processo": ("j_id_2g:globaSearchAutocomplete_input", ":globaSearchAutocomplete_input", None),
+    "rito": ("j_id_4c_1:j_id_4c_5_2_2_1_9_t_1:comboRito_label", ":comboRito_label", "Rito"),
+    "estado": ("j_id_4c_1:j_id_4c_5_2_2_1_9_t_1:comboEstadoVara_label", ":comboEstadoVara_label", "Estado"),
+    "comarca": ("j_id_4c_1:j_id_4c_5_2_2_1_9_t_1:comboComarcaVara_label", ":comboComarcaVara_label", "Comarca"),
+    "foro": ("j_id_4c_1:j_id_4c_5_2_2_1_9_t_1:comboForoTribunal_label", ":comboForoTribunal_label", "Foro/Tribunal"),
+    "vara": ("j_id_4c_1:j_id_4c_5_2_2_1_9_t_1:comboVara_label", ":comboVara_label", "Vara"),
+    "classificacao": ("j_id_4c_1:j_id_4c_5_2_2_2_9_15_1:processoClassificacaoCombo_label",
+                      ":processoClassificacaoCombo_label", "Classificação Interna"),
+    "instancia": ("j_id_4c_1:j_id_4c_5_2_2_3_9_19_1_label", None, "Instância"),
+    "fase": ("j_id_4c_1:processoFaseCombo_label", ":processoFaseCombo_label", "Fase"),
+    "empresa": ("j_id_4c_1:comboClientProcessoParte_label", ":comboClientProcessoParte_label", "Empresa"),
+    "papel": ("j_id_4c_1:j_id_4c_5_2_2_9_9_2_6_label", None, "Papel"),
+    "tipo_documento": ("j_id_4c_1:j_id_4c_5_2_2_r_9_24_1:eFileTipoCombo_label", ":eFileTipoCombo_label",
+                       "Tipo de Documento"),
+    "parte_documento": ("j_id_4c_1:j_id_4c_5_2_2_b_9_8_1:j_id_4c_5_2_2_b_9_8_5_2_n_label", None,
+                        "Parte do Documento"),
+    "tipo_acao": ("j_id_4c_1:comboProcessoTipo_label", ":comboProcessoTipo_label", "Tipo de Ação"),
+    "adv_contrario": ("j_id_4c_1:j_id_4c_5_2_2_f_9_2v_1:autocompleteAdvogadoParteContrariaNome_input",
+                      ":autocompleteAdvogadoParteContrariaNome_input", "Advogado da Parte Contrária"),
+    "data_distribuicao": ("j_id_4c_1:dataDistribuicao_input", ":dataDistribuicao_input", "Data de Distribuição"),
+    "data_citacao": ("j_id_4c_1:dataRecebimento_input", ":dataRecebimento_input", "Data de Citação"),
+    "valor_causa": ("j_id_4c_1:amountCase_input", ":amountCase_input", "Valor da Causa"),
+    "adv_responsavel": ("j_id_4c_1:autoCompleteLawyer_input", ":autoCompleteLawyer_input", "Advogado Responsável"),
+    "adv_responsavel_combo": ("j_id_4c_1:comboAdvogadoResponsavelProcesso_label",
+                              ":comboAdvogadoResponsavelProcesso_label", None),
+    "gestor": ("j_id_4c_1:j_id_4c_5_2_2_l_9_45_2:j_id_4c_5_2_2_l_9_45_3_1_2_2_1_1:j_id_4c_5_2_2_l_9_45_3_1_2_2_1_2g_input",
+               None, "Gestor Jurídico"),
+    "outra_parte": (None, ":autocompleteOutraParte_input", None),
+    "outra_parte_papel": (None, ":processoParteSelect_label", None),
+    "outra_parte_adicionar": (None, ":outrasParteAddButtom", None),
+    "juiz_novo": ("j_id_4c_1:juizBtnNovo", ":juizBtnNovo", None),
+    "parte_contraria_novo": ("j_id_4c_1:j_id_4c_5_2_2_b_9_8_1:parteContrariaMainGridBtnNovo",
+                             ":parteContrariaMainGridBtnNovo", None),
+}
+
+# args[0] = [[nome, id conhecido, sufixo, rótulo, css do widget]]; devolve {nome: id ou null}
+_JS_RESOLVER = """
+function norm(t) { return (t || '').normalize('NFD').replace(/[\\u0300-\\u036f]/g, '').replace(/[:*\\s]+$/, '').trim().toLowerCase(); }
+var rotulos = null;
+function porRotulo(rotulo, css) {
+    if (rotulos === null) {
+        rotulos = [];
+        var els = document.querySelectorAll('label, span, legend, th, td');
+        for (var i = 0; i < els.length; i++) {
+            if (!els[i].childElementCount) rotulos.push([norm(els[i].textContent), els[i]]);
+        }
+    }
+    var alvo = norm(rotulo);
+    for (var j = 0; j < rotulos.length; j++) {
+        if (rotulos[j][0] !== alvo) continue;
+        var p = rotulos[j][1];
+        for (var n = 0; n < 4 && p; n++) {
+            p = p.parentElement;
+            var w = p && p.querySelector(css);
+            if (w && w.id) return w.id;
+        }
+    }
+    return null;
+}
+var pedidos = arguments[0], ids = {};
+for (var k = 0; k < pedidos.length; k++) {
+    var nome = pedidos[k][0], conhecido = pedidos[k][1], sufixo = pedidos[k][2], rotulo = pedidos[k][3], css = pedidos[k][4];
+    var id = null;
+    if (conhecido && document.getElementById(conhecido)) id = conhecido;
+    if (!id && sufixo) {
+        var el = document.querySelector('[id$="' + sufixo + '"]');
+        if (el) id = el.id;
+    }
+    if (!id && rotulo) id = porRotulo(rotulo, css);
+    ids[nome] = id;
+}
+return ids;
+"""
+
+_ids = {}  # cache da sessão: nome lógico -> id resolvido
+
+
+def _css_widget(nome):
+    """Elemento procurado perto do rótulo: label do selectOneMenu, input ou botão."""
+    conhecido, sufixo, _ = REGISTRO[nome]
+    final = sufixo or conhecido or ""
+    if final.endswith("_label"):
+        return ".ui-selectonemenu-label"
+    if final.endswith("_input"):
+        return "input:not([type=hidden])"
+    return "button, a"
+
+
+def resolver(nomes=None):
+    """Resolve numa chamada JS os nomes pedidos (padrão: todos ainda sem id) e guarda no cache."""
+    nomes = [n for n in (nomes if nomes is not None else REGISTRO) if n in REGISTRO]
+    if not nomes:
+        return {}
+    pedidos = [[n, REGISTRO[n][0], REGISTRO[n][1], REGISTRO[n][2], _css_widget(n)] for n in nomes]
+    encontrados = navegador.driver.execute_script(_JS_RESOLVER, pedidos) or {}
+    for nome, elem_id in encontrados.items():
+        if elem_id:
+            _ids[nome] = elem_id
+    return encontrados
+
+
+def id_de(nome):
+    """Id atual do campo lógico (ids crus passam direto). Sem resolução, devolve o id conhecido."""
+    if nome not in REGISTRO:
+        return nome
+    if nome not in _ids:
+        resolver([n for n in REGISTRO if n not in _ids])
+    return _ids.get(nome) or REGISTRO[nome][0] or nome
+
+
+def curar(nome):
+    """Esquece o cache (os outros prefixos j_id_* também mudaram) e resolve só o campo pedido."""
+    antigo = _ids.get(nome)
+    _ids.clear()
+    resolver([nome])
+    novo = _ids.get(nome)
+    if novo and novo != antigo:
+        log.warning("🩹 Seletor '%s' mudou: %s -> %s", nome, antigo, novo)
+    return novo
+
+
+def limpar():
+    """Chrome novo (reinício/reciclagem): os ids do cache não valem mais."""
+    _ids.clear()
+
+
+def _localizador(nome):
+    """Id em cache; sem ele, o sufixo estável (o próprio Selenium repete a busca a cada consulta)."""
+    if nome in _ids:
+        return By.ID, _ids[nome]
+    conhecido, sufixo, _ = REGISTRO[nome]
+    if sufixo:
+        return By.CSS_SELECTOR, f'[id$="{sufixo}"]'
+    return By.ID, conhecido
+
+
+def esperar(nome, condicao=EC.presence_of_element_located, timeout=WAIT_LONG):
+    """
+    WebDriverWait pelo id do campo lógico. Sem id em cache, resolve de uma vez
+    todos os campos ainda sem id antes da espera; se o id em cache não aparecer em
+    WAIT_SHORT, cura o campo e espera o restante. Nenhuma consulta da espera roda
+    o resolvedor JS.
+    """
+    if nome not in REGISTRO:
+        return WebDriverWait(navegador.driver, timeout).until(condicao((By.ID, nome)))
+    restante = timeout
+    if nome in _ids:
+        curto = min(WAIT_SHORT, timeout)
+        try:
+            return WebDriverWait(navegador.driver, curto).until(condicao((By.ID, _ids[nome])))
+        except TimeoutException:
+            curar(nome)
+            restante = max(timeout - curto, 1)
+    else:
+        resolver([n for n in REGISTRO if n not in _ids])
+    achou_pelo_id = nome in _ids
+    elem = WebDriverWait(navegador.driver, restante).until(condicao(_localizador(nome)))
+    if not achou_pelo_id and hasattr(elem, "get_attribute"):
+        # ainda não estava na página quando foi resolvido: guarda o id de quem apareceu
+        elem_id = elem.get_attribute("id")
+        if elem_id:
+            _ids[nome] = elem_id
+    return elem
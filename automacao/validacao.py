@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Dry-run: valida a planilha inteira sem abrir o navegador.
+
+Passa pelas mesmas normalizações do fluxo (as_ddmmyyyy, to_amount_str, reclamadas),
+confere os PDFs ATOrd_<processo>.pdf e, se houver catálogo, os valores dos
+dropdowns. O resultado vai para um relatório à parte (<planilha>.dry-run.xlsx,
+linhas com erro em amarelo); a planilha e o STATUS dela não são tocados.
+
+Catálogo = JSON {coluna da planilha: [opções do eLaw]} (ex.: gerado com
+`python -m automacao.mock_elaw --exportar-catalogo catalogo.json`).
+"""
+
+import json
+import logging
+import os
+import time
+
+import pandas as pd
+
+from . import config
+from .config import (
+    COL_ADV_RESP, COL_CLASSIFICACAO, COL_CLIENTE_EMPRESA, COL_COMARCA,
+    COL_DATA_CITACAO, COL_DATA_DISTR, COL_ESTADO, COL_FASE, COL_FORO,
+    COL_INSTANCIA, COL_NUM_PROCESSO, COL_RITO, COL_TIPO_ACAO, COL_TIPO_DOC,
+    COL_VALOR_CAUSA, COL_VARA, COLUNAS_RECLAMADAS,
+)
+from .dados import ajusta_valor_para_estado, as_ddmmyyyy, normalizar_texto, safe_text, to_amount_str
+from .planilha import colorir_linhas_amarelo
+
+log = logging.getLogger(__name__)
+
+# colunas que viram selectOneMenu no fluxo (conferidas contra o catálogo)
+COLUNAS_CATALOGO = [
+    COL_RITO, COL_ESTADO, COL_COMARCA, COL_FORO, COL_VARA, COL_CLASSIFICACAO,
+    COL_INSTANCIA, COL_FASE, COL_CLIENTE_EMPRESA, COL_TIPO_DOC, COL_TIPO_ACAO,
+    COL_ADV_RESP,
+]
+CHAVE_RECLAMADAS = "Reclamadas"  # opções do autocomplete de outras partes
+_VAZIO = object()  # chave única para NaN/NaT/None (NaN != NaN nunca acertaria o cache)
+
+
+def _memoizado(func):
+    """Cache por valor: planilhas grandes repetem muito datas, Varas e empresas."""
+    cache = {}
+
+    def _f(valor):
+        try:
+            chave = _VAZIO if pd.api.types.is_scalar(valor) and pd.isna(valor) else (type(valor), valor)
+            return cache[chave]
+        except KeyError:
+            cache[chave] = resultado = func(valor)
+            return resultado
+        except TypeError:  # não-hashable
+            return func(valor)
+    return _f
+
+
+class Catalogo:
+    """Opções aceitas por coluna; casa por 'contém' normalizado, como o filtro do PrimeFaces."""
+
+    def __init__(self, opcoes_por_coluna):
+        self.opcoes = {
+            col: [normalizar_texto(o) for o in opcoes]
+            for col, opcoes in opcoes_por_coluna.items()
+        }
+        self._cache = {}
+
+    @classmethod
+    def carregar(cls, caminho):
+        with open(caminho, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def conhece(self, coluna):
+        return coluna in self.opcoes
+
+    def aceita(self, coluna, valor):
+        chave = (coluna, valor)
+        if chave not in self._cache:
+            if coluna == COL_ESTADO:
+                valor = ajusta_valor_para_estado("comboEstadoVara", valor)
+            termo = normalizar_texto(valor)
+            self._cache[chave] = any(termo in o for o in self.opcoes[coluna])
+        return self._cache[chave]
+
+
+def _valor_numerico(txt):
+    try:
+        float(txt)
+        return True
+    except ValueError:
+        return False
+
+
+def validar_planilha(planilha, catalogo=None):
+    """Valida cada linha sem alterar a planilha. Retorna (validadas, com_erro, linhas do relatório)."""
+    t0 = time.time()
+    try:
+        pdfs = set(os.listdir(planilha.pasta_pdfs))  # uma listagem só em vez de um stat por linha
+    except OSError:
+        pdfs = set()
+    data_ok = _memoizado(as_ddmmyyyy)
+    texto = _memoizado(safe_text)
+    valor_ok = _memoizado(to_amount_str)
+    colunas = [c for c in planilha.df.columns if c != "STATUS"]
+
+    validadas = com_erro = 0
+    relatorio = []
+    for idx, row in zip(planilha.df.index, planilha.df[colunas].to_dict("records")):
+        processo = texto(row.get(COL_NUM_PROCESSO, ""))
+        if not processo:
+            continue
+        validadas += 1
+        problemas = []
+
+        for col in (COL_DATA_DISTR, COL_DATA_CITACAO):
+            bruto = row.get(col, "")
+            if texto(bruto) and not data_ok(bruto):
+                problemas.append(f"{col} inválida ({texto(bruto)})")
+
+        bruto = row.get(COL_VALOR_CAUSA, "")
+        valor = valor_ok(bruto)
+        if valor and not _valor_numerico(valor):
+            problemas.append(f"{COL_VALOR_CAUSA} inválido ({texto(bruto)})")
+
+        if f"ATOrd_{processo}.pdf" not in pdfs:
+            problemas.append(f"PDF ATOrd_{processo}.pdf não encontrado")
+
+        if catalogo is not None:
+            for col in COLUNAS_CATALOGO:
+                val = texto(row.get(col, ""))
+                if val and catalogo.conhece(col) and not catalogo.aceita(col, val):
+                    problemas.append(f"{col} '{val}' fora do catálogo")
+            if catalogo.conhece(CHAVE_RECLAMADAS):
+                for col in COLUNAS_RECLAMADAS:
+                    nome = texto(row.get(col, ""))
+                    if nome and not catalogo.aceita(CHAVE_RECLAMADAS, nome):
+                        problemas.append(f"{col} '{nome}' fora do catálogo")
+
+        if problemas:
+            com_erro += 1
+            resultado = f"ERRO VALIDAÇÃO: {'; '.join(problemas)}"
+            log.error("❌ %s", resultado, extra={"linha": idx + 1})
+        else:
+            resultado = "OK"
+        relatorio.append({"LINHA": idx + 1, COL_NUM_PROCESSO: processo, "RESULTADO": resultado})
+
+    log.info("🧪 Dry-run %s: %d linhas validadas, %d com erro (%.2fs).", planilha.nome, validadas, com_erro, time.time() - t0)
+    return validadas, com_erro, relatorio
+
+
+def caminho_relatorio(planilha):
+    base, _ = os.path.splitext(planilha.caminho)
+    return f"{base}.dry-run.xlsx"
+
+
+def salvar_relatorio(planilha, relatorio, abrir_se_erro=None):
+    """Grava o relatório do dry-run ao lado da planilha (linhas com erro em amarelo)."""
+    if abrir_se_erro is None:
+        abrir_se_erro = config.ABRIR_EXCEL_COM_ERRO
+    caminho = caminho_relatorio(planilha)
+    df = pd.DataFrame(relatorio, columns=["LINHA", COL_NUM_PROCESSO, "RESULTADO"])
+    erros = [i for i, r in enumerate(relatorio) if r["RESULTADO"] != "OK"]
+    with pd.ExcelWriter(caminho, engine="openpyxl") as writer:
+        df.to_excel(writer, index=False)
+        if erros:
+            try:
+                colorir_linhas_amarelo(next(iter(writer.sheets.values())), erros, header_rows=1)
+            except Exception as e:
+                log.warning("⚠️ Falha ao colorir linhas no relatório: %s", e)
+    log.info("📁 Relatório do dry-run: %s", os.path.basename(caminho))
+
+    if erros and abrir_se_erro:
+        try:
+            os.startfile(caminho)  # Windows
+        except Exception as e:
+            log.info("ℹ️ Não foi possível abrir o relatório automaticamente: %s", e)
+    return caminho
+
+
+def executar_dry_run(planilhas, abrir_se_erro=None):
+    """Valida cada planilha e grava o relatório à parte; não importa selenium."""
+    catalogo = Catalogo.carregar(config.CATALOGO_PATH) if config.CATALOGO_PATH else None
+    if catalogo is None:
+        log.info("ℹ️ Dry-run sem catálogo: dropdowns e reclamadas não serão conferidos.")
+    for planilha in planilhas:
+        _, _, relatorio = validar_planilha(planilha, catalogo)
+        salvar_relatorio(planilha, relatorio, abrir_se_erro)
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+Conferência pós-salvar: um WebDriverWait comum (o eLaw troca de página depois de
+salvar, e um script assíncrono morre junto com a página) consulta, com um
+execute_script por vez, se já há mensagem de erro do PrimeFaces ou se a tela
+voltou ao modo visualização; a consulta que confirma já devolve as mensagens e
+os valores gravados. A comparação com o que o fluxo escolheu é feita aqui.
+"""
+
+import logging
+import re
+
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from . import navegador, seletores
+from .config import WAIT_MEDIUM
+from .dados import as_ddmmyyyy, normalizar_texto
+from .retry import tentar_etapa
+
+log = logging.getLogger(__name__)
+
+TIPO_SELECT = "select"  # label do selectOneMenu: esperado = item que o fluxo clicou
+TIPO_TEXTO = "texto"    # input/autocomplete
+TIPO_DATA = "data"
+TIPO_VALOR = "valor"
+TIPO_LISTA = "lista"    # datatable: todos os nomes esperados devem aparecer
+
+# arguments[0] = [[id ou seletor CSS, tipo, sufixo estável do id ou null]]; null = ainda salvando
+_PROBE_RESULTADO_SALVAR = """
+var campos = arguments[0];
+function visivel(el) {
+    if (!el) return false;
+    var st = window.getComputedStyle(el);
+    return st.display !== 'none' && st.visibility !== 'hidden' && el.offsetWidth > 0;
+}
+function texto(el) { return ((el.tagName === 'INPUT' ? el.value : el.innerText) || '').trim(); }
+var erros = [];
+var ms = document.querySelectorAll('.ui-messages-error, .ui-message-error, .ui-growl-message-error');
+for (var i = 0; i < ms.length; i++) { if (visivel(ms[i])) erros.push(texto(ms[i]) || 'erro'); }
+if (erros.length) return {erros: erros, campos: {}};
+// só o modo visualização prova a gravação: o growl de sucesso chega antes e o formulário de edição ainda mostra o digitado
+if (!visivel(document.getElementById('btnEditar')) || visivel(document.getElementById('btnSalvarOpen'))) return null;
+var lidos = {};
+for (var j = 0; j < campos.length; j++) {
+    var alvo = campos[j][0], sufixo = campos[j][2], el;
+    if (campos[j][1] === 'lista') {
+        el = document.querySelector(alvo);
+        lidos[alvo] = el ? Array.prototype.map.call(el.querySelectorAll('tbody td'), texto) : null;
+    } else {
+        el = document.getElementById(alvo) || (sufixo && document.querySelector('[id$="' + sufixo + '"]'));
+        lidos[alvo] = el ? texto(el) : null;
+    }
+}
+return {erros: erros, campos: lidos};
+"""
+
+
+class FalhaVerificacao(Exception):
+    """Salvamento recusado pelo eLaw ou gravado só em parte."""
+
+
+class Conferencia:
+    """Campos preenchidos na linha (rótulo, campo lógico/seletor, valor esperado, tipo) a conferir após salvar."""
+
+    def __init__(self):
+        self.campos = []
+
+    def adicionar(self, rotulo, alvo, esperado, tipo=TIPO_TEXTO):
+        if esperado:
+            self.campos.append((rotulo, alvo, esperado, tipo))
+
+
+def _numero(txt):
+    txt = re.sub(r"[^\d,.-]", "", str(txt))
+    if "," in txt:
+        txt = txt.replace(".", "").replace(",", ".")
+    try:
+        return float(txt)
+    except ValueError:
+        return None
+
+
+def _confere(tipo, esperado, lido):
+    if tipo == TIPO_DATA:
+        return lido.strip() == esperado or as_ddmmyyyy(lido) == esperado
+    if tipo == TIPO_VALOR:
+        a, b = _numero(esperado), _numero(lido)
+        return a is not None and b is not None and abs(a - b) < 0.005
+    if tipo == TIPO_LISTA:
+        textos = [normalizar_texto(t) for t in lido]
+        return all(any(normalizar_texto(n) in t for t in textos) for n in esperado)
+    e, l = normalizar_texto(esperado), normalizar_texto(lido)
+    if tipo == TIPO_SELECT:
+        return l == e  # o esperado já é o item clicado, não o texto da planilha
+    return l.startswith(e)
+
+
+def divergencias(conferencia, resultado):
+    """Compara o que o eLaw mostra com o esperado; devolve a lista de problemas (vazia = ok)."""
+    if not resultado:
+        return [f"sem confirmação do eLaw em {WAIT_MEDIUM}s após salvar"]
+    problemas = [f"eLaw: {m}" for m in resultado.get("erros") or []]
+    lidos = resultado.get("campos") or {}
+    for rotulo, alvo, esperado, tipo in conferencia.campos:
+        lido = lidos.get(alvo)
+        if lido is None:
+            log.debug("Campo %s (%s) não está na página após salvar; não conferido.", rotulo, alvo)
+            continue
+        if not _confere(tipo, esperado, lido):
+            problemas.append(f"{rotulo}: esperado '{esperado}', eLaw mostra '{lido}'")
+    return problemas
+
+
+def _aguardar_resultado(campos):
+    """Espera erro ou modo visualização; None se nenhum dos dois em WAIT_MEDIUM."""
+    try:
+        # JavascriptException: a consulta caiu no meio da troca de página; a próxima roda na página nova
+        return WebDriverWait(navegador.driver, WAIT_MEDIUM, poll_frequency=0.25,
+                             ignored_exceptions=(JavascriptException,)).until(
+            lambda d: d.execute_script(_PROBE_RESULTADO_SALVAR, campos))
+    except TimeoutException:
+        return None
+
+
+def verificar_salvamento(conferencia):
+    """Espera o eLaw confirmar o salvamento e confere os campos; levanta FalhaVerificacao se recusado/parcial."""
+    # alvo = nome lógico do registro de seletores (ou id/seletor CSS cru); a página usa o id resolvido e,
+    # se a tela de visualização regenerar os prefixos j_id_*, o sufixo estável
+    ids = {alvo: (alvo if tipo == TIPO_LISTA else seletores.id_de(alvo)) for _, alvo, _, tipo in conferencia.campos}
+    campos = [[ids[alvo], tipo, seletores.REGISTRO.get(alvo, (None, None))[1]] for _, alvo, _, tipo in conferencia.campos]
+    resultado = tentar_etapa("Conferir salvamento", _aguardar_resultado, campos)
+    if isinstance(resultado, dict) and resultado.get("campos") is not None:
+        lidos = resultado["campos"]
+        resultado["campos"] = {alvo: lidos.get(elem_id) for alvo, elem_id in ids.items()}
+    problemas = divergencias(conferencia, resultado if isinstance(resultado, dict) else None)
+    if problemas:
+        raise FalhaVerificacao("; ".join(problemas))
+    log.debug("✅ Salvamento conferido (%d campos).", len(conferencia.campos))
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import pandas as pd
+
+from automacao.config import COL_DATA_CITACAO, COL_DATA_DISTR, COL_NUM_PROCESSO
+from automacao.fila import FilaLinhas, ItemFila
+from automacao.planilha import Planilha
+
+
+def _item(idx, processo, citacao="", distribuicao=""):
+    return ItemFila(None, idx, {COL_DATA_CITACAO: citacao, COL_DATA_DISTR: distribuicao}, processo)
+
+
+def _ordem(fila):
+    return [fila.proximo().idx for _ in range(len(fila))]
+
+
+def test_citacao_mais_antiga_primeiro_e_sem_data_por_ultimo():
+    fila = FilaLinhas()
+    fila.adicionar(_item(0, "0000001-00.2020.5.01.0001"))
+    fila.adicionar(_item(1, "0000002-00.2020.5.01.0001", citacao="10/03/2024"))
+    fila.adicionar(_item(2, "0000003-00.2020.5.01.0001", citacao="01/02/2024"))
+    assert _ordem(fila) == [2, 1, 0]
+
+
+def test_desempate_pela_idade_do_processo():
+    fila = FilaLinhas()
+    fila.adicionar(_item(0, "0000001-00.2022.5.01.0001"))
+    fila.adicionar(_item(1, "0000002-00.2015.5.01.0001"))  # ano do CNJ
+    fila.adicionar(_item(2, "0000003-00.2022.5.01.0001", distribuicao="05/06/2010"))
+    assert _ordem(fila) == [2, 1, 0]
+
+
+def test_empate_mantem_ordem_da_planilha():
+    fila = FilaLinhas()
+    for idx in range(5):
+        fila.adicionar(_item(idx, "processo-sem-ano", citacao="01/01/2024"))
+    assert _ordem(fila) == [0, 1, 2, 3, 4]
+
+
+def test_reenfileirada_vai_para_o_fim_mesmo_com_prazo_mais_proximo():
+    fila = FilaLinhas()
+    fila.adicionar(_item(0, "0000001-00.2020.5.01.0001", citacao="01/01/2024"))
+    fila.adicionar(_item(1, "0000002-00.2020.5.01.0001", citacao="01/06/2024"))
+    fila.adicionar(_item(2, "0000003-00.2020.5.01.0001"))
+    primeiro = fila.proximo()
+    assert primeiro.idx == 0
+    fila.reenfileirar(primeiro)
+    assert primeiro.tentativas == 1
+    assert _ordem(fila) == [1, 2, 0]
+
+
+def test_pular_ok_deixa_de_fora_linhas_ja_gravadas():
+    planilha = Planilha.__new__(Planilha)
+    planilha.df = pd.DataFrame({
+        COL_NUM_PROCESSO: ["0000001-00.2020.5.01.0001", "0000002-00.2020.5.01.0001", ""],
+        "STATUS": ["OK", "⚠️ ERRO X: falhou", ""],
+    })
+    assert _ordem(FilaLinhas().adicionar_planilha(planilha)) == [0, 1]
+    assert _ordem(FilaLinhas().adicionar_planilha(planilha, pular_ok=True)) == [1]
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+from automacao import governador
+from automacao.governador import Governador
+
+
+class _Relogio:
+    """Substitui o módulo time do governador: sleep só avança o relógio."""
+
+    def __init__(self):
+        self.agora = 1_000_000.0
+        self.dormiu = []
+
+    def time(self):
+        return self.agora
+
+    def sleep(self, s):
+        self.dormiu.append(s)
+        self.agora += s
+
+
+@pytest.fixture
+def relogio(monkeypatch):
+    r = _Relogio()
+    monkeypatch.setattr(governador, "time", r)
+    return r
+
+
+def _gov(pasta, sessao, **kw):
+    params = dict(ops_por_s=2.0, rajada=3, max_sessoes=4, latencia_alvo_ms=1500, ajuste_s=30)
+    params.update(kw)
+    g = Governador(str(pasta), **params)
+    g.sessao = sessao  # várias "instâncias" no mesmo processo
+    return g
+
+
+def test_token_bucket_libera_a_rajada_e_depois_segue_o_ritmo(tmp_path, relogio):
+    g = _gov(tmp_path, "a")
+    for _ in range(3):
+        g.aguardar_token()
+    assert relogio.dormiu == []
+    g.aguardar_token()
+    assert relogio.dormiu == [pytest.approx(0.5)]  # 1 token a 2 op/s
+
+
+def test_token_bucket_e_dividido_entre_instancias(tmp_path, relogio):
+    a, b = _gov(tmp_path, "a"), _gov(tmp_path, "b")
+    a.aguardar_token()
+    a.aguardar_token()
+    b.aguardar_token()
+    assert relogio.dormiu == []
+    b.aguardar_token()
+    assert sum(relogio.dormiu) == pytest.approx(0.5)
+
+
+def _com_latencia(g, ms, relogio):
+    g.latencia_ms = ms
+    g.latencia_ts = relogio.agora
+
+
+def test_aimd_corta_pela_metade_acima_do_alvo_e_a_ultima_instancia_espera(tmp_path, relogio):
+    a = _gov(tmp_path, "a")
+    a._tenho_vaga()
+    relogio.agora += 1
+    b = _gov(tmp_path, "b")
+    assert b._tenho_vaga() == (True, 4, 2)
+
+    relogio.agora += 31
+    _com_latencia(a, 4000, relogio)
+    assert a._tenho_vaga() == (True, 2, 2)
+    relogio.agora += 31
+    _com_latencia(a, 4000, relogio)
+    assert a._tenho_vaga() == (True, 1, 2)
+    assert b._tenho_vaga() == (False, 1, 2)  # entrou por último
+
+
+def test_aimd_sobe_uma_sessao_por_ajuste_ate_o_maximo(tmp_path, relogio):
+    a = _gov(tmp_path, "a", max_sessoes=3)
+    with a._estado() as estado:
+        estado["limite"] = 1
+    for esperado in (2, 3, 3):
+        relogio.agora += 31
+        _com_latencia(a, 200, relogio)
+        assert a._tenho_vaga()[1] == esperado
+
+
+def test_aimd_ignora_latencia_velha(tmp_path, relogio):
+    a = _gov(tmp_path, "a")
+    _com_latencia(a, 4000, relogio)
+    relogio.agora += 120  # medição mais velha que 2 * ajuste_s
+    assert a._tenho_vaga()[1] == 4
+
+
+def test_sair_libera_a_vaga(tmp_path, relogio):
+    a, b = _gov(tmp_path, "a", max_sessoes=1), _gov(tmp_path, "b", max_sessoes=1)
+    a._tenho_vaga()
+    relogio.agora += 1
+    assert b._tenho_vaga()[0] is False
+    a.sair()
+    assert b._tenho_vaga()[0] is True
+
+
+def test_trava_orfa_nao_apaga_a_trava_nova_de_quem_quebrou_antes(tmp_path, relogio):
+    a, b = _gov(tmp_path, "a"), _gov(tmp_path, "b")
+    open(a._trava, "w").close()
+    velho = relogio.agora - governador.TRAVA_ORFA_S - 60
+    os.utime(a._trava, (velho, velho))
+    assert a._quebrar_trava_orfa()
+    os.close(os.open(a._trava, os.O_CREAT | os.O_EXCL | os.O_WRONLY))  # a cria a sua
+    os.utime(a._trava, (relogio.agora, relogio.agora))
+    assert not b._quebrar_trava_orfa()  # b também tinha visto a velha
+    assert os.path.exists(a._trava)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import itertools
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from automacao import config, historico
+from automacao.config import COL_ESTADO, COL_VARA
+
+
+class _Planilha:
+    nome = "p.xlsx"
+
+    def __init__(self, status):
+        self._status = status
+
+    def status(self, idx):
+        return self._status[idx]
+
+
+@pytest.fixture
+def banco(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "HISTORICO_PATH", str(tmp_path / "historico.sqlite3"))
+    yield config.HISTORICO_PATH
+    historico.encerrar()
+
+
+_pids = itertools.count(1)
+
+
+def _execucao(versao, linhas, monkeypatch):
+    """linhas = [(vara, ok, final, duração, [(etapa, duração, ok)])]"""
+    monkeypatch.setattr(config, "VERSAO", versao)
+    # id da execução = segundo atual + pid: cada execução do teste finge um processo
+    monkeypatch.setattr(historico, "os", SimpleNamespace(getpid=lambda p=next(_pids): p, path=os.path))
+    historico.iniciar()
+    planilha = _Planilha(["OK" if ok else "ERRO" for _, ok, _, _, _ in linhas])
+    for idx, (vara, ok, final, duracao, etapas) in enumerate(linhas):
+        historico.registrar_linha(
+            planilha, idx, {COL_VARA: vara, COL_ESTADO: "SP"}, f"proc-{idx}", ok=ok, duracao_s=duracao,
+            comandos=10, etapas=[{"etapa": e, "duracao_s": d, "ok": k, "tentativas": 1} for e, d, k in etapas],
+            final=final,
+        )
+    historico.encerrar()
+
+
+def test_etapas_mais_lentas_ordena_pela_media(banco, monkeypatch):
+    _execucao("1.0", [
+        ("1ª Vara", True, True, 5.0, [("Salvar", 3.0, True), ("Rito", 0.5, True)]),
+        ("1ª Vara", False, True, 9.0, [("Salvar", 5.0, False), ("Rito", 1.5, True)]),
+    ], monkeypatch)
+    conexao = historico.abrir(banco)
+    assert historico.etapas_mais_lentas(conexao) == [("Salvar", 2, 4.0, 5.0, 8.0, 1), ("Rito", 2, 1.0, 1.5, 2.0, 0)]
+
+
+def test_taxa_falha_por_vara_conta_so_tentativas_finais(banco, monkeypatch):
+    _execucao("1.0", [
+        ("1ª Vara", False, False, 1.0, []),  # reenfileirada: não conta
+        ("1ª Vara", True, True, 1.0, []),
+        ("2ª Vara", False, True, 1.0, []),
+        ("2ª Vara", True, True, 1.0, []),
+        ("", False, True, 1.0, []),
+    ], monkeypatch)
+    conexao = historico.abrir(banco)
+    assert historico.taxa_falha_por(conexao, "vara") == [
+        ("(vazio)", 1, 1, 100.0), ("2ª Vara", 2, 1, 50.0), ("1ª Vara", 1, 0, 0.0),
+    ]
+    with pytest.raises(ValueError):
+        historico.taxa_falha_por(conexao, "processo; DROP TABLE linhas")
+
+
+def test_vazao_por_versao(banco, monkeypatch):
+    _execucao("1.0", [("V", True, True, 2.0, []), ("V", False, True, 4.0, [])], monkeypatch)
+    _execucao("1.1", [("V", True, True, 1.0, [])], monkeypatch)
+    conexao = historico.abrir(banco)
+    versoes = {v[0]: v for v in historico.vazao_por_versao(conexao)}
+    assert set(versoes) == {"1.0", "1.1"}
+    _, execucoes, linhas, _, media_s, falha_pct = versoes["1.0"]
+    assert (execucoes, linhas, media_s, falha_pct) == (1, 2, 3.0, 50.0)
+    assert versoes["1.1"][2] == 1
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+from automacao.verificacao import (
+    TIPO_DATA, TIPO_LISTA, TIPO_SELECT, TIPO_TEXTO, TIPO_VALOR, Conferencia, _confere, divergencias,
+)
+
+
+def test_select_compara_com_o_label_clicado_sem_acento_nem_caixa():
+    assert _confere(TIPO_SELECT, "SP - São Paulo", "sp - sao paulo")
+    assert not _confere(TIPO_SELECT, "2ª Vara do Trabalho", "12ª Vara do Trabalho")
+    assert not _confere(TIPO_SELECT, "Vara", "Vara do Trabalho")
+
+
+def test_texto_aceita_prefixo():
+    assert _confere(TIPO_TEXTO, "Fulano", "Fulano de Tal")
+
+
+def test_data_em_outro_formato():
+    assert _confere(TIPO_DATA, "05/03/2024", "05/03/2024")
+    assert _confere(TIPO_DATA, "05/03/2024", "5/3/2024")
+    assert not _confere(TIPO_DATA, "05/03/2024", "06/03/2024")
+
+
+def test_valor_numerico_com_formato_brasileiro():
+    assert _confere(TIPO_VALOR, "1234.5", "R$ 1.234,50")
+    assert not _confere(TIPO_VALOR, "1234.5", "1.234,60")
+    assert not _confere(TIPO_VALOR, "1234.5", "")
+
+
+def test_lista_exige_todos_os_nomes():
+    tabela = ["EMPRESA A LTDA", "Réu", "Empresa B S/A", "Réu"]
+    assert _confere(TIPO_LISTA, ["Empresa A", "empresa b"], tabela)
+    assert not _confere(TIPO_LISTA, ["Empresa A", "Empresa C"], tabela)
+
+
+def _conferencia():
+    c = Conferencia()
+    c.adicionar("Vara", "vara", "1ª Vara do Trabalho", TIPO_SELECT)
+    c.adicionar("Valor da Causa", "valor_causa", "1000.00", TIPO_VALOR)
+    c.adicionar("Fase", "fase", "", TIPO_SELECT)  # vazio: não entra
+    return c
+
+
+def test_divergencias_sem_resultado():
+    assert divergencias(_conferencia(), None) == ["sem confirmação do eLaw em 20s após salvar"]
+
+
+def test_divergencias_erros_do_elaw_e_campos_diferentes():
+    problemas = divergencias(_conferencia(), {
+        "erros": ["Valor inválido."],
+        "campos": {"vara": "2ª Vara do Trabalho", "valor_causa": "1.000,00"},
+    })
+    assert problemas == [
+        "eLaw: Valor inválido.",
+        "Vara: esperado '1ª Vara do Trabalho', eLaw mostra '2ª Vara do Trabalho'",
+    ]
+
+
+def test_divergencias_campo_fora_da_pagina_nao_e_conferido():
+    assert divergencias(_conferencia(), {"erros": [], "campos": {"vara": "1ª Vara do Trabalho"}}) == []